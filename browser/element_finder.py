@@ -30,6 +30,10 @@ from config.settings import TIMEOUTS, SELECTORS
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Desplaza el elemento al centro y hace clic en una sola llamada a execute_script.
+# El JS se ejecuta de forma síncrona en la página, no hace falta esperar entre ambos pasos.
+SCROLL_AND_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
 def find_element(
     driver: WebDriver, 
     selectors: Union[str, List[str]], 
@@ -15,8 +15,6 @@ import base64
 import hashlib
 from io import BytesIO
 from datetime import datetime
-import tkinter as tk
-from tkinter import messagebox
 from typing import Optional, List, Dict, Union, Tuple
 
 # Importaciones de Selenium
@@ -39,7 +37,8 @@ from selenium.common.exceptions import (
 
 # Importaciones locales
 from utils.logger_config import logger
-from config.settings import CHROME_PROFILE_DIR, BROWSER_TIMEOUT, MAX_RETRY_ATTEMPTS
+from utils.lazy_import import lazy_import
+from config.settings import CHROME_PROFILE_DIR, BROWSER_TIMEOUT, MAX_RETRY_ATTEMPTS, SELECTORS
 from browser.element_finder import (
     find_table_rows, 
     detect_table_headers, 
@@ -51,12 +50,346 @@ from browser.element_finder import (
     click_element_safely,
     optimize_browser_performance,
     find_table_rows_optimized,
-    get_row_cells_optimized
+    get_row_cells_optimized,
+    SCROLL_AND_CLICK_JS
 )
 
+# El aviso de autenticación solo se muestra con interfaz; tkinter se carga en su primer uso
+messagebox = lazy_import("tkinter.messagebox")
+
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Lecturas de verify_fields_have_expected_values en una sola evaluación CDP: la comprobación
+# de campos y la de indicadores de la página se lanzan juntas con Promise.all.
+# Se sustituyen __ERP__ y __PROJECT__ por literales JSON antes de evaluar.
+_VERIFY_FIELDS_CDP_JS = """
+(function(erp, projectId) {
+    function visible(el) { return el.offsetParent !== null; }
+    function fieldHas(label, expected) {
+        var inputs = document.querySelectorAll('input[placeholder*="' + label + '"], input[aria-label*="' + label + '"]');
+        for (var i = 0; i < inputs.length; i++) {
+            if (visible(inputs[i]) && (inputs[i].value || '').indexOf(expected) !== -1) return true;
+        }
+        return false;
+    }
+    function checkFields() {
+        return Promise.resolve((fieldHas('Customer', erp) ? 1 : 0) + (fieldHas('Project', projectId) ? 1 : 0));
+    }
+    function checkIndicators() {
+        var found = 0;
+        var pageText = document.body ? document.body.innerText : '';
+        if (pageText.indexOf(erp) !== -1) found++;
+        if (pageText.indexOf(projectId) !== -1) found++;
+        var indicators = [
+            "//div[contains(text(), 'Issues by Status')]",
+            "//div[contains(text(), 'Actions by Status')]",
+            "//div[contains(@class, 'sapMITBHead')]"
+        ];
+        for (var i = 0; i < indicators.length; i++) {
+            var nodes = document.evaluate(indicators[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var shown = false;
+            for (var j = 0; j < nodes.snapshotLength; j++) {
+                if (visible(nodes.snapshotItem(j))) { shown = true; break; }
+            }
+            if (shown) { found++; break; }
+        }
+        var allText = document.documentElement.textContent || '';
+        if (allText.indexOf(erp) !== -1) found++;
+        if (allText.indexOf(projectId) !== -1) found++;
+        if (document.querySelectorAll('.sapMITB, .sapMPanel').length > 5) found++;
+        return Promise.resolve(found);
+    }
+    return Promise.all([checkFields(), checkIndicators()]).then(function(r) { return JSON.stringify(r); });
+})(__ERP__, __PROJECT__)
+"""
+
+def apply_status(status_var, message):
+    """
+    Establece el mensaje de estado solo si cambia
+    
+    Evita disparar las trazas y el redibujado de Tk al repetir el mismo texto.
+    Debe llamarse desde el hilo de Tk cuando hay interfaz.
+    
+    Args:
+        status_var: StringVar (o similar) de la barra de estado
+        message (str): Mensaje a mostrar
+    """
+    if status_var.get() != message:
+        status_var.set(message)
+
+
+# Recursos que no aportan nada a la extracción de la tabla (imágenes y fuentes web,
+# incluidos los iconos de Fiori). Las hojas de estilo no se bloquean: sin ellas
+# fallan las comprobaciones de visibilidad de Selenium.
+_BLOCKED_RESOURCE_URLS = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff*", "*.ttf")
+
+# Elementos de las listas de sugerencias de los campos Cliente/Proyecto, y los que
+# quedan marcados al recorrerlas con flecha abajo
+_SUGGESTION_ITEMS_CSS = "li.sapMSelectListItem, .sapMSuggestionPopup li, .sapMPopover li"
+_SELECTED_SUGGESTION_CSS = "li.sapMLIBSelected, li.sapMSelectListItemBaseSelected, li[aria-selected='true']"
+
+# Condición de espera: documento cargado y núcleo de UI5 disponible
+_PAGE_READY_JS = "return document.readyState === 'complete' && !!(window.sap && sap.ui && sap.ui.getCore);"
+
+# Comprobación y ajuste de los campos Cliente/Proyecto en una sola llamada a execute_script.
+# Lee los valores de los controles UI5 (sap.ui.getCore().byId) y, si el cliente no
+# coincide, lo establece y dispara el evento change. Argumentos: ERP y ID de proyecto.
+_UI5_FIELD_HELPERS_JS = """
+var core = sap.ui.getCore();
+function findControl(label) {
+    var inputs = document.querySelectorAll('input[placeholder*="' + label + '"], input[aria-label*="' + label + '"]');
+    for (var i = 0; i < inputs.length; i++) {
+        if (inputs[i].offsetParent === null) continue;
+        var control = core.byId(inputs[i].id.replace(/-inner$/, ''));
+        if (control && control.getValue) return control;
+    }
+    return null;
+}
+function hasValue(control, expected) {
+    return (control.getValue() || '').indexOf(expected) !== -1;
+}
+"""
+
+_ENSURE_FIELDS_UI5_JS = """
+var erp = arguments[0], projectId = arguments[1];
+if (!window.sap || !sap.ui || !sap.ui.getCore) {
+    return {ok: false, need_manual: true, project_ok: false};
+}
+""" + _UI5_FIELD_HELPERS_JS + """
+var customer = findControl('Customer');
+if (!customer) {
+    return {ok: false, need_manual: true, project_ok: false};
+}
+if (!hasValue(customer, erp)) {
+    customer.setValue(erp);
+    customer.fireChange({value: erp});
+}
+var project = findControl('Project');
+var clientOk = hasValue(customer, erp);
+return {
+    ok: clientOk,
+    need_manual: !clientOk,
+    project_ok: project ? hasValue(project, projectId) : false
+};
+"""
+
+# Selección del proyecto con reintentos dentro de la página (execute_async_script):
+# fija el valor en el control UI5, dispara liveChange/change y sondea cada 250 ms
+# hasta que el valor se mantiene dos comprobaciones seguidas sin estado de error
+# ni control ocupado, o hasta agotar el plazo. Argumentos: ID de proyecto y plazo en ms.
+_SELECT_PROJECT_UI5_JS = """
+var projectId = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+if (!window.sap || !sap.ui || !sap.ui.getCore) {
+    done({ok: false, reason: 'no_ui5'});
+    return;
+}
+""" + _UI5_FIELD_HELPERS_JS + """
+var project = findControl('Project');
+if (!project) {
+    done({ok: false, reason: 'no_control'});
+    return;
+}
+function commit() {
+    project.setValue(projectId);
+    if (project.fireLiveChange) project.fireLiveChange({value: projectId});
+    project.fireChange({value: projectId});
+}
+if (!hasValue(project, projectId)) commit();
+var start = Date.now(), stable = 0;
+var timer = setInterval(function () {
+    var state = project.getValueState ? project.getValueState() : 'None';
+    var busy = project.getBusy ? project.getBusy() : false;
+    if (hasValue(project, projectId) && state !== 'Error' && !busy) {
+        stable++;
+    } else {
+        stable = 0;
+        // La aplicación descartó el valor (p. ej. al recargar la lista): volver a fijarlo
+        if (!busy && !hasValue(project, projectId)) commit();
+    }
+    if (stable >= 2) {
+        clearInterval(timer);
+        done({ok: true, reason: 'selected'});
+    } else if (Date.now() - start > timeoutMs) {
+        clearInterval(timer);
+        done({ok: false, reason: state === 'Error' ? 'value_state_error' : 'timeout'});
+    }
+}, 250);
+"""
+
+# Selectores (relativos a la fila) que usan _extract_title_from_row y _get_cells_from_row;
+# se comparten con la extracción masiva en JavaScript
+_TITLE_SELECTORS = (
+    ".//a",  # Enlaces (común para títulos clickeables)
+    ".//span[contains(@class, 'title')]",  # Spans con clase title
+    ".//div[contains(@class, 'title')]",  # Divs con clase title
+    ".//div[@role='gridcell'][1]",  # Primera celda (suele ser el título)
+    ".//td[1]",  # Primera celda de tabla HTML
+    ".//*[contains(@id, 'title')]",  # Elementos con ID que contiene 'title'
+    ".//*[@title]",  # Elementos con atributo title
+    ".//span[@title]",  # Spans con atributo title
+)
+_CELL_SELECTORS = (
+    ".//td",  # Celdas de tabla HTML
+    ".//div[@role='gridcell']",  # Celdas de grid SAP UI5
+    ".//div[contains(@class, 'sapMListCell')]",  # Celdas de lista SAP
+    "./div",  # Divs directos (para algunos tipos de fila)
+)
+
+# Filas de la tabla de issues (unión de los selectores de configuración)
+_TABLE_ROWS_XPATH = " | ".join(SELECTORS["table_rows"])
+
+# Firma del contenido de la tabla (número de filas y texto de la primera) para
+# detectar cuándo termina de cargar una página nueva o más filas. Argumento: XPath de filas.
+_TABLE_SIGNATURE_JS = """
+var rows = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+var first = rows.snapshotLength ? (rows.snapshotItem(0).innerText || '') : '';
+return rows.snapshotLength + '|' + first;
+"""
+
+# Pestaña Issues activa (unión de los indicadores de selección de UI5)
+_ACTIVE_ISSUES_TAB_XPATH = (
+    "//div[@role='tab' and @aria-selected='true']//*[contains(text(), 'Issues')] | "
+    "//li[@role='tab' and @aria-selected='true']//*[contains(text(), 'Issues')] | "
+    "//div[contains(@class, 'sapMITBSelected')]//*[contains(text(), 'Issues')]"
+)
+
+# Nombres de encabezado (en mayúsculas) a nombres de columna estándar
+_HEADER_MAPPING = {
+    'ISSUE TITLE': 'Title',
+    'TITLE': 'Title',
+    'TYPE': 'Type',
+    'PRIORITY': 'Priority',
+    'STATUS': 'Status',
+    'DEADLINE': 'Deadline',
+    'DUE DATE': 'Due Date',
+    'SESSION': 'SAP Category',
+    'SAP CATEGORY': 'SAP Category',
+    'COMMENT': 'Comment',
+    'CREATED BY': 'Created By',
+    'CREATED ON': 'Created On',
+    'ASSIGNED ROLE': 'Assigned Role',
+    'PROJECT': 'Project',
+    'SYSTEM ID': 'System ID',
+    'LANGUAGE': 'Language',
+    'LAST UPDATED': 'Last Updated',
+    'LAST CHANGED BY': 'Last Updated By',
+}
+
+# Selectores y valores de las estrategias de respaldo por fila (_extract_specific_field,
+# _extract_priority, _extract_status, _extract_dates), construidos una sola vez
+_TYPE_SELECTORS = (
+    ".//div[contains(@class, 'type')]",
+    ".//span[contains(@class, 'type')]",
+    ".//div[@role='gridcell'][2]//span",  # Típicamente en la segunda columna
+    ".//td[2]//span",
+)
+_POTENTIAL_TYPES = tuple(
+    (name, name.lower()) for name in (
+        "Recommendation", "Implementation", "Question",
+        "Problem", "Incident", "Request", "Task", "Business Process",
+    )
+)
+_PRIORITY_INDICATORS = (
+    (".//span[contains(@class, 'sapMGaugeNegativeColor')]", "Very High"),
+    (".//span[contains(@class, 'sapMGaugeCriticalColor')]", "High"),
+    (".//span[contains(@class, 'sapMGaugeNeutralColor')]", "Medium"),
+    (".//span[contains(@class, 'sapMGaugePositiveColor')]", "Low"),
+    (".//span[contains(text(), 'Very High')]", "Very High"),
+    (".//span[contains(text(), 'High')]", "High"),
+    (".//span[contains(text(), 'Medium')]", "Medium"),
+    (".//span[contains(text(), 'Low')]", "Low"),
+    (".//span[contains(text(), 'very high')]", "Very High"),
+    (".//span[contains(text(), 'high')]", "High"),
+    (".//span[contains(text(), 'medium')]", "Medium"),
+    (".//span[contains(text(), 'low')]", "Low"),
+)
+_PRIORITY_KEYWORDS = (
+    ("very high", "Very High"),
+    ("high", "High"),
+    ("medium", "Medium"),
+    ("low", "Low"),
+)
+_STATUS_SELECTORS = (
+    ".//div[contains(@class, 'status')]",
+    ".//span[contains(@class, 'status')]",
+    ".//div[@role='gridcell'][3]",  # Típicamente en la tercera columna
+    ".//td[3]",
+)
+# (estado, XPath que lo busca en el texto de la fila)
+_STATUS_TEXT_XPATHS = tuple(
+    (status, f".//*[contains(text(), '{status}')]") for status in (
+        "OPEN", "DONE", "READY FOR PUBLISHING", "IN PROGRESS", "CLOSED", "DRAFT",
+        "Open", "Done", "In Progress", "Closed",
+    )
+)
+_DATE_SELECTORS = (
+    ".//span[contains(@id, 'date')]",
+    ".//div[contains(@id, 'date')]",
+    ".//span[contains(@class, 'date')]",
+    ".//div[contains(@class, 'date')]",
+    ".//*[contains(text(), '/')]",  # Para fechas como MM/DD/YYYY
+    ".//*[contains(text(), '-')]",  # Para fechas como YYYY-MM-DD
+)
+_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\d{1,2}/\d{1,2}/\d{2,4}',        # MM/DD/YYYY o DD/MM/YYYY
+    r'\d{4}-\d{1,2}-\d{1,2}',          # YYYY-MM-DD
+    r'\d{1,2}-\d{1,2}-\d{2,4}',        # DD-MM-YYYY o MM-DD-YYYY
+    r'[A-Za-z]{3} \d{1,2}, \d{4}',      # MMM DD, YYYY
+    r'\d{1,2} [A-Za-z]{3} \d{4}',       # DD MMM YYYY
+))
+
+# Lectura de todas las filas en una sola llamada a execute_script. Por cada fila
+# devuelve los candidatos a título (en el orden de _TITLE_SELECTORS) y el valor de
+# cada celda (texto, atributos title/aria-label/data-value o texto de un hijo).
+# Argumentos: filas, selectores de título y selectores de celda.
+_SCRAPE_ROWS_JS = """
+var rows = arguments[0], titleSelectors = arguments[1], cellSelectors = arguments[2];
+function select(xpath, context) {
+    var found = document.evaluate(xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < found.snapshotLength; i++) nodes.push(found.snapshotItem(i));
+    return nodes;
+}
+function text(el) {
+    return (el.innerText || '').trim();
+}
+function cellValue(cell) {
+    var value = text(cell);
+    if (value) return value;
+    var attrs = ['title', 'aria-label', 'data-value'];
+    for (var i = 0; i < attrs.length; i++) {
+        var attr = (cell.getAttribute(attrs[i]) || '').trim();
+        if (attr) return attr;
+    }
+    var children = cell.querySelectorAll('span, div, a');
+    for (var j = 0; j < children.length; j++) {
+        value = text(children[j]);
+        if (value) return value;
+    }
+    return (cell.textContent || '').replace(/\\s+/g, ' ').trim();
+}
+return rows.map(function(row) {
+    var titles = [];
+    for (var i = 0; i < titleSelectors.length && titles.length < 5; i++) {
+        var nodes = select(titleSelectors[i], row);
+        for (var j = 0; j < nodes.length && titles.length < 5; j++) {
+            var value = text(nodes[j]) || (nodes[j].getAttribute('title') || '').trim();
+            if (value) titles.push(value);
+        }
+    }
+    var cells = [];
+    for (var k = 0; k < cellSelectors.length; k++) {
+        var found = select(cellSelectors[k], row);
+        if (found.length > 1) {
+            cells = found.map(cellValue);
+            break;
+        }
+    }
+    return {titles: titles, cells: cells};
+});
+"""
+
 
 
 
@@ -73,14 +406,93 @@ class SAPBrowser:
         self.element_cache = {}  # Caché para elementos encontrados frecuentemente
         self.root = None  # Referencia a la ventana principal (si existe)
         self.status_var = None  # Variable de estado para la interfaz (si existe)
+        self._resources_blocked = False  # Bloqueo de imágenes/fuentes activo vía CDP
+        self._headless = None  # Modo (headless o con ventana) de la sesión activa
+        
+    def is_alive(self):
+        """
+        Comprueba si la sesión de WebDriver actual sigue respondiendo
+        
+        Usa una consulta barata (window_handles) en lugar de navegar.
+        
+        Returns:
+            bool: True si hay un driver con sesión activa
+        """
+        driver = self.driver
+        if driver is None or not getattr(driver, "session_id", None):
+            return False
+        try:
+            return bool(driver.window_handles)
+        except WebDriverException:
+            return False
+            
+    def set_resource_blocking(self, enabled):
+        """
+        Activa o desactiva el bloqueo de imágenes y fuentes mediante Chrome DevTools
         
-    def connect(self):
+        Reduce el tráfico y el trabajo de maquetación durante la extracción. Debe
+        desactivarse antes de la autenticación, cuya página puede necesitar logos.
+        
+        Args:
+            enabled (bool): True para bloquear, False para volver a permitirlas
+            
+        Returns:
+            bool: True si el estado solicitado quedó aplicado
+        """
+        if enabled == self._resources_blocked:
+            return True
+        if self.driver is None:
+            return False
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": list(_BLOCKED_RESOURCE_URLS) if enabled else []}
+            )
+        except (WebDriverException, AttributeError) as e:
+            # AttributeError: driver sin soporte CDP (no basado en Chromium)
+            logger.debug(f"No se pudo cambiar el bloqueo de recursos: {e}")
+            return False
+            
+        self._resources_blocked = enabled
+        logger.debug(f"Bloqueo de imágenes y fuentes {'activado' if enabled else 'desactivado'}")
+        return True
+        
+    def connect(self, headless=False):
         """
         Inicia una sesión de navegador con perfil dedicado
         
+        Si ya hay una sesión activa en el mismo modo se reutiliza: arrancar
+        chromedriver y Chrome (y volver a autenticarse en SAP) es lo más costoso de
+        una extracción corta. El perfil de Chrome solo admite un navegador a la vez,
+        así que se mantiene una única sesión en lugar de un conjunto de drivers; si
+        la sesión activa está en el otro modo, se cierra y se inicia una nueva.
+        
+        Args:
+            headless (bool): Si es True, Chrome se inicia sin ventana (--headless=new)
+                             y sin cargar imágenes, para extracciones sin interfaz.
+                             Requiere que la sesión de SAP del perfil siga válida.
+        
         Returns:
             bool: True si la conexión fue exitosa, False en caso contrario
         """
+        if self.is_alive():
+            if self._headless == headless:
+                logger.info("Reutilizando la sesión de navegador existente")
+                return True
+            # El modo no se puede cambiar en caliente: reiniciar el navegador
+            logger.info(f"La sesión activa no es {'headless' if headless else 'con ventana'}; reiniciando el navegador")
+            self.close()
+            
+        if self.driver is not None:
+            # Sesión caída (p. ej. el usuario cerró Chrome): descartarla
+            logger.info("La sesión de navegador anterior ya no responde, iniciando una nueva")
+            self.driver = None
+            self.wait = None
+            self._resources_blocked = False
+        self.element_cache.clear()
+        self._headless = None
+            
         logger.info("Iniciando navegador con perfil guardado...")
         
         try:
@@ -94,7 +506,14 @@ class SAPBrowser:
             
             # Configurar opciones de Chrome
             chrome_options = Options()
-            chrome_options.add_argument("--start-maximized")
+            if headless:
+                # Sin ventana no hay "maximizar": fijar un tamaño para que la
+                # interfaz de SAP no se maquete en modo compacto
+                chrome_options.add_argument("--headless=new")
+                chrome_options.add_argument("--window-size=1920,1080")
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            else:
+                chrome_options.add_argument("--start-maximized")
             chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
             chrome_options.add_argument("--profile-directory=Default")
             
@@ -112,13 +531,15 @@ class SAPBrowser:
             chrome_options.add_argument("--enable-precise-memory-info")
             
             # Agregar opciones para permitir que el usuario use el navegador mientras se ejecuta el script
-            chrome_options.add_experimental_option("detach", True)
+            if not headless:
+                chrome_options.add_experimental_option("detach", True)
             
             # Intentar iniciar el navegador
             self.driver = webdriver.Chrome(options=chrome_options)
             self.wait = WebDriverWait(self.driver, BROWSER_TIMEOUT)  # Timeout configurado
+            self._headless = headless
             
-            logger.info("Navegador Chrome iniciado correctamente")
+            logger.info("Navegador Chrome iniciado correctamente" + (" (headless)" if headless else ""))
             return True
             
         except WebDriverException as e:
@@ -130,6 +551,8 @@ class SAPBrowser:
                     chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
                     self.driver = webdriver.Chrome(options=chrome_options)
                     self.wait = WebDriverWait(self.driver, BROWSER_TIMEOUT)
+                    # Chrome abierto por el usuario con depuración remota: siempre con ventana
+                    self._headless = False
                     logger.info("Conexión exitosa a sesión existente de Chrome")
                     return True
                 except Exception as debug_e:
@@ -150,6 +573,8 @@ class SAPBrowser:
                     self.driver.quit()
                     self.driver = None
                     self.wait = None
+                    self._resources_blocked = False
+                    self._headless = None
                     logger.info("Navegador cerrado correctamente")
                     return True
                 except Exception as e:
@@ -157,6 +582,108 @@ class SAPBrowser:
                     return False
             return True
 
+    def _set_status(self, message):
+        """
+        Actualiza el mensaje de estado de la interfaz, si hay una conectada.
+        
+        Estos métodos se ejecutan en hilos de trabajo: el cambio se programa en el
+        hilo de Tk con root.after en lugar de forzar un root.update() desde aquí.
+        
+        Args:
+            message (str): Mensaje a mostrar
+        """
+        status_var = getattr(self, 'status_var', None)
+        if not status_var:
+            return
+            
+        root = getattr(self, 'root', None)
+        if root:
+            root.after(0, apply_status, status_var, message)
+        else:
+            apply_status(status_var, message)
+            
+    def wait_until(self, condition, timeout, poll=0.25):
+        """
+        Espera a que se cumpla una condición sondeando el navegador.
+        
+        Sustituye las esperas fijas con time.sleep: termina en cuanto la
+        condición se cumple y solo agota el tiempo en el peor caso.
+        
+        Args:
+            condition (callable): Condición que recibe el driver (p. ej. de expected_conditions)
+            timeout (float): Tiempo máximo de espera en segundos
+            poll (float): Intervalo de sondeo en segundos
+            
+        Returns:
+            bool: True si la condición se cumplió, False si se agotó el tiempo
+        """
+        if not self.driver:
+            return False
+            
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll).until(condition)
+            return True
+        except TimeoutException:
+            return False
+            
+    def _has_visible(self, css_selector):
+        """
+        Indica si hay algún elemento visible que coincida con el selector CSS
+        
+        Pensado como condición de wait_until: los errores de WebDriver (p. ej.
+        elementos obsoletos mientras la lista se redibuja) cuentan como "aún no".
+        
+        Args:
+            css_selector (str): Selector CSS a comprobar
+            
+        Returns:
+            bool: True si al menos un elemento está visible
+        """
+        try:
+            return any(el.is_displayed() for el in self.driver.find_elements(By.CSS_SELECTOR, css_selector))
+        except WebDriverException:
+            return False
+            
+    def _table_signature(self):
+        """
+        Devuelve una firma del contenido actual de la tabla de issues
+        
+        Returns:
+            str: Número de filas y texto de la primera, o None si no se pudo leer
+        """
+        try:
+            return self.driver.execute_script(_TABLE_SIGNATURE_JS, _TABLE_ROWS_XPATH)
+        except WebDriverException:
+            return None
+            
+    def _wait_for_table_change(self, before, timeout=5):
+        """
+        Espera a que la tabla cambie respecto a una firma previa (_table_signature)
+        
+        Sustituye a las pausas fijas tras pasar de página o pedir más filas:
+        termina en cuanto llega el contenido nuevo.
+        
+        Args:
+            before (str): Firma tomada antes de la acción
+            timeout (float): Tiempo máximo de espera en segundos
+            
+        Returns:
+            bool: True si la tabla cambió, False si se agotó el tiempo
+        """
+        return self.wait_until(lambda d: self._table_signature() != before, timeout, poll=0.2)
+        
+    def _page_ready(self, driver):
+        """
+        Condición de espera: la página terminó de cargar y UI5 está inicializado.
+        
+        Args:
+            driver: WebDriver de Selenium
+            
+        Returns:
+            bool: True si la página está lista
+        """
+        return driver.execute_script(_PAGE_READY_JS)
+        
     def navigate_to_sap(self, erp_number=None, project_id=None):
         """
         Navega a la URL de SAP con parámetros específicos de cliente y proyecto,
@@ -176,10 +703,10 @@ class SAPBrowser:
         try:
             # Extraer solo los números de ERP y project ID
             if erp_number and " - " in erp_number:
-                erp_number = erp_number.split(" - ")[0].strip()
+                erp_number = erp_number.partition(" - ")[0].strip()
                 
             if project_id and " - " in project_id:
-                project_id = project_id.split(" - ")[0].strip()           
+                project_id = project_id.partition(" - ")[0].strip()           
             
             # URL destino exacta
             target_url = f"https://xalm-prod.x.eu20.alm.cloud.sap/launchpad#iam-ui&/?erpNumber={erp_number}&crmProjectId={project_id}&x-app-name=HEP"
@@ -187,7 +714,7 @@ class SAPBrowser:
             
             # Intentar navegación directa
             self.driver.get(target_url)
-            time.sleep(5)  # Esperar carga inicial
+            self.wait_until(self._page_ready, 5)  # Esperar carga inicial
             
             # Verificar si fuimos redirigidos
             current_url = self.driver.current_url
@@ -202,7 +729,7 @@ class SAPBrowser:
                 window.location.href = "{target_url}";
                 """
                 self.driver.execute_script(js_navigate_script)
-                time.sleep(5)  # Esperar a que cargue la página
+                self.wait_until(self._page_ready, 5)  # Esperar a que cargue la página
                 
                 # Verificar nuevamente
                 current_url = self.driver.current_url
@@ -223,7 +750,7 @@ class SAPBrowser:
                     window.location.hash = targetHash;
                     """
                     self.driver.execute_script(force_script)
-                    time.sleep(5)
+                    self.wait_until(self._page_ready, 5)
             
             # Intentar aceptar certificados o diálogos si aparecen
             try:
@@ -290,7 +817,7 @@ class SAPBrowser:
                     logger.info("Formulario de login detectado, esperando introducción manual de credenciales")
                     
                     # Mostrar mensaje al usuario si estamos en interfaz gráfica
-                    if hasattr(self, 'root') and self.root:
+                    if self.root is not None:
                         messagebox.showinfo(
                             "Autenticación Requerida",
                             "Por favor, introduzca sus credenciales en el navegador.\n\n"
@@ -465,8 +992,7 @@ class SAPBrowser:
                 logger.info(f"Procesando página {current_page}...")
                 
                 # Actualizar la interfaz si existe
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set(f"Procesando página {current_page}...")
+                self._set_status(f"Procesando página {current_page}...")
                 
                 # En cada página, esperar a que carguen los datos
                 time.sleep(2)
@@ -553,11 +1079,7 @@ class SAPBrowser:
                 if next_button:
                     try:
                         # Hacer scroll para asegurar la visibilidad
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                        time.sleep(0.5)
-                        
-                        # Clic en el botón de siguiente página
-                        self.driver.execute_script("arguments[0].click();", next_button)
+                        self.driver.execute_script(SCROLL_AND_CLICK_JS, next_button)
                         logger.info(f"Clic en botón de siguiente página")
                         
                         # Esperar a que cargue la siguiente página
@@ -616,6 +1138,13 @@ class SAPBrowser:
         try:
             logger.info(f"Verificando si los campos ya contienen los valores esperados: Cliente {erp_number}, Proyecto {project_id}")
             
+            # Camino rápido: todas las lecturas en una sola evaluación CDP
+            counts = self._verify_fields_cdp(erp_number, project_id)
+            if counts is not None:
+                fields_verified, indicators_found = counts
+                logger.info(f"Verificación CDP: {fields_verified} campos, {indicators_found} indicadores")
+                return fields_verified >= 2 or indicators_found >= 3
+            
             # Indicadores de que estamos en la página correcta con los valores esperados
             indicators_found = 0
             
@@ -760,6 +1289,60 @@ class SAPBrowser:
             logger.error(f"Error al verificar campos: {e}")
             return False
             
+    def _verify_fields_cdp(self, erp_number, project_id):
+        """
+        Ejecuta las comprobaciones de verify_fields_have_expected_values con una sola llamada CDP.
+        
+        Args:
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            
+        Returns:
+            tuple: (campos_verificados, indicadores_encontrados) o None si CDP no está disponible
+        """
+        expression = (
+            _VERIFY_FIELDS_CDP_JS
+            .replace("__ERP__", json.dumps(str(erp_number)))
+            .replace("__PROJECT__", json.dumps(str(project_id)))
+        )
+        try:
+            response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": expression,
+                "awaitPromise": True,
+                "returnByValue": True,
+            })
+            fields_verified, indicators_found = json.loads(response["result"]["value"])
+            return fields_verified, indicators_found
+        except Exception as e:
+            logger.debug(f"Verificación CDP no disponible: {e}")
+            return None
+            
+    def ensure_fields_ui5(self, erp_number, project_id):
+        """
+        Verifica y, si es necesario, establece el cliente con una sola llamada JavaScript.
+        
+        Sustituye la secuencia verify_fields_have_expected_values + select_customer_automatically
+        en el caso habitual: lee los valores de los controles UI5, fija el cliente si no
+        coincide y dispara el evento change, todo en un único viaje al navegador.
+        
+        Args:
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            
+        Returns:
+            dict: {'ok': cliente correcto, 'need_manual': hay que recurrir a los otros
+                  métodos de selección, 'project_ok': el proyecto ya está seleccionado}
+        """
+        try:
+            result = self.driver.execute_script(_ENSURE_FIELDS_UI5_JS, erp_number, project_id)
+            if isinstance(result, dict):
+                logger.info(f"Resultado de la verificación UI5 de campos: {result}")
+                return result
+        except Exception as e:
+            logger.debug(f"Error en la verificación UI5 de campos: {e}")
+            
+        return {"ok": False, "need_manual": True, "project_ok": False}
+            
     def select_customer_automatically(self, erp_number):
         """
         Selecciona automáticamente un cliente en la pantalla de Project Overview.
@@ -786,8 +1369,13 @@ class SAPBrowser:
             # ESTRATEGIA 2: Si falló el método directo, intentar con el método original
             logger.info("Método UI5 directo falló, intentando método estándar...")
             
-            # Esperar a que la página cargue completamente
-            time.sleep(5)
+            # Esperar a que la página muestre algún campo de cliente
+            self.wait_until(
+                EC.presence_of_element_located(
+                    (By.XPATH, "//input[contains(@placeholder, 'Customer') or contains(@aria-label, 'Customer')]")
+                ),
+                5
+            )
             
             # Localizar el campo de entrada de cliente con múltiples selectores
             customer_field = None
@@ -838,30 +1426,27 @@ class SAPBrowser:
                 customer_field.clear()
                 customer_field.send_keys(Keys.CONTROL + "a")
                 customer_field.send_keys(Keys.DELETE)
-                time.sleep(1)
+                self.wait_until(lambda d: not customer_field.get_attribute("value"), 1, poll=0.1)
             except Exception as clear_e:
                 logger.warning(f"Error al limpiar campo de cliente: {clear_e}")
             
-            # Escribir el ERP número con pausas entre caracteres para permitir autocompletado
-            for char in erp_number:
-                customer_field.send_keys(char)
-                time.sleep(0.3)
+            # Escribir el ERP número (cada tecla dispara el autocompletado de UI5)
+            customer_field.send_keys(erp_number)
             
             # Esperar a que aparezcan las sugerencias
-            time.sleep(2)
+            self.wait_until(lambda d: self._has_visible(_SUGGESTION_ITEMS_CSS), 2, poll=0.2)
             
             # NUEVA ESTRATEGIA: Usar flecha abajo y Enter para seleccionar la primera sugerencia
             try:
                 # Enviar flecha abajo para seleccionar la primera sugerencia
                 customer_field.send_keys(Keys.DOWN)
-                time.sleep(1)
+                self.wait_until(lambda d: self._has_visible(_SELECTED_SUGGESTION_CSS), 1, poll=0.1)
                 # Enviar Enter para confirmar la selección
                 customer_field.send_keys(Keys.ENTER)
-                time.sleep(2)
                 logger.info("Flecha abajo y Enter enviados para seleccionar sugerencia")
                 
-                # Verificar si se seleccionó correctamente
-                selected = self._verify_client_selection_strict(erp_number)
+                # Verificar si se seleccionó correctamente (esperando a que se aplique)
+                selected = self.wait_until(lambda d: self._verify_client_selection_strict(erp_number), 2)
                 if selected:
                     logger.info(f"Cliente {erp_number} seleccionado exitosamente con flecha abajo y Enter")
                     return True
@@ -889,7 +1474,6 @@ class SAPBrowser:
                                     self.driver.execute_script("arguments[0].click();", suggestion)
                                     logger.info(f"Sugerencia seleccionada mediante JavaScript: {suggestion.text}")
                                     suggestion_found = True
-                                    time.sleep(2)
                                     break
                                 except Exception as js_click_e:
                                     logger.debug(f"Error en JavaScript click: {js_click_e}, intentando click normal")
@@ -897,7 +1481,6 @@ class SAPBrowser:
                                         suggestion.click()
                                         logger.info(f"Sugerencia seleccionada con click normal: {suggestion.text}")
                                         suggestion_found = True
-                                        time.sleep(2)
                                         break
                                     except Exception as normal_click_e:
                                         logger.debug(f"Error en click normal: {normal_click_e}")
@@ -917,10 +1500,10 @@ class SAPBrowser:
             if not suggestion_found:
                 logger.info("No se encontraron sugerencias, presionando Enter")
                 customer_field.send_keys(Keys.ENTER)
-                time.sleep(2)
             
-            # VERIFICACIÓN CRÍTICA: Verificar estrictamente que el cliente fue seleccionado
-            selected = self._verify_client_selection_strict(erp_number)
+            # VERIFICACIÓN CRÍTICA: Verificar estrictamente que el cliente fue seleccionado,
+            # esperando a que la interfaz procese el clic o el Enter
+            selected = self.wait_until(lambda d: self._verify_client_selection_strict(erp_number), 2)
             
             # ESTRATEGIA 3: Si aún no se ha seleccionado, intentar método JavaScript directo como último recurso
             if not selected:
@@ -942,7 +1525,7 @@ class SAPBrowser:
                 input.dispatchEvent(enterEvent);
                 """
                 self.driver.execute_script(js_script, customer_field)
-                time.sleep(2)
+                self.wait_until(lambda d: self._verify_client_selection_strict(erp_number), 2)
                 customer_field.send_keys(Keys.TAB)  # Navegar al siguiente campo
                 selected = self._verify_client_selection_strict(erp_number)
             
@@ -1453,23 +2036,94 @@ class SAPBrowser:
         
         
         
-    def select_project_automatically(self, project_id):
+    def select_project_automatically(self, project_id, retries=1, poll_interval=0.5, budget=None):
             """
             Selecciona automáticamente un proyecto por su ID.
             Implementa una estrategia mejorada, resiliente y con múltiples verificaciones.
             
+            Los reintentos comparten un único plazo total: la pausa entre intentos
+            empieza en poll_interval y se duplica (hasta 4 s), de modo que una página
+            rápida sale enseguida y una lenta sigue teniendo reintentos.
+            
             Args:
                 project_id (str): ID del proyecto a seleccionar
+                retries (int): Número máximo de intentos de selección
+                poll_interval (float): Pausa inicial entre intentos, en segundos
+                budget (float, optional): Tiempo total disponible en segundos.
+                    Si es None, se usan 3 segundos por intento.
                 
             Returns:
                 bool: True si la selección fue exitosa, False en caso contrario
             """
-            try:
-                # Verificar que el ID no esté vacío
-                if not project_id or project_id.strip() == "":
-                    logger.warning("No se puede seleccionar proyecto: ID vacío")
-                    return False
+            # Verificar que el ID no esté vacío
+            if not project_id or project_id.strip() == "":
+                logger.warning("No se puede seleccionar proyecto: ID vacío")
+                return False
+                
+            if budget is None:
+                budget = retries * 3
+            deadline = time.monotonic() + budget
+            delay = poll_interval
+            
+            # Caso habitual: un único viaje al navegador con el sondeo dentro de la página
+            if self.select_project_ui5_polling(project_id, timeout=min(9, budget)):
+                return True
+            
+            for attempt in range(1, retries + 1):
+                logger.info(f"Intento {attempt}/{retries} de selección de proyecto")
+                if self._select_project_once(project_id):
+                    return True
                     
+                # No reintentar si la pausa agotaría el plazo
+                if attempt == retries or time.monotonic() + delay > deadline:
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, 4.0)
+                
+            logger.warning(f"Selección de proyecto fallida tras {attempt} intentos")
+            return False
+            
+    def select_project_ui5_polling(self, project_id, timeout=9):
+            """
+            Selecciona el proyecto mediante el control UI5 en una sola llamada
+            
+            Los reintentos se hacen en el navegador (setInterval) en lugar de repetir
+            la ida y vuelta Python-chromedriver con pausas fijas entre intentos.
+            
+            Args:
+                project_id (str): ID del proyecto a seleccionar
+                timeout (float): Tiempo máximo de sondeo en el navegador, en segundos
+                
+            Returns:
+                bool: True si el control UI5 confirmó la selección
+            """
+            try:
+                result = self.driver.execute_async_script(
+                    _SELECT_PROJECT_UI5_JS, project_id, int(timeout * 1000)
+                )
+            except WebDriverException as e:
+                logger.debug(f"Error en la selección UI5 con sondeo: {e}")
+                return False
+                
+            if isinstance(result, dict) and result.get("ok"):
+                logger.info(f"Proyecto {project_id} seleccionado mediante UI5 con sondeo en el navegador")
+                return True
+                
+            reason = result.get("reason") if isinstance(result, dict) else result
+            logger.info(f"Selección UI5 con sondeo no confirmada ({reason}), usando estrategias alternativas")
+            return False
+            
+    def _select_project_once(self, project_id):
+            """
+            Realiza un intento de selección del proyecto con todas las estrategias disponibles.
+            
+            Args:
+                project_id (str): ID del proyecto a seleccionar
+                
+            Returns:
+                bool: True si la selección fue exitosa, False en caso contrario
+            """
+            try:
                 logger.info(f"Seleccionando proyecto {project_id} automáticamente...")
                 
                 # 0. Verificar primero si el proyecto ya está seleccionado
@@ -1482,21 +2136,13 @@ class SAPBrowser:
                     logger.info(f"Proyecto {project_id} seleccionado exitosamente con método UI5 directo")
                     return True
                     
-                # 2. Estrategia secundaria: método Selenium con múltiples intentos
+                # 2. Estrategia secundaria: método Selenium, reintentado por WebDriverWait
+                # cada 0,5 s hasta que tenga éxito (sin pausas fijas entre intentos)
                 logger.info("Método UI5 directo falló, intentando método Selenium con reintentos...")
                 
-                max_attempts = 3
-                for attempt in range(max_attempts):
-                    logger.info(f"Intento {attempt+1}/{max_attempts} con método Selenium")
-                    
-                    if self._select_project_with_selenium(project_id):
-                        logger.info(f"Proyecto {project_id} seleccionado exitosamente en el intento {attempt+1}")
-                        return True
-                        
-                    # Esperar entre intentos
-                    if attempt < max_attempts - 1:
-                        logger.info(f"Intento {attempt+1} fallido, esperando antes de reintentar...")
-                        time.sleep(3)
+                if self.wait_until(lambda d: self._select_project_with_selenium(project_id), 6, poll=0.5):
+                    logger.info(f"Proyecto {project_id} seleccionado exitosamente con método Selenium")
+                    return True
                 
                 # 3. Estrategia de último recurso: Script JavaScript más agresivo
                 logger.warning("Estrategias estándar fallidas, intentando script JavaScript agresivo...")
@@ -1828,7 +2474,7 @@ class SAPBrowser:
                             break
                     if project_field:
                         break
-                except:
+                except WebDriverException:
                     continue
             
             if not project_field:
@@ -1844,26 +2490,23 @@ class SAPBrowser:
                 # Usar secuencia de teclas para asegurar limpieza completa
                 project_field.send_keys(Keys.CONTROL + "a")
                 project_field.send_keys(Keys.DELETE)
-                time.sleep(1)
+                self.wait_until(lambda d: not project_field.get_attribute("value"), 1, poll=0.1)
             except Exception as clear_e:
                 logger.debug(f"Error al limpiar campo: {clear_e} - continuando de todos modos")
             
             # Hacer clic para asegurar el foco
             try:
                 project_field.click()
-                time.sleep(0.5)
-            except:
+            except WebDriverException:
                 # Intentar con JavaScript si el clic directo falla
                 self.driver.execute_script("arguments[0].focus();", project_field)
-                time.sleep(0.5)
+            self.wait_until(lambda d: d.switch_to.active_element == project_field, 0.5, poll=0.1)
             
-            # Ingresar el ID del proyecto con pausas entre caracteres
-            for char in project_id:
-                project_field.send_keys(char)
-                time.sleep(0.2)  # Pausas para que la interfaz procese cada carácter
+            # Ingresar el ID del proyecto (cada tecla dispara el autocompletado de UI5)
+            project_field.send_keys(project_id)
             
-            # Pausar para que aparezcan las sugerencias (tiempo más largo)
-            time.sleep(2)
+            # Esperar a que aparezcan las sugerencias
+            self.wait_until(lambda d: self._has_visible(_SUGGESTION_ITEMS_CSS), 2, poll=0.2)
             
             # ESTRATEGIA PRINCIPAL: Usar ActionChains para una secuencia controlada de teclas
             from selenium.webdriver.common.action_chains import ActionChains
@@ -1878,11 +2521,8 @@ class SAPBrowser:
             actions.send_keys(Keys.ENTER)
             actions.perform()
             
-            # Esperar a que se procese la selección
-            time.sleep(2)
-            
-            # Verificar si la selección tuvo éxito
-            if self._verify_project_selection_strict(project_id):
+            # Esperar a que se procese la selección y verificar si tuvo éxito
+            if self.wait_until(lambda d: self._verify_project_selection_strict(project_id), 2):
                 logger.info(f"Proyecto {project_id} seleccionado con éxito mediante secuencia de teclas")
                 return True
             
@@ -1910,15 +2550,10 @@ class SAPBrowser:
                         suggestions = self.driver.find_elements(By.XPATH, selector)
                         if suggestions and suggestions[0].is_displayed():
                             # Hacer scroll para asegurar visibilidad
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", suggestions[0])
-                            time.sleep(0.5)
-                            
-                            # Clic con JavaScript (más confiable en SAP UI5)
-                            self.driver.execute_script("arguments[0].click();", suggestions[0])
+                            self.driver.execute_script(SCROLL_AND_CLICK_JS, suggestions[0])
                             logger.info("Clic en primera sugerencia realizado con JavaScript")
-                            time.sleep(2)
                             
-                            if self._verify_project_selection_strict(project_id):
+                            if self.wait_until(lambda d: self._verify_project_selection_strict(project_id), 2):
                                 logger.info(f"Proyecto {project_id} seleccionado con éxito mediante clic en sugerencia")
                                 return True
                     except Exception as sugg_e:
@@ -1930,12 +2565,11 @@ class SAPBrowser:
             # ESTRATEGIA ALTERNATIVA 2: Solo Enter como último recurso
             try:
                 project_field.send_keys(Keys.ENTER)
-                time.sleep(2)
                 
-                if self._verify_project_selection_strict(project_id):
+                if self.wait_until(lambda d: self._verify_project_selection_strict(project_id), 2):
                     logger.info(f"Proyecto {project_id} seleccionado con éxito mediante Enter simple")
                     return True
-            except:
+            except WebDriverException:
                 pass
             
             logger.warning(f"Todas las estrategias fallaron para seleccionar el proyecto {project_id}")
@@ -2097,13 +2731,11 @@ class SAPBrowser:
                             try:
                                 self.driver.execute_script("arguments[0].click();", button)
                                 logger.info("Clic en botón de búsqueda exitoso con JavaScript")
-                                time.sleep(3)  # Esperar a que responda
                                 return True
-                            except:
+                            except WebDriverException:
                                 # Si falla JavaScript, intentar clic normal
                                 button.click()
                                 logger.info("Clic en botón de búsqueda exitoso con método normal")
-                                time.sleep(3)
                                 return True
                             
                             
@@ -2125,9 +2757,8 @@ class SAPBrowser:
                     if search_icon:
                         self.driver.execute_script("arguments[0].click();", search_icon)
                         logger.info("Clic en icono de búsqueda dentro del campo de búsqueda")
-                        time.sleep(3)
                         return True
-            except:
+            except WebDriverException:
                 pass
                 
             # Si todavía no encontramos, probar con las coordenadas de clic en el campo de búsqueda
@@ -2137,14 +2768,13 @@ class SAPBrowser:
                 if search_field and search_field.is_displayed():
                     # Hacer clic primero en el campo para activarlo
                     search_field.click()
-                    time.sleep(1)
+                    self.wait_until(lambda d: d.switch_to.active_element == search_field, 1, poll=0.1)
                     
                     # Luego presionar Enter para ejecutar la búsqueda
                     search_field.send_keys(Keys.ENTER)
                     logger.info("Búsqueda ejecutada con clic + Enter en el campo de búsqueda")
-                    time.sleep(3)
                     return True
-            except:
+            except WebDriverException:
                 pass
                 
             # Último recurso: buscar cualquier botón que pueda ser el de búsqueda
@@ -2187,9 +2817,8 @@ class SAPBrowser:
                     # Intentar con el primer botón potencial
                     self.driver.execute_script("arguments[0].click();", potential_buttons[0])
                     logger.info("Clic en botón potencial de búsqueda mediante JavaScript")
-                    time.sleep(3)
                     return True
-            except:
+            except WebDriverException:
                 pass
                 
             logger.error("No se pudo encontrar o hacer clic en el botón de búsqueda")
@@ -2225,7 +2854,7 @@ class SAPBrowser:
                     WebDriverWait(self.driver, 5).until_not(
                         EC.visibility_of_element_located((By.XPATH, indicator))
                     )
-                except:
+                except WebDriverException:
                     pass
                 
                 
@@ -2459,11 +3088,7 @@ class SAPBrowser:
                     logger.info(f"🖱️ Intentando clic en ícono #{i+1}...")
                     
                     # Hacer scroll
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", icon)
-                    time.sleep(0.5)
-                    
-                    # Intentar clic en el elemento del ícono
-                    self.driver.execute_script("arguments[0].click();", icon)
+                    self.driver.execute_script(SCROLL_AND_CLICK_JS, icon)
                     logger.info(f"✅ Clic JavaScript ejecutado en ícono #{i+1}")
                     time.sleep(2)
                     
@@ -2549,9 +3174,7 @@ class SAPBrowser:
                     logger.info(f"📋 Atributos del elemento #{i+1}: {attrs}")
                     
                     # Clic
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].click();", element)
+                    self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                     time.sleep(2)
                     
                     if self._verify_settings_panel_opened():
@@ -2780,9 +3403,7 @@ class SAPBrowser:
                         if element.is_displayed():
                             logger.info(f"Encontrado elemento 'Select Columns' con selector: {selector}")
                             # Hacer scroll y clic
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            time.sleep(0.5)
-                            self.driver.execute_script("arguments[0].click();", element)
+                            self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                             logger.info("Clic ejecutado en 'Select Columns'")
                             time.sleep(2)
                             select_columns_clicked = True
@@ -2935,9 +3556,7 @@ class SAPBrowser:
                         if element.is_displayed():
                             logger.info(f"Encontrado elemento 'Select All' con selector: {selector}")
                             # Hacer scroll y clic
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            time.sleep(0.5)
-                            self.driver.execute_script("arguments[0].click();", element)
+                            self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                             logger.info("Clic ejecutado en 'Select All'")
                             time.sleep(1)
                             select_all_clicked = True
@@ -3049,9 +3668,7 @@ class SAPBrowser:
                             logger.info(f"Encontrado posible botón OK: '{btn_text}' con selector: {selector}")
                             
                             # Hacer scroll y clic
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            time.sleep(0.5)
-                            self.driver.execute_script("arguments[0].click();", element)
+                            self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                             logger.info(f"Clic ejecutado en botón '{btn_text}'")
                             time.sleep(2)
                             ok_clicked = True
@@ -3664,9 +4281,7 @@ class SAPBrowser:
                     for element in title_elements:
                         if element.is_displayed():
                             # Hacer scroll y click
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            time.sleep(0.5)
-                            self.driver.execute_script("arguments[0].click();", element)
+                            self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                             logger.info(f"✅ Click realizado en título con selector: {selector}")
                             title_clicked = True
                             break
@@ -3993,11 +4608,7 @@ class SAPBrowser:
                 for element in elements:
                     if element.is_displayed() and element.is_enabled():
                         # Hacer scroll para asegurar visibilidad
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                        time.sleep(0.5)
-                        
-                        # Intentar clic con JavaScript
-                        self.driver.execute_script("arguments[0].click();", element)
+                        self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                         logger.info(f"Clic en botón de ajustes realizado con selector: {selector}")
                         time.sleep(2)
                         
@@ -4065,9 +4676,7 @@ class SAPBrowser:
             # Intentar hacer clic en cada candidato
             for i, candidate in enumerate(candidates):
                 try:
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", candidate)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].click();", candidate)
+                    self.driver.execute_script(SCROLL_AND_CLICK_JS, candidate)
                     logger.info(f"Clic en candidato #{i+1} con análisis visual")
                     time.sleep(2)
                     
@@ -4107,9 +4716,7 @@ class SAPBrowser:
             # Intentar hacer clic en cada botón de la parte inferior
             for i, button in enumerate(bottom_buttons):
                 try:
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].click();", button)
+                    self.driver.execute_script(SCROLL_AND_CLICK_JS, button)
                     logger.info(f"Clic en botón inferior #{i+1}")
                     time.sleep(2)
                     
@@ -4135,9 +4742,7 @@ class SAPBrowser:
                 elements = self.driver.find_elements(By.XPATH, selector)
                 for element in elements:
                     if element.is_displayed():
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                        time.sleep(0.5)
-                        self.driver.execute_script("arguments[0].click();", element)
+                        self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                         logger.info(f"Clic en elemento con tooltip usando selector: {selector}")
                         time.sleep(2)
                         
@@ -4431,8 +5036,7 @@ class SAPBrowser:
         logger.info(f"Iniciando proceso de scroll mejorado para cargar {total_expected} elementos...")
         
         # Actualizar la interfaz si existe
-        if hasattr(self, 'status_var') and self.status_var:
-            self.status_var.set(f"Cargando elementos...")
+        self._set_status(f"Cargando elementos...")
         
         # Lista para almacenar las filas procesadas y evitar duplicados
         processed_titles = set()
@@ -4518,10 +5122,7 @@ class SAPBrowser:
                 logger.info(f"Intento {attempt+1}: {current_rows_count} filas cargadas")
                 
                 # Actualizar interfaz
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set(f"Cargando elementos: {current_rows_count}/{total_expected}")
-                    if self.root:
-                        self.root.update()
+                self._set_status(f"Cargando elementos: {current_rows_count}/{total_expected}")
                 
                 # Verificar progreso
                 if current_rows_count == previous_rows_count:
@@ -4594,8 +5195,7 @@ class SAPBrowser:
         logger.info(f"Proceso de scroll completado. Cobertura: {coverage:.2f}% ({previous_rows_count}/{total_expected})")
         
         # Actualizar interfaz
-        if hasattr(self, 'status_var') and self.status_var:
-            self.status_var.set(f"Elementos cargados: {previous_rows_count}/{total_expected} ({coverage:.1f}%)")
+        self._set_status(f"Elementos cargados: {previous_rows_count}/{total_expected} ({coverage:.1f}%)")
             
         return previous_rows_count
 
@@ -4624,8 +5224,10 @@ class SAPBrowser:
                             parent_row = button.find_elements(By.XPATH, "./ancestor::*[contains(@class, 'sapMLIB') or contains(@class, 'sapMListItem')]")
                             if not parent_row:  # No está dentro de una fila
                                 logger.info(f"Haciendo clic en botón 'Show More': {button.text}")
+                                before = self._table_signature()
                                 self.driver.execute_script("arguments[0].click();", button)
-                                time.sleep(1.5)  # Esperar a que carguen nuevos elementos
+                                # Esperar a que carguen nuevos elementos
+                                self._wait_for_table_change(before, 3)
                                 return True
                     except Exception as btn_e:
                         continue
@@ -4671,9 +5273,6 @@ class SAPBrowser:
             while has_more_pages and page <= 30:  # Máximo 30 páginas por seguridad
                 logger.info(f"Procesando página {page}...")
                 
-                # Esperar a que se cargue la página actual
-                time.sleep(2)
-                
                 # Buscar el botón "Next"
                 next_button = None
                 for selector in [
@@ -4705,14 +5304,14 @@ class SAPBrowser:
                     
                 # Hacer clic en "Next"
                 try:
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].click();", next_button)
+                    before = self._table_signature()
+                    self.driver.execute_script(SCROLL_AND_CLICK_JS, next_button)
                     logger.info(f"Clic en botón 'Next' para página {page+1}")
                     page += 1
                     
-                    # Verificar si el botón quedó deshabilitado después del clic
-                    time.sleep(2)  # Esperar a que se cargue la siguiente página
+                    # Esperar a que se cargue la siguiente página y verificar
+                    # si el botón quedó deshabilitado después del clic
+                    self._wait_for_table_change(before)
                     try:
                         is_disabled = "sapMBtnDisabled" in next_button.get_attribute("class") or not next_button.is_enabled()
                         if is_disabled:
@@ -4902,8 +5501,7 @@ class SAPBrowser:
             logger.info("MÉTODO: extract_issues_data - Iniciando extracción de datos mejorada")
             
             # Actualizar la interfaz si existe
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Iniciando extracción de datos...")
+            self._set_status("Iniciando extracción de datos...")
                 
             # 1. Detectar tabla y obtener el número total de issues
             total_issues = self._detect_total_issues_from_tab()
@@ -4917,8 +5515,7 @@ class SAPBrowser:
             logger.info("Obteniendo todas las filas después del scroll...")
             
             # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Obteniendo todas las filas...")
+            self._set_status("Obteniendo todas las filas...")
                 
             # Usar el método mejorado para encontrar las filas
             rows = self.find_table_rows(highlight=False)
@@ -4927,8 +5524,7 @@ class SAPBrowser:
                 logger.error("No se pudieron encontrar filas en la tabla")
                 
                 # Actualizar la interfaz
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set("ERROR: No se pudieron encontrar filas en la tabla")
+                self._set_status("ERROR: No se pudieron encontrar filas en la tabla")
                     
                 return []
             
@@ -4944,17 +5540,13 @@ class SAPBrowser:
             logger.info(f"Procesando {len(rows)} filas...")
             
             # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set(f"Procesando {len(rows)} filas...")
+            self._set_status(f"Procesando {len(rows)} filas...")
                 
             for index, row in enumerate(rows):
                 try:
                     # Actualizar la interfaz periódicamente
                     if index % 10 == 0:
-                        if hasattr(self, 'status_var') and self.status_var:
-                            self.status_var.set(f"Procesando fila {index+1} de {len(rows)}...")
-                            if self.root:
-                                self.root.update()
+                        self._set_status(f"Procesando fila {index+1} de {len(rows)}...")
                     
                     # Extraer datos de la fila actual
                     issue_data = self._extract_row_data(row, index, table_info)
@@ -4981,8 +5573,7 @@ class SAPBrowser:
             logger.info(f"Extracción completada. Total de issues procesados: {len(issues_data)}")
             
             # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set(f"Extracción completada. Total: {len(issues_data)} issues")
+            self._set_status(f"Extracción completada. Total: {len(issues_data)} issues")
             
             # 8. Guardar datos crudos para depuración (si hay issues)
             if issues_data:
@@ -5087,33 +5678,10 @@ class SAPBrowser:
             
             # Si tenemos encabezados, actualizar los índices
             if headers:
-                # Crear un mapeo de nombres de encabezado a nombres de columna estándar
-                header_mapping = {
-                    'ISSUE TITLE': 'Title',
-                    'TITLE': 'Title',
-                    'TYPE': 'Type',
-                    'PRIORITY': 'Priority',
-                    'STATUS': 'Status',
-                    'DEADLINE': 'Deadline',
-                    'DUE DATE': 'Due Date',
-                    'SESSION': 'SAP Category',
-                    'SAP CATEGORY': 'SAP Category',
-                    'COMMENT': 'Comment',
-                    'CREATED BY': 'Created By',
-                    'CREATED ON': 'Created On',
-                    'ASSIGNED ROLE': 'Assigned Role',
-                    'PROJECT': 'Project',
-                    'SYSTEM ID': 'System ID',
-                    'LANGUAGE': 'Language',
-                    'LAST UPDATED': 'Last Updated',
-                    'LAST CHANGED BY': 'Last Updated By'
-                }
-                
                 # Actualizar índices según los encabezados encontrados
                 for header_text, idx in headers.items():
-                    header_upper = header_text.upper()
-                    if header_upper in header_mapping:
-                        standard_name = header_mapping[header_upper]
+                    standard_name = _HEADER_MAPPING.get(header_text.upper())
+                    if standard_name:
                         column_indices[standard_name] = idx
             
             return {
@@ -5243,6 +5811,109 @@ class SAPBrowser:
 
 
 
+    def _extract_rows(self, rows, table_info):
+        """
+        Extrae los datos de varias filas leyendo todas sus celdas en una sola llamada
+        
+        _SCRAPE_ROWS_JS devuelve título y celdas de cada fila de una vez, en lugar de
+        una consulta a WebDriver por selector y celda. Las filas en las que faltan
+        campos que la lectura por celdas no resuelve (tipo, prioridad, estado o
+        fechas) pasan por _extract_row_data, que aplica el resto de estrategias.
+        
+        Args:
+            rows (list): Elementos WebElement de las filas
+            table_info (dict): Información sobre la estructura de la tabla
+            
+        Returns:
+            list: Diccionarios con los datos de las filas con título
+        """
+        try:
+            scraped = self.driver.execute_script(
+                _SCRAPE_ROWS_JS, rows, list(_TITLE_SELECTORS), list(_CELL_SELECTORS)
+            ) or []
+        except WebDriverException as e:
+            logger.debug(f"Lectura masiva de filas no disponible, se procesan una a una: {e}")
+            scraped = []
+            
+        if len(scraped) != len(rows):
+            scraped = [None] * len(rows)
+            
+        column_indices = table_info.get('columns', {})
+        issues = []
+        fallback_count = 0
+        
+        for index, (row, data) in enumerate(zip(rows, scraped)):
+            issue_data = self._build_issue_from_scrape(data, column_indices) if data else None
+            
+            if issue_data is None:
+                fallback_count += 1
+                try:
+                    issue_data = self._extract_row_data(row, index, table_info)
+                except Exception as row_e:
+                    logger.error(f"Error al procesar fila {index}: {row_e}")
+                    continue
+                    
+            if issue_data and issue_data.get('Title'):
+                issues.append(issue_data)
+                
+        if fallback_count:
+            logger.info(f"{fallback_count} de {len(rows)} filas requirieron extracción individual")
+        return issues
+        
+    def _build_issue_from_scrape(self, data, column_indices):
+        """
+        Construye los datos de un issue a partir de la lectura masiva de una fila
+        
+        Args:
+            data (dict): Candidatos a título ('titles') y valores de celda ('cells')
+            column_indices (dict): Índice de celda de cada campo
+            
+        Returns:
+            dict: Datos del issue, o None si la fila necesita extracción individual
+        """
+        cells = data.get('cells') or []
+        if len(cells) < 4:
+            return None
+            
+        title = None
+        for candidate in data.get('titles') or ():
+            title = self._clean_title_text(candidate)
+            if title:
+                break
+        if not title:
+            return None
+            
+        issue_data = {
+            'Title': title,
+            'Type': 'Issue',
+            'Priority': 'N/A',
+            'Status': 'N/A',
+            'Deadline': '',
+            'Due Date': 'N/A',
+            'Created By': 'N/A',
+            'Created On': 'N/A',
+            'Comment': '',
+            'SAP Category': '',
+            'Project': '',
+            'System ID': '',
+            'Language': '',
+            'Last Updated': '',
+            'Last Updated By': ''
+        }
+        
+        for field, idx in column_indices.items():
+            if idx is not None and idx < len(cells) and cells[idx]:
+                issue_data[field] = cells[idx]
+                
+        # Campos que _extract_row_data completaría con estrategias adicionales
+        if (issue_data['Type'] in ('', 'Issue') or issue_data['Priority'] == 'N/A'
+                or issue_data['Status'] == 'N/A' or issue_data['Due Date'] == 'N/A'
+                or issue_data['Created On'] == 'N/A'):
+            return None
+            
+        self._clean_issue_data(issue_data)
+        return issue_data
+        
     def _extract_row_data(self, row, row_index, table_info):
         """
         Extrae datos de una fila de la tabla con alta precisión
@@ -5418,20 +6089,8 @@ class SAPBrowser:
         Extrae el título de una fila usando múltiples técnicas
         """
         try:
-            # Lista de selectores para extraer el título
-            title_selectors = [
-                ".//a",  # Enlaces (común para títulos clickeables)
-                ".//span[contains(@class, 'title')]",  # Spans con clase title
-                ".//div[contains(@class, 'title')]",  # Divs con clase title
-                ".//div[@role='gridcell'][1]",  # Primera celda (suele ser el título)
-                ".//td[1]",  # Primera celda de tabla HTML
-                ".//*[contains(@id, 'title')]",  # Elementos con ID que contiene 'title'
-                ".//*[@title]",  # Elementos con atributo title
-                ".//span[@title]"  # Spans con atributo title
-            ]
-            
             # Probar cada selector
-            for selector in title_selectors:
+            for selector in _TITLE_SELECTORS:
                 try:
                     elements = row.find_elements(By.XPATH, selector)
                     for element in elements:
@@ -5488,16 +6147,8 @@ class SAPBrowser:
         Extrae todas las celdas de una fila
         """
         try:
-            # Lista de selectores para encontrar celdas
-            cell_selectors = [
-                ".//td",  # Celdas de tabla HTML
-                ".//div[@role='gridcell']",  # Celdas de grid SAP UI5
-                ".//div[contains(@class, 'sapMListCell')]",  # Celdas de lista SAP
-                "./div"  # Divs directos (para algunos tipos de fila)
-            ]
-            
             # Probar cada selector
-            for selector in cell_selectors:
+            for selector in _CELL_SELECTORS:
                 try:
                     cells = row.find_elements(By.XPATH, selector)
                     if cells and len(cells) > 1:
@@ -5620,14 +6271,7 @@ class SAPBrowser:
         try:
             if field == 'Type':
                 # Buscar específicamente el tipo de issue
-                type_selectors = [
-                    ".//div[contains(@class, 'type')]",
-                    ".//span[contains(@class, 'type')]",
-                    ".//div[@role='gridcell'][2]//span",  # Típicamente en la segunda columna
-                    ".//td[2]//span"
-                ]
-                
-                for selector in type_selectors:
+                for selector in _TYPE_SELECTORS:
                     try:
                         elements = row.find_elements(By.XPATH, selector)
                         for element in elements:
@@ -5638,12 +6282,9 @@ class SAPBrowser:
                         continue
                         
                 # Buscar posibles tipos en el texto
-                potential_types = ["Recommendation", "Implementation", "Question", 
-                                "Problem", "Incident", "Request", "Task", "Business Process"]
-                
                 row_text = row.text.lower() if hasattr(row, 'text') else ""
-                for potential_type in potential_types:
-                    if potential_type.lower() in row_text:
+                for potential_type, potential_lower in _POTENTIAL_TYPES:
+                    if potential_lower in row_text:
                         return potential_type
             
             return ""
@@ -5659,24 +6300,9 @@ class SAPBrowser:
         """
         try:
             # Buscar indicadores de prioridad
-            priority_indicators = [
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugeNegativeColor')]", "Very High"),
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugeCriticalColor')]", "High"),
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugeNeutralColor')]", "Medium"),
-                (By.XPATH, ".//span[contains(@class, 'sapMGaugePositiveColor')]", "Low"),
-                (By.XPATH, ".//span[contains(text(), 'Very High')]", "Very High"),
-                (By.XPATH, ".//span[contains(text(), 'High')]", "High"),
-                (By.XPATH, ".//span[contains(text(), 'Medium')]", "Medium"),
-                (By.XPATH, ".//span[contains(text(), 'Low')]", "Low"),
-                (By.XPATH, ".//span[contains(text(), 'very high')]", "Very High"),
-                (By.XPATH, ".//span[contains(text(), 'high')]", "High"),
-                (By.XPATH, ".//span[contains(text(), 'medium')]", "Medium"),
-                (By.XPATH, ".//span[contains(text(), 'low')]", "Low")
-            ]
-            
-            for locator, indicator_text in priority_indicators:
+            for xpath, indicator_text in _PRIORITY_INDICATORS:
                 try:
-                    elements = row.find_elements(locator)
+                    elements = row.find_elements(By.XPATH, xpath)
                     if elements:
                         return indicator_text
                 except:
@@ -5685,14 +6311,7 @@ class SAPBrowser:
             # Buscar en el texto de la fila
             row_text = row.text.lower() if hasattr(row, 'text') else ""
             
-            priority_keywords = {
-                "very high": "Very High",
-                "high": "High",
-                "medium": "Medium",
-                "low": "Low"
-            }
-            
-            for keyword, value in priority_keywords.items():
+            for keyword, value in _PRIORITY_KEYWORDS:
                 if keyword in row_text:
                     return value
                     
@@ -5709,14 +6328,7 @@ class SAPBrowser:
         """
         try:
             # Buscar elementos específicos de estado
-            status_selectors = [
-                ".//div[contains(@class, 'status')]",
-                ".//span[contains(@class, 'status')]",
-                ".//div[@role='gridcell'][3]",  # Típicamente en la tercera columna
-                ".//td[3]"
-            ]
-            
-            for selector in status_selectors:
+            for selector in _STATUS_SELECTORS:
                 try:
                     elements = row.find_elements(By.XPATH, selector)
                     for element in elements:
@@ -5727,12 +6339,9 @@ class SAPBrowser:
                     continue
                     
             # Buscar textos de estado comunes
-            status_texts = ["OPEN", "DONE", "READY FOR PUBLISHING", "IN PROGRESS", "CLOSED", "DRAFT", 
-                        "Open", "Done", "In Progress", "Closed"]
-            
-            for status in status_texts:
+            for status, status_xpath in _STATUS_TEXT_XPATHS:
                 try:
-                    elements = row.find_elements(By.XPATH, f".//*[contains(text(), '{status}')]")
+                    elements = row.find_elements(By.XPATH, status_xpath)
                     if elements:
                         for element in elements:
                             if element.is_displayed():
@@ -5761,32 +6370,14 @@ class SAPBrowser:
             result = {}
             
             # Buscar elementos que contengan fechas
-            date_selectors = [
-                ".//span[contains(@id, 'date')]",
-                ".//div[contains(@id, 'date')]",
-                ".//span[contains(@class, 'date')]",
-                ".//div[contains(@class, 'date')]",
-                ".//*[contains(text(), '/')]",  # Para fechas como MM/DD/YYYY
-                ".//*[contains(text(), '-')]"   # Para fechas como YYYY-MM-DD
-            ]
-            
             date_elements = []
-            for selector in date_selectors:
+            for selector in _DATE_SELECTORS:
                 try:
                     elements = row.find_elements(By.XPATH, selector)
                     date_elements.extend(elements)
                 except:
                     continue
             
-            # Patrones comunes para detectar fechas
-            date_patterns = [
-                r'\d{1,2}/\d{1,2}/\d{2,4}',        # MM/DD/YYYY o DD/MM/YYYY
-                r'\d{4}-\d{1,2}-\d{1,2}',          # YYYY-MM-DD
-                r'\d{1,2}-\d{1,2}-\d{2,4}',         # DD-MM-YYYY o MM-DD-YYYY
-                r'[A-Za-z]{3} \d{1,2}, \d{4}',     # MMM DD, YYYY
-                r'\d{1,2} [A-Za-z]{3} \d{4}'      # DD MMM YYYY
-            ]
-            
             # Si tenemos más de un elemento con fecha, asumir que el primero es Created On y el último Due Date
             if len(date_elements) >= 2:
                 created_text = date_elements[0].text.strip()
@@ -5800,12 +6391,10 @@ class SAPBrowser:
             # En cualquier caso, buscar patrones de fecha en el texto completo
             row_text = row.text if hasattr(row, 'text') else ""
             
-            import re
             dates_found = []
             
-            for pattern in date_patterns:
-                matches = re.findall(pattern, row_text)
-                dates_found.extend(matches)
+            for pattern in _DATE_PATTERNS:
+                dates_found.extend(pattern.findall(row_text))
             
             # Si encontramos fechas por patrón, usar la lógica de asignación
             if dates_found:
@@ -6296,10 +6885,7 @@ class SAPBrowser:
             all_issues = []
             
             # Actualizar la interfaz si existe
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Iniciando extracción robusta de issues...")
-                if self.root:
-                    self.root.update()
+            self._set_status("Iniciando extracción robusta de issues...")
             
             # 1. Asegurar que estamos en la pestaña correcta
             self._ensure_issues_tab_active()
@@ -6322,10 +6908,7 @@ class SAPBrowser:
                     logger.info(f"Procesando página {page_number}...")
                     
                     # Actualizar la interfaz
-                    if hasattr(self, 'status_var') and self.status_var:
-                        self.status_var.set(f"Procesando página {page_number}...")
-                        if self.root:
-                            self.root.update()
+                    self._set_status(f"Procesando página {page_number}...")
                     
                     # Extraer issues de la página actual
                     # 3.1 Cargar elementos en la página actual con scroll
@@ -6341,9 +6924,8 @@ class SAPBrowser:
                     # 3.3 Navegar a la siguiente página si existe
                     more_pages = self._navigate_to_next_page()
                     if more_pages:
+                        # _navigate_to_next_page ya esperó a que cargue la nueva página
                         page_number += 1
-                        # Esperar a que cargue la nueva página
-                        time.sleep(3)
                     else:
                         logger.info("No hay más páginas, finalizando extracción paginada.")
             else:
@@ -6380,20 +6962,14 @@ class SAPBrowser:
                 logger.info(f"Extracción robusta completada. Total de issues extraídos: {len(all_issues)}")
                 
                 # Actualizar la interfaz si existe
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set(f"Extracción completada. Issues extraídos: {len(all_issues)}")
-                    if self.root:
-                        self.root.update()
+                self._set_status(f"Extracción completada. Issues extraídos: {len(all_issues)}")
                 
                 return all_issues
             else:
                 logger.warning("No se encontraron issues para extraer")
                 
                 # Actualizar la interfaz si existe
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set("No se encontraron issues para extraer")
-                    if self.root:
-                        self.root.update()
+                self._set_status("No se encontraron issues para extraer")
                 
                 return []
         
@@ -6401,10 +6977,7 @@ class SAPBrowser:
             logger.error(f"Error en la extracción robusta de issues: {e}")
             
             # Actualizar la interfaz si existe
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set(f"Error: {e}")
-                if self.root:
-                    self.root.update()
+            self._set_status(f"Error: {e}")
             
             return []
 
@@ -6418,86 +6991,68 @@ class SAPBrowser:
         Asegura que estamos en la pestaña Issues
         """
         try:
-            # Verificar si ya estamos en la pestaña Issues
-            issues_active = False
-            
-            # Verificadores de pestaña activa
-            active_tab_selectors = [
-                "//div[@role='tab' and @aria-selected='true']//*[contains(text(), 'Issues')]",
-                "//li[@role='tab' and @aria-selected='true']//*[contains(text(), 'Issues')]",
-                "//div[contains(@class, 'sapMITBSelected')]//*[contains(text(), 'Issues')]"
+            # Verificar si ya estamos en la pestaña Issues (una sola consulta)
+            elements = self.driver.find_elements(By.XPATH, _ACTIVE_ISSUES_TAB_XPATH)
+            if elements and any(e.is_displayed() for e in elements):
+                logger.info("Ya estamos en la pestaña Issues")
+                return
+            
+            logger.info("No estamos en la pestaña Issues, intentando navegar a ella...")
+            
+            # Intentar hacer clic en la pestaña Issues
+            issues_tab_selectors = [
+                "//div[@role='tab']//*[contains(text(), 'Issues')]",
+                "//li[@role='tab']//*[contains(text(), 'Issues')]",
+                "//div[contains(@class, 'sapMITBText')][contains(text(), 'Issues')]",
+                "//span[contains(text(), 'Issues')]"
             ]
             
-            for selector in active_tab_selectors:
+            tab_clicked = False
+            for selector in issues_tab_selectors:
                 elements = self.driver.find_elements(By.XPATH, selector)
-                if elements and any(e.is_displayed() for e in elements):
-                    logger.info("Ya estamos en la pestaña Issues")
-                    issues_active = True
+                for element in elements:
+                    if element.is_displayed():
+                        # Hacer scroll para asegurar visibilidad
+                        self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
+                        logger.info("Clic en pestaña Issues realizado")
+                        tab_clicked = True
+                        break
+                
+                if tab_clicked:
                     break
             
-            if not issues_active:
-                logger.info("No estamos en la pestaña Issues, intentando navegar a ella...")
-                
-                # Intentar hacer clic en la pestaña Issues
-                issues_tab_selectors = [
-                    "//div[@role='tab']//*[contains(text(), 'Issues')]",
-                    "//li[@role='tab']//*[contains(text(), 'Issues')]",
-                    "//div[contains(@class, 'sapMITBText')][contains(text(), 'Issues')]",
-                    "//span[contains(text(), 'Issues')]"
-                ]
-                
-                tab_clicked = False
-                for selector in issues_tab_selectors:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            # Hacer scroll para asegurar visibilidad
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                            time.sleep(0.5)
-                            
-                            # Hacer clic
-                            self.driver.execute_script("arguments[0].click();", element)
-                            logger.info("Clic en pestaña Issues realizado")
-                            tab_clicked = True
-                            
-                            # Esperar a que la pestaña se active
-                            time.sleep(3)
-                            break
-                    
-                    if tab_clicked:
-                        break
+            if not tab_clicked:
+                logger.warning("No se pudo hacer clic en la pestaña Issues")
                 
-                if not tab_clicked:
-                    logger.warning("No se pudo hacer clic en la pestaña Issues")
-                    
-                    # Intentar JavaScript directo como último recurso
-                    self.driver.execute_script("""
-                        (function() {
-                            // Intentar encontrar y hacer clic en la pestaña de issues
-                            const tabTexts = ['Issues', 'Problemas', 'Incidentes', 'Incidencias'];
+                # Intentar JavaScript directo como último recurso
+                self.driver.execute_script("""
+                    (function() {
+                        // Intentar encontrar y hacer clic en la pestaña de issues
+                        const tabTexts = ['Issues', 'Problemas', 'Incidentes', 'Incidencias'];
+                        
+                        for (const text of tabTexts) {
+                            const elements = Array.from(document.querySelectorAll('*')).filter(el => 
+                                el.offsetParent !== null && 
+                                el.textContent.includes(text) &&
+                                (el.role === 'tab' || 
+                                el.parentElement?.role === 'tab' || 
+                                el.classList.contains('sapMITBText'))
+                            );
                             
-                            for (const text of tabTexts) {
-                                const elements = Array.from(document.querySelectorAll('*')).filter(el => 
-                                    el.offsetParent !== null && 
-                                    el.textContent.includes(text) &&
-                                    (el.role === 'tab' || 
-                                    el.parentElement?.role === 'tab' || 
-                                    el.classList.contains('sapMITBText'))
-                                );
-                                
-                                if (elements.length > 0) {
-                                    // Hacer clic en el primer elemento encontrado
-                                    elements[0].click();
-                                    return true;
-                                }
+                            if (elements.length > 0) {
+                                // Hacer clic en el primer elemento encontrado
+                                elements[0].click();
+                                return true;
                             }
-                            
-                            return false;
-                        })();
-                    """)
-            
-            # Esperar a que cargue la pestaña
-            time.sleep(2)
+                        }
+                        
+                        return false;
+                    })();
+                """)
+        
+            # Esperar a que la pestaña se active y aparezcan las filas
+            self.wait_until(EC.presence_of_element_located((By.XPATH, _ACTIVE_ISSUES_TAB_XPATH)), 5, poll=0.2)
+            self.wait_until(EC.presence_of_element_located((By.XPATH, _TABLE_ROWS_XPATH)), 3, poll=0.2)
         
         except Exception as e:
             logger.error(f"Error al asegurar pestaña Issues activa: {e}")
@@ -6546,15 +7101,12 @@ class SAPBrowser:
             # Hacer clic en el botón "Next"
             try:
                 # Hacer scroll para asegurar visibilidad
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                time.sleep(0.5)
-                
-                # Hacer clic
-                self.driver.execute_script("arguments[0].click();", next_button)
+                before = self._table_signature()
+                self.driver.execute_script(SCROLL_AND_CLICK_JS, next_button)
                 logger.info("Clic en botón 'Next' realizado")
                 
-                # Esperar a que cargue la nueva página
-                time.sleep(2)
+                # Esperar a que cargue la nueva página (termina en cuanto cambia la tabla)
+                self._wait_for_table_change(before)
                 
                 # Verificar que realmente cambiamos de página
                 # Podríamos verificar cambios en el contenido, pero por ahora solo validaremos
@@ -6603,19 +7155,8 @@ class SAPBrowser:
             # 2. Detectar estructura de la tabla
             table_info = self._detect_table_structure(rows[0])
             
-            # 3. Extraer datos de cada fila
-            page_issues = []
-            
-            for index, row in enumerate(rows):
-                try:
-                    # Extraer datos de la fila
-                    issue_data = self._extract_row_data(row, index, table_info)
-                    
-                    # Verificar si obtuvimos datos válidos
-                    if issue_data and issue_data.get('Title'):
-                        page_issues.append(issue_data)
-                except Exception as row_e:
-                    logger.error(f"Error al procesar fila {index}: {row_e}")
+            # 3. Extraer datos de todas las filas (lectura masiva con JavaScript)
+            page_issues = self._extract_rows(rows, table_info)
             
             logger.info(f"Se extrajeron {len(page_issues)} issues de la página actual")
             return page_issues
@@ -6653,37 +7194,11 @@ class SAPBrowser:
             # 2. Detectar estructura de la tabla
             table_info = self._detect_table_structure(rows[0])
             
-            # 3. Extraer datos de cada fila
-            all_issues = []
-            processed_count = 0
-            
             # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set(f"Procesando {len(rows)} filas...")
-                if self.root:
-                    self.root.update()
+            self._set_status(f"Procesando {len(rows)} filas...")
             
-            for index, row in enumerate(rows):
-                try:
-                    # Actualizar estado periódicamente
-                    if index % 10 == 0 and hasattr(self, 'status_var') and self.status_var:
-                        self.status_var.set(f"Procesando fila {index+1} de {len(rows)}...")
-                        if self.root:
-                            self.root.update()
-                    
-                    # Extraer datos de la fila
-                    issue_data = self._extract_row_data(row, index, table_info)
-                    
-                    # Verificar si obtuvimos datos válidos
-                    if issue_data and issue_data.get('Title'):
-                        all_issues.append(issue_data)
-                        processed_count += 1
-                        
-                        # Logging periódico
-                        if processed_count % 10 == 0:
-                            logger.info(f"Procesadas {processed_count} filas hasta ahora")
-                except Exception as row_e:
-                    logger.error(f"Error al procesar fila {index}: {row_e}")
+            # 3. Extraer datos de todas las filas (lectura masiva con JavaScript)
+            all_issues = self._extract_rows(rows, table_info)
             
             logger.info(f"Se extrajeron {len(all_issues)} issues en total")
             return all_issues
@@ -6840,11 +7355,7 @@ class SAPBrowser:
                         for element in elements:
                             if element.is_displayed():
                                 # Hacer scroll para asegurar visibilidad
-                                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                                time.sleep(0.5)
-                                
-                                # Hacer clic
-                                self.driver.execute_script("arguments[0].click();", element)
+                                self.driver.execute_script(SCROLL_AND_CLICK_JS, element)
                                 logger.info("Clic en pestaña Issues realizado")
                                 tab_clicked = True
                                 time.sleep(2)  # Esperar a que se actualice
@@ -175,8 +175,13 @@ def save_json_config(file_path, config_data):
         # Asegurar que el directorio existe
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=4)
+        # Serializar de una vez en formato compacto y escribir en un archivo
+        # temporal que se renombra: sin fsync, pero sin dejar un JSON a medias
+        data = json.dumps(config_data, separators=(',', ':'))
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8', buffering=8192) as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
         return True
     except Exception as e:
         logging.error(f"Error al guardar configuración en {file_path}: {e}")
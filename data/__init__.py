@@ -5,8 +5,8 @@ Este módulo contiene clases para la gestión de datos, incluyendo
 el acceso a la base de datos SQLite y la manipulación de archivos Excel.
 """
 
-from data.database_manager import DatabaseManager
+from data.database_manager import DatabaseManager, format_client_row, format_project_row, issue_fingerprint
 from data.excel_manager import ExcelManager
 
 # Facilitar la importación directa
-__all__ = ['DatabaseManager', 'ExcelManager']
\ No newline at end of file
+__all__ = ['DatabaseManager', 'ExcelManager', 'format_client_row', 'format_project_row', 'issue_fingerprint']
\ No newline at end of file
@@ -3,11 +3,232 @@ Módulo para la gestión de la base de datos SQLite para clientes y proyectos.
 """
 
 import os
-import re
+import hashlib
 import sqlite3
+import threading
 from utils.logger_config import logger
 from config.settings import DB_PATH
 
+# Valor de db_path que selecciona la base de datos en memoria (modo efímero/pruebas)
+MEMORY_DB_PATH = ":memory:"
+
+# Versión del esquema registrada en PRAGMA user_version
+SCHEMA_VERSION = 4
+
+# Esquema completo, aplicado de una sola vez cuando la base de datos no está al día.
+# last_used guarda segundos desde epoch (INTEGER); las filas de versiones anteriores
+# con texto ISO-8601 se convierten en el mismo script.
+_SCHEMA_SQL = f"""
+BEGIN;
+CREATE TABLE IF NOT EXISTS clients (
+    erp_number TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    business_partner TEXT,
+    last_used INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+CREATE TABLE IF NOT EXISTS projects (
+    project_id TEXT PRIMARY KEY,
+    client_erp TEXT NOT NULL,
+    name TEXT NOT NULL,
+    engagement_case TEXT,
+    last_used INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    FOREIGN KEY (client_erp) REFERENCES clients(erp_number)
+);
+UPDATE clients SET last_used = CAST(strftime('%s', last_used) AS INTEGER)
+    WHERE typeof(last_used) = 'text';
+UPDATE projects SET last_used = CAST(strftime('%s', last_used) AS INTEGER)
+    WHERE typeof(last_used) = 'text';
+CREATE INDEX IF NOT EXISTS idx_clients_last_used ON clients(last_used);
+CREATE INDEX IF NOT EXISTS idx_projects_client_last_used ON projects(client_erp, last_used);
+CREATE TABLE IF NOT EXISTS extracted_issues (
+    target TEXT NOT NULL,
+    erp_number TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    updated_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    PRIMARY KEY (target, erp_number, project_id, issue_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS extraction_targets (
+    target TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+PRAGMA user_version = {SCHEMA_VERSION};
+COMMIT;
+"""
+
+# PRAGMA de sesión para el archivo en disco: WAL permite leer (listados de los
+# combobox) mientras otro hilo escribe, y con synchronous=NORMAL cada commit no
+# fuerza un fsync. No aplican a la base de datos en memoria.
+_FILE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+)
+_SESSION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",  # Asegurar que se verifican las claves foráneas
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",  # Hasta 64 MB de caché de páginas
+)
+
+# Sentencias SQL utilizadas por DatabaseManager
+_SQL_GET_CLIENTS = "SELECT erp_number, name FROM clients ORDER BY last_used DESC"
+
+_SQL_GET_PROJECTS = """
+    SELECT project_id, name 
+    FROM projects 
+    WHERE client_erp = ? 
+    ORDER BY last_used DESC
+"""
+
+# Variantes que devuelven directamente el texto de los combobox ("id - nombre"),
+# formateado por SQLite en lugar de construir cada cadena en Python
+_SQL_GET_CLIENT_LABELS = "SELECT erp_number || ' - ' || name FROM clients ORDER BY last_used DESC"
+
+_SQL_GET_PROJECT_LABELS = """
+    SELECT project_id || ' - ' || name
+    FROM projects
+    WHERE client_erp = ?
+    ORDER BY last_used DESC
+"""
+
+_SQL_GET_CLIENT_NAME = "SELECT name FROM clients WHERE erp_number = ?"
+
+_SQL_GET_PROJECT_NAME = "SELECT name FROM projects WHERE project_id = ?"
+
+# Estado de extracción: huella de cada issue ya escrito en un Excel destino.
+# La clave primaria (target, erp_number, project_id, issue_id) sirve también de
+# índice para la consulta por par cliente/proyecto. extraction_targets guarda la
+# fecha de modificación y el tamaño del libro tras la última escritura propia:
+# si no coinciden, el archivo cambió por otra vía y el estado ya no lo describe.
+_SQL_GET_EXTRACTED = """
+    SELECT issue_id, fingerprint
+    FROM extracted_issues
+    WHERE target = ? AND erp_number = ? AND project_id = ?
+"""
+
+_SQL_GET_TARGET_STAMP = "SELECT mtime_ns, size FROM extraction_targets WHERE target = ?"
+
+_SQL_UPSERT_TARGET_STAMP = """
+    INSERT INTO extraction_targets (target, mtime_ns, size) VALUES (?, ?, ?)
+    ON CONFLICT (target) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size
+"""
+
+_SQL_DELETE_EXTRACTED = "DELETE FROM extracted_issues WHERE target = ?"
+
+_SQL_DELETE_TARGET_STAMP = "DELETE FROM extraction_targets WHERE target = ?"
+
+_SQL_UPSERT_EXTRACTED = """
+    INSERT INTO extracted_issues (target, erp_number, project_id, issue_id, fingerprint, updated_at)
+    VALUES (?, ?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+    ON CONFLICT (target, erp_number, project_id, issue_id) DO UPDATE SET
+        fingerprint = excluded.fingerprint,
+        updated_at = excluded.updated_at
+"""
+
+# Con RETURNING la sentencia solo devuelve fila si el cliente era nuevo
+_SQL_INSERT_CLIENT = """
+    INSERT OR IGNORE INTO clients (erp_number, name, business_partner, last_used) 
+    VALUES (?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+    RETURNING erp_number
+"""
+
+_SQL_UPDATE_CLIENT = """
+    UPDATE clients 
+    SET name = ?, business_partner = ?, last_used = CAST(strftime('%s', 'now') AS INTEGER) 
+    WHERE erp_number = ?
+"""
+
+_SQL_INSERT_PROJECT = """
+    INSERT OR IGNORE INTO projects (project_id, client_erp, name, engagement_case, last_used) 
+    VALUES (?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+"""
+
+_SQL_UPDATE_PROJECT = """
+    UPDATE projects 
+    SET client_erp = ?, name = ?, engagement_case = ?, last_used = CAST(strftime('%s', 'now') AS INTEGER) 
+    WHERE project_id = ?
+"""
+
+# RETURNING indica si la fila existía sin una consulta SELECT adicional
+_SQL_UPDATE_CLIENT_USAGE = """
+    UPDATE clients 
+    SET last_used = CAST(strftime('%s', 'now') AS INTEGER) 
+    WHERE erp_number = ?
+    RETURNING erp_number
+"""
+
+_SQL_UPDATE_PROJECT_USAGE = """
+    UPDATE projects 
+    SET last_used = CAST(strftime('%s', 'now') AS INTEGER) 
+    WHERE project_id = ?
+    RETURNING project_id
+"""
+
+
+def format_client_row(row):
+    """
+    Formatea una fila (erp_number, name) para mostrarla en la interfaz
+    
+    Args:
+        row (tuple): Tupla (erp_number, name) devuelta por get_clients
+        
+    Returns:
+        str: String con formato "erp_number - name"
+    """
+    return f"{row[0]} - {row[1]}"
+
+
+def format_project_row(row):
+    """
+    Formatea una fila (project_id, name) para mostrarla en la interfaz
+    
+    Args:
+        row (tuple): Tupla (project_id, name) devuelta por get_projects
+        
+    Returns:
+        str: String con formato "project_id - name"
+    """
+    return f"{row[0]} - {row[1]}"
+
+
+# Campos que el Excel compara para decidir si un issue existente cambió
+_FINGERPRINT_FIELDS = ("Status", "Priority", "Type", "Due Date", "Deadline", "Created By", "Created On")
+
+
+def issue_fingerprint(issue):
+    """
+    Calcula la huella de los campos de un issue que se siguen en el Excel
+    
+    Args:
+        issue (dict): Datos del issue extraído
+        
+    Returns:
+        str: Resumen hexadecimal; cambia si cambia alguno de los campos seguidos
+    """
+    payload = "\x1f".join(str(issue.get(field, "")) for field in _FINGERPRINT_FIELDS)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def file_stamp(path):
+    """
+    Devuelve la firma (fecha de modificación en ns, tamaño) del Excel destino
+    
+    No se cachea: la firma sirve precisamente para detectar cambios en el archivo.
+    
+    Args:
+        path (str): Ruta del archivo
+        
+    Returns:
+        tuple: (mtime_ns, size), o None si el archivo no existe
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 class DatabaseManager:
     """Clase dedicada al manejo de la base de datos de clientes y proyectos"""
     
@@ -18,79 +239,156 @@ class DatabaseManager:
         Args:
             db_path (str, optional): Ruta al archivo de base de datos. Si es None, 
                                      se utiliza la ruta predeterminada en DB_PATH.
+                                     Con ":memory:" (o la variable de entorno
+                                     ELKIN_INMEMORY=1) se usa una base de datos en
+                                     memoria que no se persiste al cerrar la aplicación.
         """
         if db_path is None:
-            db_path = DB_PATH
+            db_path = MEMORY_DB_PATH if os.environ.get("ELKIN_INMEMORY") == "1" else DB_PATH
             
         self.db_path = db_path
+        self.in_memory = db_path == MEMORY_DB_PATH
+        self._memory_uri = None
+        if self.in_memory:
+            self._memory_uri = f"file:sap_extraction_{id(self)}?mode=memory&cache=shared"
+        
+        # Caché en memoria de los listados; se invalida en cada escritura
+        self._clients_cache = None
+        self._projects_cache = {}
+        self._client_labels = None
+        self._project_labels = {}
+        
+        # Conexión única reutilizada por todos los métodos. También mantiene viva
+        # la base de datos en memoria mientras exista el objeto.
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        
         self.setup_database()
     
+    def _connect(self):
+        """
+        Abre una conexión a la base de datos con los PRAGMA de sesión aplicados
+        
+        Returns:
+            sqlite3.Connection: Conexión lista para usar
+        """
+        if self.in_memory:
+            conn = sqlite3.connect(self._memory_uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            for pragma in _FILE_PRAGMAS:
+                conn.execute(pragma)
+        for pragma in _SESSION_PRAGMAS:
+            conn.execute(pragma)
+        # Filas como tuplas simples: los listados se cachean tal cual sin conversión
+        conn.row_factory = None
+        return conn
+    
+    def _execute(self, sql, params=(), *, commit=False, error_msg="Error SQL"):
+        """
+        Ejecuta una sentencia sobre la conexión compartida
+        
+        Centraliza el bloqueo entre hilos, la transacción y el manejo de errores
+        de todos los métodos de acceso a datos.
+        
+        Args:
+            sql (str): Sentencia SQL a ejecutar
+            params (tuple, optional): Parámetros de la sentencia
+            commit (bool, optional): Si es True, se ejecuta dentro de una transacción
+                                     que se confirma o se revierte al terminar
+            error_msg (str, optional): Prefijo del mensaje registrado si hay error
+            
+        Returns:
+            list: Filas devueltas por la sentencia (SELECT o RETURNING), o None si
+                  ocurrió un error
+        """
+        try:
+            with self._lock:
+                if commit:
+                    with self._conn:
+                        # Las filas de RETURNING deben leerse antes de confirmar la transacción
+                        return self._conn.execute(sql, params).fetchall()
+                return self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"{error_msg}: {e}")
+            return None
+    
+    def _execute_many(self, statements, *, error_msg="Error SQL"):
+        """
+        Ejecuta varias sentencias dentro de una misma transacción
+        
+        Args:
+            statements (iterable): Pares (sql, params) a ejecutar en orden
+            error_msg (str, optional): Prefijo del mensaje registrado si hay error
+            
+        Returns:
+            list: Filas devueltas por cada sentencia, o None si ocurrió un error
+                  (en ese caso la transacción se revierte completa)
+        """
+        try:
+            with self._lock, self._conn:
+                return [self._conn.execute(sql, params).fetchall() for sql, params in statements]
+        except sqlite3.Error as e:
+            logger.error(f"{error_msg}: {e}")
+            return None
+    
+    def close(self):
+        """Cierra la conexión con la base de datos; las llamadas posteriores fallarán"""
+        with self._lock:
+            self._conn.close()
+    
     def setup_database(self):
         """
         Configura la estructura de la base de datos
         
+        El esquema solo se aplica si PRAGMA user_version indica que la base
+        de datos aún no está inicializada; en arranques posteriores basta con
+        leer la versión.
+        
         Returns:
             bool: True si la configuración fue exitosa, False en caso contrario
         """
-        conn = None
+        rows = self._execute("PRAGMA user_version", error_msg="Error al configurar la base de datos")
+        if rows is None:
+            return False
+        if rows[0][0] >= SCHEMA_VERSION:
+            return True
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Crear tablas si no existen
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS clients (
-                erp_number TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                business_partner TEXT,
-                last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS projects (
-                project_id TEXT PRIMARY KEY,
-                client_erp TEXT NOT NULL,
-                name TEXT NOT NULL,
-                engagement_case TEXT,
-                last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (client_erp) REFERENCES clients(erp_number)
-            )
-            ''')
-
-            conn.commit()
+            with self._lock:
+                # Crear tablas e índices (o migrar last_used a INTEGER) en un único script
+                self._conn.executescript(_SCHEMA_SQL)
             logger.debug("Base de datos configurada correctamente")
             return True
         except sqlite3.Error as e:
             logger.error(f"Error al configurar la base de datos: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
 
         
+    def invalidate_cache(self):
+        """
+        Descarta los listados de clientes y proyectos guardados en memoria.
+        Útil si la base de datos se modifica fuera de este administrador.
+        """
+        self._clients_cache = None
+        self._projects_cache.clear()
+        self._client_labels = None
+        self._project_labels.clear()
+        
     def get_clients(self):
         """
         Obtiene la lista de clientes ordenados por último uso
         
         Returns:
-            list: Lista de strings con formato "erp_number - name"
+            list: Lista de tuplas (erp_number, name). Usar format_client_row
+                  para obtener el texto a mostrar.
         """
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT erp_number, name FROM clients ORDER BY last_used DESC")
-            clients = cursor.fetchall()
-
-            return [f"{erp} - {name}" for erp, name in clients]
-        except sqlite3.Error as e:
-            logger.error(f"Error al obtener clientes: {e}")
-            return []
-        finally:
-            if conn:
-                conn.close()
+        if self._clients_cache is None:
+            rows = self._execute(_SQL_GET_CLIENTS, error_msg="Error al obtener clientes")
+            if rows is None:
+                return []
+            self._clients_cache = rows
+        return list(self._clients_cache)
     
     def get_projects(self, client_erp):
         """
@@ -100,31 +398,74 @@ class DatabaseManager:
             client_erp (str): Número ERP del cliente
             
         Returns:
-            list: Lista de strings con formato "project_id - name"
+            list: Lista de tuplas (project_id, name). Usar format_project_row
+                  para obtener el texto a mostrar.
         """
         if not client_erp:
             return []
         
-        conn = None
-        try:    
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT project_id, name 
-                FROM projects 
-                WHERE client_erp = ? 
-                ORDER BY last_used DESC
-            """, (client_erp,))
-
-            projects = cursor.fetchall()
-            return [f"{pid} - {name}" for pid, name in projects]
-        except sqlite3.Error as e:
-            logger.error(f"Error al obtener proyectos: {e}")
-            return []
-        finally:
-            if conn:
-                conn.close()
+        cached = self._projects_cache.get(client_erp)
+        if cached is None:
+            cached = self._execute(_SQL_GET_PROJECTS, (client_erp,), error_msg="Error al obtener proyectos")
+            if cached is None:
+                return []
+            self._projects_cache[client_erp] = cached
+        return list(cached)
+    
+    def get_client_labels(self):
+        """
+        Obtiene los textos "erp_number - name" de los clientes, listos para
+        asignarlos a los valores de un combobox
+        
+        Returns:
+            tuple: Textos ordenados por último uso (tupla vacía si hay error)
+        """
+        if self._client_labels is None:
+            rows = self._execute(_SQL_GET_CLIENT_LABELS, error_msg="Error al obtener clientes")
+            if rows is None:
+                return ()
+            self._client_labels = tuple(row[0] for row in rows)
+        return self._client_labels
+    
+    def get_project_labels(self, client_erp):
+        """
+        Obtiene los textos "project_id - name" de los proyectos de un cliente,
+        listos para asignarlos a los valores de un combobox
+        
+        Args:
+            client_erp (str): Número ERP del cliente
+            
+        Returns:
+            tuple: Textos ordenados por último uso (tupla vacía si hay error)
+        """
+        if not client_erp:
+            return ()
+        
+        labels = self._project_labels.get(client_erp)
+        if labels is None:
+            rows = self._execute(_SQL_GET_PROJECT_LABELS, (client_erp,), error_msg="Error al obtener proyectos")
+            if rows is None:
+                return ()
+            labels = self._project_labels[client_erp] = tuple(row[0] for row in rows)
+        return labels
+    
+    def get_names(self, erp_number, project_id):
+        """
+        Obtiene los nombres de un cliente y un proyecto a partir de sus IDs
+        
+        Args:
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            
+        Returns:
+            tuple: (nombre_cliente, nombre_proyecto); cadena vacía si no se encuentra
+        """
+        error_msg = "Error al obtener nombres de cliente/proyecto"
+        client_rows = self._execute(_SQL_GET_CLIENT_NAME, (erp_number,), error_msg=error_msg)
+        project_rows = self._execute(_SQL_GET_PROJECT_NAME, (project_id,), error_msg=error_msg)
+        
+        return (client_rows[0][0] if client_rows else "",
+                project_rows[0][0] if project_rows else "")
     
     def save_client(self, erp_number, name, business_partner=""):
         """
@@ -151,52 +492,24 @@ class DatabaseManager:
         name = name.strip()[:100]  # Limitar longitud para prevenir ataques
         business_partner = (business_partner or "").strip()[:50]
         
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("PRAGMA foreign_keys = ON")  # Asegurar que se verifican las claves foráneas
-            cursor = conn.cursor()
-
-            # Verificar si el cliente ya existe
-            cursor.execute("SELECT erp_number FROM clients WHERE erp_number = ?", (erp_number,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Actualizar cliente existente
-                cursor.execute("""
-                    UPDATE clients 
-                    SET name = ?, business_partner = ?, last_used = CURRENT_TIMESTAMP 
-                    WHERE erp_number = ?
-                """, (name, business_partner, erp_number))
-                logger.info(f"Cliente actualizado: {erp_number} - {name}")
-            else:
-                # Insertar nuevo cliente
-                cursor.execute("""
-                    INSERT INTO clients (erp_number, name, business_partner, last_used) 
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                """, (erp_number, name, business_partner))
-                logger.info(f"Nuevo cliente creado: {erp_number} - {name}")
-
-            conn.commit()
-            return True
-        except sqlite3.IntegrityError as ie:
-            logger.error(f"Error de integridad de datos al guardar cliente: {ie}")
-            if conn:
-                conn.rollback()
-            return False
-        except sqlite3.Error as e:
-            logger.error(f"Error SQL al guardar cliente: {e}")
-            if conn:
-                conn.rollback()
+        # Insertar si no existe y actualizar siempre, sin consultar antes la existencia
+        results = self._execute_many((
+            (_SQL_INSERT_CLIENT, (erp_number, name, business_partner)),
+            (_SQL_UPDATE_CLIENT, (name, business_partner, erp_number)),
+        ), error_msg="Error SQL al guardar cliente")
+        if results is None:
             return False
-        except Exception as e:
-            logger.error(f"Error general al guardar cliente: {e}")
-            if conn:
-                conn.rollback()
-            return False
-        finally:
-            if conn:
-                conn.close()
+        
+        # Invalidar después de escribir, para que una lectura concurrente no
+        # vuelva a llenar el caché con los datos anteriores
+        self._clients_cache = None
+        self._client_labels = None
+        
+        if results[0]:
+            logger.info(f"Nuevo cliente creado: {erp_number} - {name}")
+        else:
+            logger.info(f"Cliente actualizado: {erp_number} - {name}")
+        return True
                 
     def save_project(self, project_id, client_erp, name, engagement_case=""):
         """
@@ -215,39 +528,18 @@ class DatabaseManager:
             logger.error(f"ID de proyecto o cliente inválido: {project_id}, {client_erp}")
             return False
         
-        conn = None
-        try:    
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Verificar si el proyecto ya existe
-            cursor.execute("SELECT * FROM projects WHERE project_id = ?", (project_id,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Actualizar proyecto existente
-                cursor.execute("""
-                    UPDATE projects 
-                    SET client_erp = ?, name = ?, engagement_case = ?, last_used = CURRENT_TIMESTAMP 
-                    WHERE project_id = ?
-                """, (client_erp, name, engagement_case, project_id))
-            else:
-                # Insertar nuevo proyecto
-                cursor.execute("""
-                    INSERT INTO projects (project_id, client_erp, name, engagement_case, last_used) 
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (project_id, client_erp, name, engagement_case))
-
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Error al guardar proyecto en BD: {e}")
-            if conn:
-                conn.rollback()
+        # Insertar si no existe y actualizar siempre, sin consultar antes la existencia
+        results = self._execute_many((
+            (_SQL_INSERT_PROJECT, (project_id, client_erp, name, engagement_case)),
+            (_SQL_UPDATE_PROJECT, (client_erp, name, engagement_case, project_id)),
+        ), error_msg="Error al guardar proyecto en BD")
+        if results is None:
             return False
-        finally:
-            if conn:
-                conn.close()
+        
+        # El proyecto puede cambiar de cliente, así que se descarta todo el caché de proyectos
+        self._projects_cache.clear()
+        self._project_labels.clear()
+        return True
     
     def update_client_usage(self, erp_number):
         """
@@ -257,32 +549,21 @@ class DatabaseManager:
             erp_number (str): Número ERP del cliente
             
         Returns:
-            bool: True si la actualización fue exitosa, False en caso contrario
+            bool: True si el cliente existía y fue actualizado, False en caso contrario
         """
         if not self.validate_input(erp_number, "erp"):
             return False
         
-        conn = None
-        try:    
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                UPDATE clients 
-                SET last_used = CURRENT_TIMESTAMP 
-                WHERE erp_number = ?
-            """, (erp_number,))
-            
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Error al actualizar uso de cliente: {e}")
-            if conn:
-                conn.rollback()
+        rows = self._execute(_SQL_UPDATE_CLIENT_USAGE, (erp_number,), commit=True,
+                             error_msg="Error al actualizar uso de cliente")
+        if rows is not None:
+            self._clients_cache = None
+            self._client_labels = None
+        if not rows:
+            if rows is not None:
+                logger.debug(f"Cliente no encontrado al actualizar uso: {erp_number}")
             return False
-        finally:
-            if conn:
-                conn.close()
+        return True
     
     def update_project_usage(self, project_id):
         """
@@ -292,32 +573,95 @@ class DatabaseManager:
             project_id (str): ID del proyecto
             
         Returns:
-            bool: True si la actualización fue exitosa, False en caso contrario
+            bool: True si el proyecto existía y fue actualizado, False en caso contrario
         """
         if not self.validate_input(project_id, "project"):
             return False
         
-        conn = None
-        try:    
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                UPDATE projects 
-                SET last_used = CURRENT_TIMESTAMP 
-                WHERE project_id = ?
-            """, (project_id,))
+        rows = self._execute(_SQL_UPDATE_PROJECT_USAGE, (project_id,), commit=True,
+                             error_msg="Error al actualizar uso de proyecto")
+        if rows is not None:
+            self._projects_cache.clear()
+            self._project_labels.clear()
+        if not rows:
+            if rows is not None:
+                logger.debug(f"Proyecto no encontrado al actualizar uso: {project_id}")
+            return False
+        return True
+    
+    def get_extracted_fingerprints(self, target, erp_number, project_id):
+        """
+        Obtiene las huellas de los issues ya escritos para un cliente y proyecto
+        
+        Args:
+            target (str): Ruta del archivo Excel destino
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            
+        Returns:
+            dict: issue_id -> huella (vacío si no hay estado o hubo error)
+        """
+        rows = self._execute(_SQL_GET_EXTRACTED, (target, erp_number, project_id),
+                             error_msg="Error al obtener el estado de extracción")
+        return dict(rows) if rows else {}
+    
+    def get_extraction_stamp(self, target):
+        """
+        Obtiene la firma del Excel destino registrada tras la última escritura
+        
+        Args:
+            target (str): Ruta del archivo Excel destino
             
-            conn.commit()
+        Returns:
+            tuple: (mtime_ns, size), o None si no hay estado para ese archivo
+        """
+        rows = self._execute(_SQL_GET_TARGET_STAMP, (target,),
+                             error_msg="Error al obtener el estado de extracción")
+        return tuple(rows[0]) if rows else None
+    
+    def save_extracted_issues(self, target, erp_number, project_id, fingerprints, stamp, reset=False):
+        """
+        Registra (o actualiza) las huellas de los issues escritos en el Excel
+        
+        Args:
+            target (str): Ruta del archivo Excel destino
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            fingerprints (dict): issue_id -> huella
+            stamp (tuple): (mtime_ns, size) del archivo después de la escritura
+            reset (bool): Si es True, se descarta antes todo el estado del archivo
+                          (el libro había cambiado fuera de la aplicación)
+            
+        Returns:
+            bool: True si se guardó el estado, False en caso contrario
+        """
+        params = [(target, erp_number, project_id, issue_id, fingerprint)
+                  for issue_id, fingerprint in fingerprints.items()]
+        try:
+            with self._lock, self._conn:
+                if reset:
+                    self._conn.execute(_SQL_DELETE_EXTRACTED, (target,))
+                self._conn.executemany(_SQL_UPSERT_EXTRACTED, params)
+                self._conn.execute(_SQL_UPSERT_TARGET_STAMP, (target, *stamp))
             return True
-        except Exception as e:
-            logger.error(f"Error al actualizar uso de proyecto: {e}")
-            if conn:
-                conn.rollback()
+        except sqlite3.Error as e:
+            logger.error(f"Error al guardar el estado de extracción: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
+    
+    def clear_extraction_state(self, target):
+        """
+        Descarta el estado de extracción de un Excel destino
+        
+        Args:
+            target (str): Ruta del archivo Excel destino
+            
+        Returns:
+            bool: True si se borró el estado, False si ocurrió un error
+        """
+        return self._execute_many((
+            (_SQL_DELETE_EXTRACTED, (target,)),
+            (_SQL_DELETE_TARGET_STAMP, (target,)),
+        ), error_msg="Error al borrar el estado de extracción") is not None
     
     @staticmethod
     def validate_input(input_str, input_type="general"):
@@ -331,12 +675,13 @@ class DatabaseManager:
         Returns:
             bool: True si la validación es exitosa, False en caso contrario
         """
-        if input_type == "erp":
-            # Solo permitir dígitos para ERP
-            return bool(re.match(r'^\d+$', str(input_str)))
-        elif input_type == "project":
-            # Solo permitir dígitos para ID de proyecto
-            return bool(re.match(r'^\d+$', str(input_str)))
+        if input_type in ("erp", "project"):
+            # Solo permitir dígitos para ERP e ID de proyecto, sin pasar por el motor de regex
+            if isinstance(input_str, str):
+                return input_str.isascii() and input_str.isdigit()
+            if isinstance(input_str, int) and not isinstance(input_str, bool):
+                return input_str >= 0
+            return False
         elif input_type == "path":
             # Validar ruta de archivo
             return os.path.isabs(input_str) and not any(c in input_str for c in '<>:|?*')
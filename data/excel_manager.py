@@ -8,30 +8,127 @@ almacenar y dar seguimiento a los issues extraídos de SAP.
 """
 
 import os
+import csv
+import importlib.util
 import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from tkinter import filedialog, messagebox
 
-# Importaciones opcionales con gestión de errores
-try:
-    import pandas as pd
-    import numpy as np
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-    pd = None
-    np = None
+from utils.lazy_import import lazy_import
+
+# tkinter, pandas y numpy se cargan en su primer uso para no penalizar el arranque
+filedialog = lazy_import("tkinter.filedialog")
+messagebox = lazy_import("tkinter.messagebox")
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+PANDAS_AVAILABLE = pd is not None and np is not None
+
+# Con pyarrow las comparaciones de texto se hacen sobre buffers Arrow
+if importlib.util.find_spec("pyarrow") is not None:
+    _TEXT_DTYPE = "string[pyarrow]"
+else:
+    _TEXT_DTYPE = str
 
 try:
-    from openpyxl import load_workbook
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    OPENPYXL_AVAILABLE = False
+    from openpyxl.utils import get_column_letter
+    OPENPYXL_AVAILABLE = True
+    
+    # Estilos creados una sola vez y reutilizados en todas las celdas
+    _HEADER_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+    _HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+    _THIN_BORDER = Border(
+        left=Side(style="thin"),
+        right=Side(style="thin"),
+        top=Side(style="thin"),
+        bottom=Side(style="thin"),
+    )
+    # Tupla ordenada: se aplica el primer estado contenido en el valor de la celda
+    _STATUS_FILLS = (
+        ("DONE", PatternFill(start_color="CCFFCC", end_color="CCFFCC", fill_type="solid")),
+        ("OPEN", PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")),
+        ("READY", PatternFill(start_color="FFFFCC", end_color="FFFFCC", fill_type="solid")),
+        ("IN PROGRESS", PatternFill(start_color="FFE6CC", end_color="FFE6CC", fill_type="solid")),
+    )
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+# Lector opcional en Rust para cargar libros existentes más rápido
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+# Backend opcional más rápido para la escritura masiva de libros
+# (solo se comprueba su presencia; se importa al escribir)
+PYEXCELERATE_AVAILABLE = importlib.util.find_spec("pyexcelerate") is not None
+
+# Escritor opcional (más rápido que openpyxl) para escribir sin formato
+XLSXWRITER_AVAILABLE = importlib.util.find_spec("xlsxwriter") is not None
+
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Estados que colorean la columna Status, en orden de prioridad
+_STATUS_KEYS = ("DONE", "OPEN", "READY", "IN PROGRESS")
+
+# Tamaño del búfer de escritura de los libros (1 MB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _save_buffered(workbook, file_path):
+    """
+    Guarda un libro a través de un archivo con búfer de 1 MB
+    
+    El contenedor ZIP del .xlsx se escribe en muchos fragmentos pequeños; el
+    búfer los agrupa en menos llamadas write() al sistema operativo.
+    
+    Args:
+        workbook: Libro de openpyxl o pyexcelerate (ambos aceptan un objeto archivo)
+        file_path (str): Ruta de destino
+    """
+    with open(file_path, "wb", buffering=_WRITE_BUFFER_SIZE) as buffered:
+        workbook.save(buffered)
+
+def _read_excel_df(file_path):
+    """
+    Lee un archivo Excel a DataFrame con el motor más rápido disponible
+    
+    Usa calamine si está instalado (y la versión de pandas lo soporta) y,
+    en caso contrario, el motor por defecto de pandas.
+    
+    Args:
+        file_path (str): Ruta al archivo Excel
+        
+    Returns:
+        DataFrame: Contenido de la primera hoja
+    """
+    if CALAMINE_AVAILABLE:
+        try:
+            return pd.read_excel(file_path, engine="calamine")
+        except ValueError as engine_e:
+            logger.debug(f"calamine no disponible en esta versión de pandas: {engine_e}")
+            
+    return pd.read_excel(file_path)
+
+def _diff_columns(old_values, new_values):
+    """
+    Compara dos columnas de texto elemento a elemento
+    
+    Ambas columnas se codifican juntas con pd.factorize (una sola pasada de
+    hashing en C) y la comparación se hace sobre los códigos enteros.
+    
+    Args:
+        old_values (Series): Valores actuales, ya convertidos a texto
+        new_values (Series): Valores nuevos, ya convertidos a texto
+        
+    Returns:
+        ndarray: Máscara booleana con True donde los valores difieren
+    """
+    codes, _ = pd.concat([old_values, new_values], ignore_index=True).factorize()
+    return codes[:len(old_values)] != codes[len(old_values):]
+
 class ExcelManager:
     """
     Clase dedicada al manejo de archivos Excel de seguimiento de issues.
@@ -71,6 +168,16 @@ class ExcelManager:
             "Comments",
         ]
         
+        # Último DataFrame escrito, con la ruta y fecha de modificación del archivo
+        # al que corresponde, para evitar releer el Excel
+        self._cached_df = None
+        self._cached_path = None
+        self._cached_mtime = None
+        
+        # Callback opcional (ruta) -> None, invocado al crear un archivo nuevo; el
+        # extractor lo usa para descartar el estado de extracción de esa ruta
+        self.on_file_created = None
+        
     def select_file(self):
         """
         Permite al usuario elegir un archivo Excel existente o crear uno nuevo
@@ -155,6 +262,8 @@ class ExcelManager:
         if success:
             logger.info(f"Creado nuevo archivo Excel: {file_path}")
             self.file_path = file_path
+            if self.on_file_created is not None:
+                self.on_file_created(file_path)
             return file_path
         else:
             logger.error(f"No se pudo crear el archivo Excel: {file_path}")
@@ -174,12 +283,8 @@ class ExcelManager:
             # Crear un DataFrame vacío con las columnas necesarias
             df = pd.DataFrame(columns=self.default_columns)
 
-            # Guardar el DataFrame vacío como un archivo Excel
-            df.to_excel(file_path, index=False, engine='openpyxl')
-            
-            # Si openpyxl está disponible, aplicar formato básico
-            if OPENPYXL_AVAILABLE:
-                self._apply_excel_formatting(file_path)
+            # Guardar el DataFrame vacío como un archivo Excel, ya con formato si es posible
+            self._write_dataframe(df, file_path)
                 
             logger.info(f"Archivo Excel creado exitosamente: {file_path}")
             return True
@@ -220,85 +325,7 @@ class ExcelManager:
         try:
             logger.info(f"Actualizando archivo Excel: {self.file_path}")
             
-            # Cargar el archivo existente o crear estructura si no existe
-            if os.path.exists(self.file_path):
-                try:
-                    existing_df = pd.read_excel(self.file_path, engine='openpyxl')
-                    logger.info(f"Archivo Excel existente cargado con {len(existing_df)} registros")
-                except Exception as read_e:
-                    logger.warning(f"Error al leer Excel: {read_e}. Creando estructura nueva.")
-                    existing_df = pd.DataFrame(columns=self.default_columns)
-            else:
-                existing_df = pd.DataFrame(columns=self.default_columns)
-                logger.info("Creando nueva estructura de Excel")
-
-            # Convertir datos de issues a DataFrame
-            new_df = pd.DataFrame(issues_data)
-            
-            # Contadores para estadísticas
-            new_items = 0
-            updated_items = 0
-            
-            # Hacer una copia del DataFrame existente para no modificarlo mientras iteramos
-            updated_df = existing_df.copy()
-            
-            # Optimización: crear índice para búsquedas rápidas si hay muchos registros
-            title_index = {}
-            if len(existing_df) > 0 and "Title" in existing_df.columns:
-                for idx, title in enumerate(existing_df["Title"]):
-                    if title and not pd.isna(title) and title not in title_index:
-                        title_index[title] = idx
-            
-            # Procesar cada issue nuevo
-            for _, new_row in new_df.iterrows():
-                title = new_row.get("Title", "")
-                if not title or pd.isna(title):
-                    continue  # Saltar filas sin título
-                    
-                title_exists = title in title_index
-                
-                if not title_exists:
-                    # Agregar fecha de última actualización para elementos nuevos
-                    new_row_dict = new_row.to_dict()
-                    new_row_dict["Last Updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    # Asegurar que todos los campos esperados existan
-                    for column in self.default_columns:
-                        if column not in new_row_dict:
-                            new_row_dict[column] = ""
-                            
-                    new_row_df = pd.DataFrame([new_row_dict])
-                    updated_df = pd.concat([updated_df, new_row_df], ignore_index=True)
-                    new_items += 1
-                    logger.info(f"Nuevo issue añadido: '{title}'")
-                else:
-                    # Obtener índice del elemento existente
-                    idx = title_index[title]
-                    
-                    # Verificar cambios en el estado y otras columnas
-                    updated = False
-                    
-                    for column in ["Status", "Priority", "Type", "Due Date", "Deadline", "Created By", "Created On"]:
-                        if column in new_row and column in existing_df.columns:
-                            old_value = existing_df.iloc[idx][column] if not pd.isna(existing_df.iloc[idx][column]) else ""
-                            new_value = new_row[column] if column in new_row and not pd.isna(new_row[column]) else ""
-                            
-                            if str(old_value) != str(new_value):
-                                mask = updated_df["Title"] == title
-                                updated_df.loc[mask, column] = new_value
-                                updated_df.loc[mask, "Last Updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                updated = True
-                                logger.info(f"Actualizado {column} de '{title}': '{old_value}' → '{new_value}'")
-                    
-                    if updated:
-                        updated_items += 1
-            
-            # Guardar el DataFrame actualizado
-            updated_df.to_excel(self.file_path, index=False, engine='openpyxl')
-            
-            # Aplicar formato al Excel
-            if OPENPYXL_AVAILABLE:
-                self._apply_excel_formatting()
+            new_items, updated_items = self._merge_and_write(issues_data)
             
             logger.info(f"Excel actualizado: {new_items} nuevos, {updated_items} actualizados")
             return True, new_items, updated_items
@@ -308,104 +335,397 @@ class ExcelManager:
             messagebox.showerror("Error", f"Error al actualizar el archivo Excel: {e}")
             return False, 0, 0
             
-    def _apply_excel_formatting(self, file_path=None):
+    def batch_update(self, files_and_data, max_workers=None):
+        """
+        Actualiza varios archivos Excel en paralelo, uno por proceso
+        
+        El parseo de XLSX es intensivo en CPU, por lo que cada archivo se procesa
+        en un proceso independiente (lectura, combinación y escritura).
+        
+        Args:
+            files_and_data (dict | list): Pares (ruta, issues_data) o diccionario ruta -> issues_data
+            max_workers (int, optional): Número máximo de procesos. Si es None, lo decide el ejecutor
+            
+        Returns:
+            dict: Ruta -> (success, new_items, updated_items)
         """
-        Aplica formato estético al archivo Excel
+        if not PANDAS_AVAILABLE:
+            logger.error("No se puede actualizar Excel: pandas no está instalado")
+            return {}
+            
+        if isinstance(files_and_data, dict):
+            files_and_data = list(files_and_data.items())
+        else:
+            files_and_data = list(files_and_data)
+            
+        results = {}
+        pending = [(path, data) for path, data in files_and_data if path and data]
+        for path, data in files_and_data:
+            if not path or not data:
+                logger.warning(f"Sin ruta o sin datos para la actualización en lote: {path}")
+                results[path] = (False, 0, 0)
+                
+        if len(pending) == 1:
+            # Un solo archivo: no compensa arrancar procesos
+            path, data = pending[0]
+            results[path] = _batch_update_worker(path, data)
+        elif pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {path: executor.submit(_batch_update_worker, path, data) for path, data in pending}
+                for path, future in futures.items():
+                    try:
+                        results[path] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error en el proceso de actualización de {path}: {e}")
+                        results[path] = (False, 0, 0)
+                        
+        total_new = sum(result[1] for result in results.values())
+        total_updated = sum(result[2] for result in results.values())
+        logger.info(
+            f"Actualización en lote de {len(results)} archivos: {total_new} nuevos, {total_updated} actualizados"
+        )
+        return results
+        
+    def _merge_and_write(self, issues_data):
+        """
+        Combina los issues con el contenido actual del Excel y guarda el resultado
+        
+        No muestra diálogos: los errores se propagan al llamador, lo que permite
+        usarlo tanto desde update_with_issues como desde procesos de batch_update.
         
         Args:
+            issues_data (list): Lista de diccionarios con datos de issues
+            
+        Returns:
+            tuple: (new_items, updated_items)
+        """
+        # Marca de tiempo común a todos los cambios de este lote
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Cargar el archivo existente o crear estructura si no existe
+        if os.path.exists(self.file_path):
+            try:
+                existing_df = _read_excel_df(self.file_path)
+                logger.info(f"Archivo Excel existente cargado con {len(existing_df)} registros")
+            except Exception as read_e:
+                logger.warning(f"Error al leer Excel: {read_e}. Creando estructura nueva.")
+                existing_df = pd.DataFrame(columns=self.default_columns)
+        else:
+            existing_df = pd.DataFrame(columns=self.default_columns)
+            logger.info("Creando nueva estructura de Excel")
+
+        # Convertir datos de issues a DataFrame
+        new_df = pd.DataFrame(issues_data)
+
+        # Hacer una copia del DataFrame existente para no modificarlo mientras comparamos.
+        # Se usa dtype object para que las columnas acepten valores de cualquier tipo.
+        updated_df = existing_df.astype(object)
+
+        # Saltar filas sin título
+        if "Title" in new_df.columns:
+            valid_df = new_df[new_df["Title"].notna() & (new_df["Title"] != "")]
+        else:
+            valid_df = pd.DataFrame(columns=["Title"])
+
+        # Primera aparición de cada título existente, que es la referencia de comparación
+        if "Title" in existing_df.columns:
+            existing_titles = existing_df["Title"].dropna()
+            existing_titles = existing_titles[existing_titles != ""]
+            first_titles = existing_titles[~existing_titles.duplicated()]
+            reference_df = existing_df.loc[first_titles.index]
+        else:
+            reference_df = existing_df.iloc[0:0].assign(Title=None)
+
+        title_exists = valid_df["Title"].isin(reference_df["Title"])
+
+        # Issues existentes: detectar cambios columna a columna de forma vectorizada
+        tracked_columns = [
+            column for column in ["Status", "Priority", "Type", "Due Date", "Deadline", "Created By", "Created On"]
+            if column in valid_df.columns and column in existing_df.columns
+        ]
+        existing_rows = valid_df.loc[title_exists, ["Title"] + tracked_columns]
+        merged = existing_rows.merge(
+            reference_df[["Title"] + tracked_columns], on="Title", how="left", suffixes=("_new", "_old")
+        )
+
+        row_updated = pd.Series(False, index=merged.index)
+        updated_titles = set()
+
+        # Posiciones (una sola vez) de las filas existentes cuyo título llegó en los datos
+        # nuevos, para asignar los cambios por posición sin recorrer todo el DataFrame
+        if tracked_columns:
+            matched_pos = np.flatnonzero(updated_df["Title"].isin(merged["Title"]).to_numpy())
+            matched_titles = updated_df["Title"].to_numpy()[matched_pos]
+            col_pos = {column: updated_df.columns.get_loc(column) for column in tracked_columns}
+
+        # Valores vacíos (NaN/None) como "" en una sola operación sobre todo el DataFrame
+        merged = merged.astype(object)
+        merged = merged.where(merged.notna(), "")
+        
+        for column in tracked_columns:
+            old_values = merged[column + "_old"]
+            new_values = merged[column + "_new"]
+
+            changed = pd.Series(
+                _diff_columns(old_values.astype(_TEXT_DTYPE), new_values.astype(_TEXT_DTYPE)),
+                index=merged.index,
+            )
+            if not changed.any():
+                continue
+
+            changed_titles = merged.loc[changed, "Title"]
+            for title, old_value, new_value in zip(changed_titles, old_values[changed], new_values[changed]):
+                logger.info(f"Actualizado {column} de '{title}': '{old_value}' → '{new_value}'")
+
+            # Si un título se repite en los datos nuevos, prevalece el último cambio
+            new_by_title = pd.Series(new_values[changed].values, index=changed_titles.values)
+            new_by_title = new_by_title[~new_by_title.index.duplicated(keep="last")]
+
+            target = new_by_title.index.get_indexer(matched_titles)
+            hit = target >= 0
+            updated_df.iloc[matched_pos[hit], col_pos[column]] = new_by_title.to_numpy()[target[hit]]
+
+            row_updated |= changed
+            updated_titles.update(new_by_title.index)
+
+        if updated_titles:
+            hit = np.isin(matched_titles, list(updated_titles))
+            updated_df.loc[updated_df.index[matched_pos[hit]], "Last Updated"] = now_str
+
+        updated_items = int(row_updated.sum())
+
+        # Issues nuevos: se agregan todos con un único concat
+        new_rows_df = valid_df[~title_exists].copy()
+        new_items = len(new_rows_df)
+
+        if new_items:
+            for title in new_rows_df["Title"]:
+                logger.info(f"Nuevo issue añadido: '{title}'")
+
+            # Agregar fecha de última actualización para elementos nuevos
+            new_rows_df["Last Updated"] = now_str
+
+            # Asegurar que todos los campos esperados existan
+            missing_columns = [c for c in self.default_columns if c not in new_rows_df.columns]
+            if missing_columns:
+                new_rows_df = new_rows_df.reindex(
+                    columns=list(new_rows_df.columns) + missing_columns, fill_value=""
+                )
+
+            updated_df = pd.concat([updated_df, new_rows_df], ignore_index=True)
+
+        # Guardar el DataFrame actualizado con formato en una sola escritura
+        self._write_dataframe(updated_df)
+
+        self._cached_df = updated_df
+        self._cached_path = self.file_path
+        self._cached_mtime = os.path.getmtime(self.file_path)
+        
+        return new_items, updated_items
+        
+    def _write_dataframe(self, df, file_path=None):
+        """
+        Escribe el DataFrame con formato usando el backend más rápido disponible
+        
+        Prueba primero pyexcelerate y, si no está instalado o falla, recurre al
+        modo write-only de openpyxl. Sin openpyxl se escribe sin formato con pandas,
+        usando xlsxwriter si está disponible.
+        
+        Args:
+            df (DataFrame): Datos a escribir
             file_path (str, optional): Ruta al archivo Excel. Si es None, usa self.file_path
+        """
+        if file_path is None:
+            file_path = self.file_path
+            
+        if PYEXCELERATE_AVAILABLE:
+            try:
+                self._write_workbook_pyexcelerate(df, file_path)
+                return
+            except Exception as fast_e:
+                logger.warning(f"No se pudo escribir con pyexcelerate, se usará openpyxl: {fast_e}")
+                
+        if OPENPYXL_AVAILABLE:
+            self._write_workbook_fast(df, file_path)
+        elif XLSXWRITER_AVAILABLE:
+            df.to_excel(file_path, index=False, engine='xlsxwriter')
+        else:
+            df.to_excel(file_path, index=False, engine='openpyxl')
+            
+    @staticmethod
+    def _column_widths(columns, values):
+        """
+        Calcula el ancho de cada columna a partir del texto más largo
+        
+        Args:
+            columns (list): Nombres de las columnas
+            values (DataFrame): Valores a escribir, con None en las celdas vacías
             
         Returns:
-            bool: True si se aplicó el formato correctamente, False en caso contrario
+            list: Ancho ajustado de cada columna, entre 10 y 50
         """
-        if not OPENPYXL_AVAILABLE:
-            logger.warning("Openpyxl no está disponible. No se puede aplicar formato.")
-            return False
+        widths = [len(column) for column in columns]
+        for i, column in enumerate(values.columns):
+            # Solo cuentan los valores no vacíos, como en el formato original
+            present = values[column][values[column].astype(bool)]
+            if len(present):
+                widths[i] = max(widths[i], int(present.astype(str).str.len().max()))
+        return [max(10, min(50, width + 2)) for width in widths]
+        
+    @staticmethod
+    def _status_fill_index(values):
+        """
+        Clasifica la columna Status de forma vectorizada para colorear las filas
+        
+        Args:
+            values (DataFrame): Valores a escribir, con None en las celdas vacías
             
+        Returns:
+            ndarray: Índice en _STATUS_KEYS del estado de cada fila, o -1 si no aplica
+                color (también cuando no hay columna Status)
+        """
+        if "Status" not in values.columns:
+            return np.full(len(values), -1)
+            
+        status = values["Status"]
+        status = status.where(status.astype(bool), "").astype(str).str.upper()
+        conditions = [status.str.contains(key, regex=False).to_numpy() for key in _STATUS_KEYS]
+        return np.select(conditions, range(len(_STATUS_KEYS)), default=-1)
+        
+    def _write_workbook_pyexcelerate(self, df, file_path):
+        """
+        Escribe el DataFrame con formato usando pyexcelerate
+        
+        Produce el mismo resultado que _write_workbook_fast (encabezado, bordes,
+        colores por estado y anchos de columna) con un escritor más rápido.
+        
+        Args:
+            df (DataFrame): Datos a escribir
+            file_path (str): Ruta al archivo Excel
+        """
+        from pyexcelerate import Workbook as FastWorkbook, Style as FastStyle, Fill as FastFill
+        from pyexcelerate import Font as FastFont, Color as FastColor, Alignment as FastAlignment
+        from pyexcelerate.Border import Border as FastBorder
+        from pyexcelerate.Borders import Borders as FastBorders
+        
+        columns = [str(column) for column in df.columns]
+        status_col = columns.index("Status") + 1 if "Status" in columns else None
+        
+        # Celdas vacías (NaN) se escriben como None, igual que hace pandas
+        values = df.astype(object).where(df.notna(), None)
+        
+        thin = FastBorder(style="thin")
+        borders = FastBorders(left=thin, right=thin, top=thin, bottom=thin)
+        header_style = FastStyle(
+            fill=FastFill(background=FastColor(0x1F, 0x4E, 0x78)),
+            font=FastFont(bold=True, color=FastColor(0xFF, 0xFF, 0xFF)),
+            alignment=FastAlignment(horizontal="center", vertical="center"),
+            borders=borders,
+        )
+        data_style = FastStyle(borders=borders)
+        # Mismo orden que _STATUS_KEYS
+        status_styles = tuple(
+            FastStyle(fill=FastFill(background=FastColor(*color)), borders=borders)
+            for color in ((0xCC, 0xFF, 0xCC), (0xFF, 0xCC, 0xCC), (0xFF, 0xFF, 0xCC), (0xFF, 0xE6, 0xCC))
+        )
+        status_index = self._status_fill_index(values)
+        
+        rows = [columns] + list(values.itertuples(index=False, name=None))
+        
+        wb = FastWorkbook()
+        ws = wb.new_sheet("Sheet1", data=rows)
+        
+        for col in range(1, len(columns) + 1):
+            ws.set_cell_style(1, col, header_style)
+            
+        for row_idx in range(2, len(rows) + 1):
+            for col in range(1, len(columns) + 1):
+                ws.set_cell_style(row_idx, col, data_style)
+                
+            # Colorear por estado
+            if status_col is not None and status_index[row_idx - 2] >= 0:
+                ws.set_cell_style(row_idx, status_col, status_styles[status_index[row_idx - 2]])
+                
+        for col, width in enumerate(self._column_widths(columns, values), start=1):
+            ws.set_col_style(col, FastStyle(size=width))
+            
+        _save_buffered(wb, file_path)
+        logger.info("Formato aplicado al archivo Excel correctamente")
+        
+    def _write_workbook_fast(self, df, file_path=None):
+        """
+        Escribe el DataFrame en el archivo Excel con formato en una sola pasada
+        
+        Usa un libro en modo write-only de openpyxl: las filas se emiten en
+        streaming con los estilos ya asignados, evitando escribir el archivo con
+        pandas y volver a abrirlo después para darle formato.
+        
+        Args:
+            df (DataFrame): Datos a escribir
+            file_path (str, optional): Ruta al archivo Excel. Si es None, usa self.file_path
+        """
         if file_path is None:
             file_path = self.file_path
+            
+        columns = [str(column) for column in df.columns]
+        status_col = columns.index("Status") if "Status" in columns else None
         
-        try:
-            wb = load_workbook(file_path)
-            ws = wb.active
+        # Celdas vacías (NaN) se escriben como None, igual que hace pandas
+        values = df.astype(object).where(df.notna(), None)
+        
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        
+        # En modo write-only los anchos deben definirse antes de añadir filas
+        for i, width in enumerate(self._column_widths(columns, values)):
+            ws.column_dimensions[get_column_letter(i + 1)].width = width
+        
+        header_cells = []
+        for column in columns:
+            cell = WriteOnlyCell(ws, value=column)
+            cell.fill = _HEADER_FILL
+            cell.font = _HEADER_FONT
+            cell.alignment = _HEADER_ALIGN
+            cell.border = _THIN_BORDER
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        status_index = self._status_fill_index(values)
+        
+        for row_num, row in enumerate(values.itertuples(index=False, name=None)):
+            row_cells = []
+            for i, value in enumerate(row):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.border = _THIN_BORDER
+                
+                # Colorear por estado
+                if i == status_col and status_index[row_num] >= 0:
+                    cell.fill = _STATUS_FILLS[status_index[row_num]][1]
+                row_cells.append(cell)
+            ws.append(row_cells)
             
-            # Formato para encabezados
-            header_fill = PatternFill(
-                start_color="1F4E78", end_color="1F4E78", fill_type="solid"
-            )
-            header_font = Font(bold=True, color="FFFFFF")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-
-            thin_border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
-            )
-
-            # Aplicar formato a encabezados
-            for col in range(1, ws.max_column + 1):
-                cell = ws.cell(row=1, column=col)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = header_alignment
-                cell.border = thin_border
-
-            # Aplicar formato a celdas de datos
-            for row in range(2, ws.max_row + 1):
-                for col in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row, column=col)
-                    cell.border = thin_border
-
-                    # Colorear por estado
-                    if col == 4:  # Columna Status
-                        status = str(cell.value).upper() if cell.value else ""
-
-                        if "DONE" in status:
-                            cell.fill = PatternFill(
-                                start_color="CCFFCC",
-                                end_color="CCFFCC",
-                                fill_type="solid",
-                            )
-                        elif "OPEN" in status:
-                            cell.fill = PatternFill(
-                                start_color="FFCCCC",
-                                end_color="FFCCCC",
-                                fill_type="solid",
-                            )
-                        elif "READY" in status:
-                            cell.fill = PatternFill(
-                                start_color="FFFFCC",
-                                end_color="FFFFCC",
-                                fill_type="solid",
-                            )
-                        elif "IN PROGRESS" in status:
-                            cell.fill = PatternFill(
-                                start_color="FFE6CC",
-                                end_color="FFE6CC",
-                                fill_type="solid",
-                            )
-
-            # Ajustar ancho de columnas
-            for col in range(1, ws.max_column + 1):
-                max_length = 0
-                for row in range(1, ws.max_row + 1):
-                    cell_value = ws.cell(row=row, column=col).value
-                    if cell_value:
-                        max_length = max(max_length, len(str(cell_value)))
-
-                adjusted_width = max(10, min(50, max_length + 2))
-                ws.column_dimensions[
-                    ws.cell(row=1, column=col).column_letter
-                ].width = adjusted_width
-
-            wb.save(file_path)
-            logger.info("Formato aplicado al archivo Excel correctamente")
-            return True
-        except Exception as format_e:
-            logger.warning(f"No se pudo aplicar formato al Excel: {format_e}")
-            return False
+        _save_buffered(wb, file_path)
+        logger.info("Formato aplicado al archivo Excel correctamente")
+            
+    def _get_cached_df(self):
+        """
+        Devuelve el último DataFrame escrito si sigue reflejando el archivo actual
+        
+        Returns:
+            DataFrame: Datos en memoria, o None si no hay caché o el archivo
+            cambió (otra ruta u otra fecha de modificación)
+        """
+        if self._cached_df is None or self._cached_path != self.file_path:
+            return None
+            
+        try:
+            if os.path.getmtime(self.file_path) != self._cached_mtime:
+                return None
+        except OSError:
+            return None
             
+        return self._cached_df
+        
     def get_file_path(self):
         """
         Obtiene la ruta del archivo Excel actual
@@ -425,8 +745,8 @@ class ExcelManager:
         Returns:
             bool: True si la exportación fue exitosa, False en caso contrario
         """
-        if not PANDAS_AVAILABLE:
-            logger.error("No se puede exportar a CSV: pandas no está instalado")
+        if not PANDAS_AVAILABLE and not OPENPYXL_AVAILABLE:
+            logger.error("No se puede exportar a CSV: pandas y openpyxl no están instalados")
             return False
             
         if not self.file_path:
@@ -434,15 +754,26 @@ class ExcelManager:
             return False
             
         try:
-            # Cargar datos del Excel
-            df = pd.read_excel(self.file_path, engine='openpyxl')
-            
             # Determinar la ruta de salida
             if not output_path:
                 output_path = os.path.splitext(self.file_path)[0] + ".csv"
                 
-            # Exportar a CSV
-            df.to_csv(output_path, index=False, encoding='utf-8-sig')  # Con BOM para Excel
+            cached_df = self._get_cached_df()
+            if cached_df is not None:
+                # Exportar directamente los datos ya cargados en memoria
+                cached_df.to_csv(output_path, index=False, encoding='utf-8-sig')  # Con BOM para Excel
+            elif OPENPYXL_AVAILABLE:
+                # Leer el Excel en modo streaming y volcar las filas sin pasar por pandas
+                wb = load_workbook(self.file_path, read_only=True, data_only=True)
+                try:
+                    ws = wb.active
+                    with open(output_path, "w", newline="", encoding="utf-8-sig") as csv_file:
+                        csv.writer(csv_file).writerows(ws.iter_rows(values_only=True))
+                finally:
+                    wb.close()
+            else:
+                df = _read_excel_df(self.file_path)
+                df.to_csv(output_path, index=False, encoding='utf-8-sig')  # Con BOM para Excel
             
             logger.info(f"Datos exportados a CSV: {output_path}")
             return True
@@ -457,12 +788,21 @@ class ExcelManager:
         Returns:
             dict: Diccionario con estadísticas o None si hay error
         """
-        if not PANDAS_AVAILABLE or not self.file_path:
+        if not self.file_path or not (PANDAS_AVAILABLE or OPENPYXL_AVAILABLE):
             return None
             
         try:
-            # Cargar datos del Excel
-            df = pd.read_excel(self.file_path, engine='openpyxl')
+            # Usar el último DataFrame escrito si el archivo no ha cambiado desde entonces
+            df = self._get_cached_df()
+            if df is not None:
+                # En el archivo las cadenas vacías se leen como celdas vacías
+                df = df.mask(df == "")
+            else:
+                if OPENPYXL_AVAILABLE:
+                    return self._stats_from_workbook()
+                    
+                # Cargar datos del Excel
+                df = _read_excel_df(self.file_path)
             
             # Estadísticas básicas
             stats = {
@@ -493,6 +833,63 @@ class ExcelManager:
         except Exception as e:
             logger.error(f"Error al obtener estadísticas: {e}")
             return None
+            
+    def _stats_from_workbook(self):
+        """
+        Calcula las estadísticas recorriendo el Excel en modo de solo lectura
+        
+        Evita materializar un DataFrame completo: se hace una única pasada por
+        las filas contando solo las columnas necesarias.
+        
+        Returns:
+            dict: Diccionario con estadísticas, con las mismas claves que get_stats
+        """
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = [str(value) if value is not None else "" for value in next(rows, ())]
+            
+            count_columns = {
+                key: header.index(column)
+                for key, column in (("by_status", "Status"), ("by_priority", "Priority"), ("by_type", "Type"))
+                if column in header
+            }
+            counters = {key: Counter() for key in count_columns}
+            last_updated_col = header.index("Last Updated") if "Last Updated" in header else None
+            
+            total = 0
+            last_updated = None
+            for row in rows:
+                # Las filas completamente vacías no cuentan como issues
+                if all(value is None or value == "" for value in row):
+                    continue
+                total += 1
+                
+                for key, col in count_columns.items():
+                    value = row[col] if col < len(row) else None
+                    if value is not None and value != "":
+                        counters[key][value] += 1
+                        
+                if last_updated_col is not None and last_updated_col < len(row):
+                    value = row[last_updated_col]
+                    if value is not None and value != "" and (last_updated is None or value > last_updated):
+                        last_updated = value
+        finally:
+            wb.close()
+            
+        # Estadísticas básicas
+        stats = {
+            "total_issues": total,
+            "by_status": {}
+        }
+        for key, counter in counters.items():
+            stats[key] = dict(counter.most_common())
+            
+        # Fechas importantes
+        if total > 0:
+            stats["last_updated"] = last_updated
+            
+        return stats
 
     def open_excel_file(self):
         """
@@ -523,3 +920,22 @@ class ExcelManager:
             except Exception as e2:
                 logger.error(f"Error alternativo al abrir Excel: {e2}")
                 return False
+
+
+def _batch_update_worker(file_path, issues_data):
+    """
+    Actualiza un archivo Excel en un proceso hijo de batch_update
+    
+    Args:
+        file_path (str): Ruta al archivo Excel
+        issues_data (list): Lista de diccionarios con datos de issues
+        
+    Returns:
+        tuple: (success, new_items, updated_items)
+    """
+    try:
+        new_items, updated_items = ExcelManager(file_path)._merge_and_write(issues_data)
+        return True, new_items, updated_items
+    except Exception as e:
+        logger.error(f"Error al actualizar {file_path} en lote: {e}")
+        return False, 0, 0
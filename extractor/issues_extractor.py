@@ -1,1715 +1,2405 @@
-#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-"""
-IssuesExtractor - Módulo principal para coordinación del proceso de extracción
-
-Este módulo define la clase IssuesExtractor que coordina el proceso completo
-de extracción de issues de SAP, utilizando los otros componentes:
-- SAPBrowser: Para la automatización del navegador
-- DatabaseManager: Para gestionar clientes y proyectos
-- ExcelManager: Para manejar los archivos Excel de salida
-
-La clase proporciona métodos para ejecutar el proceso de extracción con o sin
-interfaz gráfica, y permite al usuario seleccionar clientes, proyectos y 
-archivos Excel destino para los datos.
-"""
-
-import os
-import sys
-import time
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import threading
-import json
-import logging
-import base64
-import sqlite3
-from io import BytesIO
-from datetime import datetime
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-
-# Importaciones de otros módulos del proyecto
-from utils.logger_config import setup_logger
-from data.database_manager import DatabaseManager
-from data.excel_manager import ExcelManager
-from browser.sap_browser import SAPBrowser
-from config.settings import SAP_COLORS
-
-# Configurar logger
-logger = logging.getLogger(__name__)
-
-# Verificar disponibilidad de PIL para funciones gráficas
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-
-
-class IssuesExtractor:
-    """
-    Clase principal para extraer issues de SAP con interfaz gráfica y base de datos
-    
-    Esta clase coordina todo el proceso de extracción, desde la conexión
-    con el navegador, la selección de clientes y proyectos, hasta la extracción
-    de datos y su almacenamiento en archivos Excel.
-    """
-
-    def __init__(self):
-        """Inicializa la clase con sus componentes y variables necesarias"""
-        self.excel_file_path = None
-        self.driver = None
-        
-        # Inicializar root primero (si se va a usar GUI)
-        self.root = None
-        
-        # Variables que dependen de Tkinter - inicializar como None
-        self.status_var = None
-        self.client_var = None
-        self.project_var = None
-        self.project_combo = None
-        self.log_text = None
-        self.excel_filename_var = None
-        self.processing = False
-        self.left_panel = None
-        self.header_frame = None
-        self.client_combo = None
-        self.image_cache = {}
-        
-        # Componentes
-        self.db_manager = DatabaseManager()
-        self.excel_manager = ExcelManager()
-        self.browser = SAPBrowser()
-        
-        # Configurar referencias cruzadas para que el navegador pueda acceder a UI
-        self.setup_browser_ui_references()
-    
-    def setup_browser_ui_references(self):
-        """
-        Configura las referencias a la interfaz de usuario en el navegador.
-        Esto permite que el navegador actualice directamente la interfaz.
-        """
-        # Asignar referencias a la UI si existen
-        self.browser.root = self.root
-        self.browser.status_var = self.status_var
-        
-        # Agregar logger a ambos componentes para registrar eventos
-        logger.debug("Referencias cruzadas de UI configuradas en el navegador")
-    
-    def configure_columns_after_settings(self):
-        """
-        Método auxiliar para configurar todas las columnas después de abrir el panel de ajustes.
-        Este método debe ser llamado después de hacer clic en el botón de ajustes.
-        
-        Utiliza la implementación robusta de selección de columnas que sigue
-        la secuencia de teclas verificada en las pruebas.
-        
-        Returns:
-            bool: True si el proceso fue exitoso, False en caso contrario
-        """
-        try:
-            logger.info("Configurando columnas después de abrir panel de ajustes...")
-            
-            # Verificar que tenemos acceso al navegador
-            if not self.browser or not self.driver:
-                logger.error("No hay navegador inicializado")
-                return False
-            
-            # Ejecutar la selección de columnas usando el método robusto
-            # Este método utiliza una secuencia específica de teclas (Tab, flechas, Enter)
-            # que ha sido verificada en pruebas
-            result = self.browser.select_all_visible_columns()
-            
-            if result:
-                logger.info("[OK] Columnas configuradas correctamente")
-            else:
-                logger.warning("[ERROR] No se pudo completar la configuración de columnas")
-                
-            return result
-        except Exception as e:
-            logger.error(f"Error al configurar columnas: {e}")
-            return False
-            
-    def choose_excel_file(self):
-        """Permite al usuario elegir un archivo Excel existente o crear uno nuevo"""
-        file_path = self.excel_manager.select_file()
-        self.excel_file_path = file_path
-        self.excel_manager.file_path = file_path
-        
-        # Actualizar la interfaz si existe
-        if hasattr(self, 'status_var') and self.status_var:
-            self.status_var.set(f"Archivo Excel seleccionado: {os.path.basename(file_path)}")
-        
-        # Actualizar el nombre del archivo en la etiqueta
-        if hasattr(self, 'excel_filename_var') and self.excel_filename_var:
-            self.excel_filename_var.set(f"Archivo: {os.path.basename(file_path)}")
-            
-        return file_path
-        
-    def connect_to_browser(self):
-        """Conecta con el navegador y devuelve el éxito de la conexión"""
-        result = self.browser.connect()
-        self.driver = self.browser.driver
-        # Actualizar referencias UI después de tener el driver
-        self.setup_browser_ui_references()
-        return result
-        
-    def update_excel(self, issues_data):
-        """
-        Actualiza el archivo Excel con los datos extraídos
-        
-        Args:
-            issues_data (list): Lista de diccionarios con datos de issues
-            
-        Returns:
-            tuple: (success, new_items, updated_items)
-        """
-        success, new_items, updated_items = self.excel_manager.update_with_issues(issues_data)
-        
-        # Actualizar la interfaz si existe
-        if hasattr(self, 'status_var') and self.status_var:
-            if success:
-                self.status_var.set(f"Excel actualizado: {new_items} nuevos, {updated_items} actualizados")
-            else:
-                self.status_var.set("Error al actualizar Excel")
-                
-        # Mostrar mensaje de éxito
-        if success and self.root:
-            messagebox.showinfo(
-                "Proceso Completado", 
-                f"El archivo Excel ha sido actualizado correctamente.\n\n"
-                f"Se han agregado {new_items} nuevos issues y actualizado {updated_items} issues existentes."
-            )
-            
-        return success, new_items, updated_items
-    
-    
-    
-    
-    def extract_sap_issues(self, erp_number, project_id):
-        """
-        Método principal para la extracción completa de issues de SAP.
-        
-        Args:
-            erp_number (str): Número ERP para selección del cliente
-            project_id (str): ID del proyecto a consultar
-            
-        Returns:
-            list: Lista de issues extraídos
-            bool: True si la operación fue exitosa
-        """
-        try:
-            logger.info(f"Iniciando extracción de issues para proyecto {project_id}")
-            
-            # 1. Conectar navegador y navegar a la página de SAP
-            self.browser.connect()
-            result = self.browser.navigate_to_sap(erp_number, project_id)
-            if not result:
-                logger.error("No se pudo navegar a la página de SAP")
-                return [], False
-                
-            # 2. Seleccionar cliente y proyecto
-            if not self.browser.select_customer_automatically(erp_number):
-                logger.error(f"No se pudo seleccionar el cliente {erp_number}")
-                return [], False
-                
-            if not self.browser.select_project_automatically(project_id):
-                logger.error(f"No se pudo seleccionar el proyecto {project_id}")
-                return [], False
-                
-            # 3. Realizar búsqueda
-            if not self.browser.click_search_button():
-                logger.error("No se pudo hacer clic en el botón de búsqueda")
-                return [], False
-                
-            # 4. Esperar a que carguen los resultados iniciales
-            if not self.browser.wait_for_search_results(timeout=30):
-                logger.warning("Posible problema al cargar resultados iniciales")
-                # Continuamos de todos modos, ya que algunos resultados podrían estar disponibles
-            
-            # 5. Extraer todos los issues con el método mejorado de extracción robusta
-            logger.info("Iniciando extracción completa de issues con método robusto")
-            all_issues = self.browser.extract_all_issues_robust()  # Usar el método robusto
-            
-            # 6. Validar resultados
-            if not all_issues or len(all_issues) == 0:
-                logger.error("No se encontraron issues para extraer")
-                return [], False
-                
-            # 7. Actualizar base de datos con los issues extraídos
-            logger.info(f"Actualizando base de datos con {len(all_issues)} issues")
-            self.db_manager.save_issues(all_issues, project_id)
-            
-            # 8. Actualizar Excel con los datos extraídos
-            logger.info("Actualizando archivos Excel")
-            self.update_excel(all_issues)
-                
-            logger.info(f"Extracción completa finalizada: {len(all_issues)} issues procesados")
-            return all_issues, True
-            
-        except Exception as e:
-            logger.error(f"Error en extract_sap_issues: {e}")
-            return [], False
-        finally:
-            # Cerramos el navegador solo si está configurado para ello
-            if hasattr(self, 'config') and self.config.get("close_browser_after_extraction", True):
-                self.browser.close()
-
-
-    def run_extraction(self):
-        """
-        Ejecuta el proceso completo de extracción para modo GUI y consola.
-        
-        Este método se ha actualizado para usar las mejoras en la extracción
-        y proporciona un flujo más robusto para el usuario.
-        
-        Returns:
-            bool: True si la extracción fue exitosa, False en caso contrario
-        """
-        try:
-            if not self.connect_to_browser():
-                logger.error("Error al conectar con el navegador")
-                
-                # Actualizar la interfaz si existe
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set("Error al conectar con el navegador")
-                    
-                return False
-
-            # Obtener valores de cliente y proyecto - MODIFICADO PARA EXTRAER EL NÚMERO DE ID
-            full_client = self.client_var.get().strip() if hasattr(self, 'client_var') and self.client_var else ""
-            full_project = self.project_var.get().strip() if hasattr(self, 'project_var') and self.project_var else ""
-            
-            # Extraer solo el número de ID de las cadenas completas
-            erp_number = full_client.split(" - ")[0].strip() if " - " in full_client else full_client
-            project_id = full_project.split(" - ")[0].strip() if " - " in full_project else full_project
-
-            # Validar que tenemos valores no vacíos
-            if not erp_number:
-                logger.warning("ERP number está vacío")
-                if hasattr(self, 'root') and self.root:
-                    messagebox.showwarning("Datos incompletos", "Debe especificar un número ERP de cliente")
-                return False
-                    
-            if not project_id:
-                logger.warning("Project ID está vacío")
-                if hasattr(self, 'root') and self.root:
-                    messagebox.showwarning("Datos incompletos", "Debe especificar un ID de proyecto")
-                return False
-                                
-            logger.info(f"Iniciando extracción para cliente: {erp_number}, proyecto: {project_id}")
-        
-            # Navegar a la URL inicial especificada
-            logger.info("Navegando a la URL de SAP con parámetros específicos...")
-            
-            # Actualizar la interfaz si existe
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Navegando a SAP...")
-                
-            if not self.browser.navigate_to_sap(erp_number, project_id):
-                logger.error("Error al navegar a la URL de SAP")
-                return False
-            
-            # Manejar autenticación si es necesario
-            if not self.browser.handle_authentication():
-                logger.error("Error en el proceso de autenticación")
-                return False
-                
-            # Estrategia mejorada con múltiples intentos para seleccionar cliente
-            client_selected = False
-            
-            # Método 1: Verificar si los campos ya tienen los valores correctos
-            if self.browser.verify_fields_have_expected_values(erp_number, project_id):
-                logger.info("Los campos ya contienen los valores correctos, omitiendo selección")
-                client_selected = True
-            
-            # Si no están los valores correctos, intentar seleccionar automáticamente
-            if not client_selected:
-                # Actualizar la interfaz si existe
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set("Seleccionando cliente automáticamente...")
-                
-                # Método 2: Usar la función mejorada de selección automática
-                if self.browser.select_customer_automatically(erp_number):
-                    logger.info("Cliente seleccionado con método principal")
-                    client_selected = True
-                else:
-                    # Método 3: Usar JavaScript UI5 si los métodos anteriores fallan
-                    if hasattr(self.browser, 'select_customer_ui5_direct'):
-                        if self.browser.select_customer_ui5_direct(erp_number):
-                            logger.info("Cliente seleccionado con JavaScript UI5")
-                            client_selected = True
-                    
-                    # Método 4: Solicitar intervención manual si todo lo anterior falla
-                    if not client_selected:
-                        logger.warning("No se pudo seleccionar cliente automáticamente")
-                        # Solicitar selección manual si es necesario
-                        if hasattr(self, 'root') and self.root:
-                            messagebox.showwarning("Selección Manual Requerida", 
-                                "No se pudo seleccionar el cliente automáticamente.\n\n"
-                                "Por favor, seleccione manualmente el cliente y haga clic en Continuar.")
-                            result = messagebox.askokcancel("Confirmación", "¿Ha seleccionado el cliente?")
-                            if not result:
-                                return False
-                            client_selected = True  # El usuario confirmó que seleccionó manualmente
-                            time.sleep(1)  # Dar tiempo para que se procese la selección
-                        else:
-                            # En modo consola
-                            print("\n⚠️ No se pudo seleccionar el cliente automáticamente.")
-                            input("➡️ Por favor, seleccione manualmente el cliente y presione Enter para continuar...")
-                            client_selected = True
-
-            # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Seleccionando proyecto automáticamente...")
-            
-            # Seleccionar proyecto con reintentos
-            project_selected = False
-            max_attempts = 3
-            
-            for attempt in range(max_attempts):
-                logger.info(f"Intento {attempt+1}/{max_attempts} de selección de proyecto")
-                
-                # Esperar un poco más antes de cada intento
-                if attempt > 0:
-                    time.sleep(3)
-                    
-                if self.browser.select_project_automatically(project_id):
-                    logger.info(f"Proyecto {project_id} seleccionado con éxito en el intento {attempt+1}")
-                    project_selected = True
-                    break
-                else:
-                    logger.warning(f"Intento {attempt+1} de selección de proyecto fallido")
-            
-            # Si no se pudo seleccionar automáticamente, solicitar selección manual
-            if not project_selected:
-                logger.warning("No se pudo seleccionar proyecto automáticamente")
-                # Solicitar selección manual si es necesario
-                if hasattr(self, 'root') and self.root:
-                    messagebox.showwarning("Selección Manual Requerida", 
-                        "No se pudo seleccionar el proyecto automáticamente.\n\n"
-                        "Por favor, seleccione manualmente el proyecto y haga clic en Continuar.")
-                    result = messagebox.askokcancel("Confirmación", "¿Ha seleccionado el proyecto?")
-                    if not result:
-                        return False
-                    project_selected = True
-                else:
-                    # En modo consola
-                    print("\n⚠️ No se pudo seleccionar el proyecto automáticamente.")
-                    input("➡️ Por favor, seleccione manualmente el proyecto y presione Enter para continuar...")
-                    project_selected = True
-            
-            # Hacer clic en el botón de búsqueda
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Realizando búsqueda...")
-                
-            # Hacer clic en búsqueda utilizando el método mejorado
-            if not self.browser.click_search_button():
-                logger.warning("Error al hacer clic en el botón de búsqueda automáticamente")
-                # Solicitar acción manual
-                if hasattr(self, 'root') and self.root:
-                    messagebox.showwarning("Acción Manual Requerida", 
-                        "No se pudo hacer clic en el botón de búsqueda automáticamente.\n\n"
-                        "Por favor, haga clic manualmente en el botón de búsqueda.")
-                    result = messagebox.askokcancel("Confirmación", "¿Ha hecho clic en el botón de búsqueda?")
-                    if not result:
-                        return False
-                else:
-                    # En modo consola
-                    print("\n⚠️ No se pudo hacer clic en el botón de búsqueda automáticamente.")
-                    input("➡️ Por favor, haga clic manualmente en el botón de búsqueda y presione Enter para continuar...")
-            
-            # Esperar a que se carguen los resultados de la búsqueda
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Esperando resultados de búsqueda...")
-                
-            # Esperar resultados utilizando el método mejorado
-            if not self.browser.wait_for_search_results():
-                logger.warning("No se pudo confirmar la carga de resultados")
-                # Dar tiempo adicional y continuar de todos modos
-                time.sleep(5)
-            
-            # MÉTODO AUTOMATIZADO DE NAVEGACIÓN POR TECLADO
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Iniciando navegación por teclado...")
-
-            # Usar el método mejorado que maneja toda la navegación después de seleccionar cliente y proyecto
-            # con la secuencia exacta de teclas especificada
-            if self.browser.navigate_post_selection():
-                logger.info("✅ Navegación post-selección completada con éxito")
-                
-                # Esperar a que se recargue la tabla con las nuevas columnas
-                time.sleep(1)
-            else:
-                logger.warning("❌ La navegación automática por teclado falló")
-                
-                # Si falla la navegación automática, intentar el método anterior
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set("Intentando método alternativo...")
-                    
-                # Intentar hacer clic en ajustes manualmente
-                if not self.browser.navigate_keyboard_sequence():
-                    logger.warning("No se pudo completar la secuencia de navegación por teclado")
-                    
-                    if hasattr(self, 'root') and self.root:
-                        messagebox.showwarning("Acción Manual Requerida", 
-                            "La navegación automática ha fallado.\n\n"
-                            "Por favor, realice estos pasos manualmente:\n"
-                            "1. Haga clic en el título 'Issues and Actions Overview'\n"
-                            "2. Pulse Tab 18 veces\n"
-                            "3. Pulse Enter (para ajustes)\n"
-                            "4. Pulse Tab 3 veces\n" 
-                            "5. Pulse flecha derecha 2 veces\n"
-                            "6. Pulse Enter (para columnas)\n"
-                            "7. Pulse Tab 3 veces\n"
-                            "8. Pulse Enter (para Select All)\n"
-                            "9. Pulse Tab 2 veces\n"
-                            "10. Pulse Enter (para OK)")
-                        
-                        result = messagebox.askokcancel("Confirmación", 
-                                                    "¿Ha completado los pasos manualmente?")
-                        if not result:
-                            logger.error("Usuario canceló después de fallo en navegación automática")
-                            if hasattr(self, 'status_var') and self.status_var:
-                                self.status_var.set("Proceso cancelado por el usuario")
-                            return False
-                    else:
-                        # En modo consola
-                        print("\n⚠️ La navegación automática ha fallado.")
-                        print("Por favor, realice estos pasos manualmente:")
-                        print("1. Haga clic en el título 'Issues and Actions Overview'")
-                        print("2. Pulse Tab 18 veces")
-                        print("3. Pulse Enter (para ajustes)")
-                        print("4. Pulse Tab 3 veces")
-                        print("5. Pulse flecha derecha 2 veces")
-                        print("6. Pulse Enter (para columnas)")
-                        print("7. Pulse Tab 3 veces")
-                        print("8. Pulse Enter (para Select All)")
-                        print("9. Pulse Tab 2 veces")
-                        print("10. Pulse Enter (para OK)")
-                        input("➡️ Después de completar los pasos, presione Enter para continuar...")
-            
-            # Realizar la extracción con el método mejorado
-            return self.perform_extraction()
-                
-        except Exception as e:
-            logger.error(f"Error en el proceso de extracción: {e}")
-            
-            # Actualizar la interfaz si existe
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set(f"Error: {e}")
-                
-            return False        
-        
-        
-        
-        
-        
-        
-        
-        
-    def navigate_to_issues_tab(self):
-        """
-        Navega a la pestaña 'Issues' una vez seleccionado el proyecto.
-        
-        Returns:
-            bool: True si la navegación fue exitosa, False en caso contrario
-        """
-        try:
-            logger.info("Intentando navegar a la pestaña Issues...")
-            
-            # Esperar a que cargue la página del proyecto
-            time.sleep(3)
-            
-            # Buscar la pestaña de Issues por diferentes selectores
-            issues_tab_selectors = [
-                "//div[contains(text(), 'Issues')] | //span[contains(text(), 'Issues')]",
-                "//li[@role='tab']//div[contains(text(), 'Issues')]",
-                "//a[contains(text(), 'Issues')]",
-                "//div[contains(@class, 'sapMITBItem')]//span[contains(text(), 'Issues')]"
-            ]
-            
-            for selector in issues_tab_selectors:
-                try:
-                    issues_tabs = self.driver.find_elements(By.XPATH, selector)
-                    if issues_tabs:
-                        for tab in issues_tabs:
-                            try:
-                                # Verificar si es visible
-                                if tab.is_displayed():
-                                    # Hacer scroll hasta el elemento
-                                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                                    time.sleep(0.5)
-                                    
-                                    # Intentar clic
-                                    self.driver.execute_script("arguments[0].click();", tab)
-                                    logger.info("Clic en pestaña Issues realizado")
-                                    time.sleep(3)  # Esperar a que cargue
-                                    return True
-                            except:
-                                continue
-                except:
-                    continue
-            
-            logger.warning("No se encontró la pestaña Issues por selectores directos")
-            
-            # Intentar buscar por posición relativa (generalmente la tercera pestaña)
-            try:
-                tabs = self.driver.find_elements(By.XPATH, "//li[@role='tab'] | //div[@role='tab']")
-                if len(tabs) >= 3:  # Asumiendo que Issues es la tercera pestaña
-                    third_tab = tabs[2]  # Índice 2 para el tercer elemento
-                    self.driver.execute_script("arguments[0].click();", third_tab)
-                    logger.info("Clic en tercera pestaña realizado")
-                    time.sleep(1) #Modificado de 3 a 1
-                    return True
-            except:
-                pass
-                
-            logger.warning("No se pudo navegar a la pestaña Issues")
-            return False
-            
-        except Exception as e:
-            logger.error(f"Error al navegar a la pestaña Issues: {e}")
-            return False
-            
-    def _verify_issues_page(self):
-        """
-        Verifica si estamos en la página de Issues correcta.
-        
-        Returns:
-            bool: True si estamos en la página de Issues, False en caso contrario
-        """
-        try:
-            # Estrategia 1: Buscar el texto "Issues (número)"
-            try:
-                issues_title_elements = self.driver.find_elements(
-                    By.XPATH, 
-                    "//div[contains(text(), 'Issues') and contains(text(), '(')]"
-                )
-                if issues_title_elements:
-                    logger.info(f"Página de Issues detectada por título: {issues_title_elements[0].text}")
-                    return True
-            except Exception as e:
-                logger.debug(f"No se pudo detectar título de Issues: {e}")
-            
-            # Estrategia 2: Verificar si hay filas de datos visibles
-            # Usar el método de browser para encontrar filas
-            issue_rows = self.browser.find_table_rows(highlight=False)
-            if len(issue_rows) > 0:
-                logger.info(f"Se detectaron {len(issue_rows)} filas de datos que parecen issues")
-                return True
-            
-            # Estrategia 3: Verificar encabezados de columna típicos
-            try:
-                column_headers = self.driver.find_elements(
-                    By.XPATH,
-                    "//div[text()='Title'] | //div[text()='Type'] | //div[text()='Priority'] | //div[text()='Status']"
-                )
-                if len(column_headers) >= 3:
-                    logger.info(f"Se detectaron encabezados de columna típicos de issues: {len(column_headers)}")
-                    return True
-            except Exception as e:
-                logger.debug(f"No se pudieron detectar encabezados de columna: {e}")
-            
-            # Si no se detecta ninguna de las condiciones anteriores
-            logger.warning("No se detectó la página de Issues")
-            return False
-        
-        except Exception as e:
-            logger.error(f"Error al verificar página de Issues: {e}")
-            return False
-        
-        
-        
-        
-        
-        
-        
-        
-    def perform_extraction(self):
-        """
-        Método principal para ejecutar el proceso de extracción.
-        
-        Utiliza el método mejorado extract_all_issues_robust para obtener
-        datos de forma más confiable y completa.
-        
-        Returns:
-            bool: True si la extracción fue exitosa, False en caso contrario
-        """
-        try:
-            # Marcar como procesando
-            self.processing = True
-            
-            logger.info("MÉTODO: perform_extraction - Comenzando proceso de extracción mejorado")
-            
-            # Actualizar la interfaz si existe
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Comenzando extracción de datos...")
-                if self.root:
-                    self.root.update()
-            
-            # Verificar que tenemos un archivo Excel configurado
-            if not self.excel_file_path:
-                logger.warning("No se ha seleccionado archivo Excel para guardar los datos")
-                if hasattr(self, 'root') and self.root:
-                    excel_path = self.choose_excel_file()
-                    if not excel_path:
-                        logger.error("No se seleccionó archivo Excel")
-                        self.processing = False
-                        return False
-            
-            # Usar el método robusto mejorado para extraer datos
-            logger.info("Iniciando extracción robusta de issues...")
-            
-            # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Extrayendo datos con método mejorado...")
-                if self.root:
-                    self.root.update()
-            
-            # Llamar al método de extracción robusto
-            issues_data = self.browser.extract_all_issues_robust()
-            
-            # Verificar si se obtuvieron datos
-            if not issues_data or len(issues_data) == 0:
-                logger.error("No se encontraron issues para extraer")
-                
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set("Error: No se encontraron issues para extraer")
-                
-                if self.root:
-                    messagebox.showerror(
-                        "Error de Extracción", 
-                        "No se pudieron encontrar issues para extraer. Verifique que está en la página correcta."
-                    )
-                
-                self.processing = False
-                return False
-            
-            # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set(f"Guardando {len(issues_data)} issues en Excel...")
-                if self.root:
-                    self.root.update()
-            
-            # Actualizar Excel con los datos extraídos
-            success, new_items, updated_items = self.update_excel(issues_data)
-            
-            # Verificar resultado de la actualización
-            if success:
-                logger.info(f"Excel actualizado: {new_items} nuevos items, {updated_items} actualizados")
-                
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set(f"Excel actualizado: {new_items} nuevos, {updated_items} actualizados")
-                
-                if self.root:
-                    messagebox.showinfo(
-                        "Proceso Completado", 
-                        f"El archivo Excel ha sido actualizado correctamente.\n\n"
-                        f"Se han agregado {new_items} nuevos issues y actualizado {updated_items} issues existentes."
-                    )
-            else:
-                logger.error("Error al actualizar Excel")
-                
-                if hasattr(self, 'status_var') and self.status_var:
-                    self.status_var.set("Error al actualizar Excel")
-                
-                if self.root:
-                    messagebox.showerror(
-                        "Error al Actualizar Excel", 
-                        "No se pudo actualizar el archivo Excel.\n\n"
-                        "Verifique que el archivo no esté abierto en otra aplicación."
-                    )
-            
-            self.processing = False
-            return success
-            
-        except Exception as e:
-            logger.error(f"Error general en el proceso de extracción: {e}")
-            
-            # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set(f"Error: {e}")
-            
-            self.processing = False
-            return False
-
-
-
-    def start_extraction(self):
-        """
-        Inicia el proceso de extracción de issues con método mejorado.
-        Prepara la interfaz y ejecuta la extracción en un hilo separado.
-        """
-        try:
-            # Verificar si hay un proceso en curso
-            if self.processing:
-                messagebox.showwarning("Proceso en curso", "Hay un proceso de extracción en curso.")
-                return
-                
-            # Verificar que existe un archivo Excel seleccionado
-            if not self.excel_file_path:
-                messagebox.showwarning("Archivo Excel no seleccionado", "Debe seleccionar o crear un archivo Excel primero.")
-                return
-                    
-            # Verificar que el navegador está abierto
-            if not self.driver:
-                messagebox.showwarning("Navegador no iniciado", "Debe iniciar el navegador primero.")
-                return
-            
-            # Marcar como procesando
-            self.processing = True
-            
-            # Actualizar la interfaz
-            if hasattr(self, 'status_var') and self.status_var:
-                self.status_var.set("Iniciando extracción de issues...")
-                if self.root:
-                    self.root.update()
-            
-            # Ejecutar la extracción en un hilo separado para no bloquear la GUI
-            def extraction_thread():
-                try:
-                    # Usar el método de extracción mejorado
-                    success = self.perform_extraction()
-                    
-                    if not success:
-                        logger.warning("La extracción no fue exitosa")
-                        if hasattr(self, 'status_var') and self.status_var and self.root:
-                            self.root.after(0, lambda: self.status_var.set("Extracción no completada"))
-                    
-                except Exception as e:
-                    logger.error(f"Error en el hilo de extracción: {e}")
-                    if hasattr(self, 'status_var') and self.status_var and self.root:
-                        self.root.after(0, lambda: self.status_var.set(f"Error: {e}"))
-                        
-                    # Mostrar mensaje de error en el hilo principal
-                    if self.root:
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"Error durante la extracción: {e}"))
-                finally:
-                    # Restablecer estado de procesamiento
-                    self.processing = False
-                    if hasattr(self, 'status_var') and self.status_var and self.root:
-                        self.root.after(0, lambda: self.status_var.set("Extracción finalizada"))
-            
-            # Iniciar el hilo de extracción
-            threading.Thread(target=extraction_thread, daemon=True).start()
-            
-        except Exception as e:
-            logger.error(f"Error al iniciar extracción: {e}")
-            if self.root:
-                messagebox.showerror("Error", f"Error al iniciar extracción: {e}")
-            self.processing = False
-
-
-
-
-
-    
-    
-    def setup_gui_logger(self):
-        """
-        Configura el logger para que también escriba en la GUI
-        
-        Crea un handler personalizado que redirige los mensajes de log
-        al widget Text de la interfaz gráfica.
-        """
-        class TextHandler(logging.Handler):
-            def __init__(self, text_widget):
-                logging.Handler.__init__(self)
-                self.text_widget = text_widget
-            
-            def emit(self, record):
-                msg = self.format(record)
-                def append():
-                    self.text_widget.configure(state='normal')
-                    
-                    # Agregar marca de tiempo y nivel con color
-                    time_str = msg.split(' - ')[0] + ' - '
-                    level_str = record.levelname + ' - '
-                    msg_content = msg.split(' - ', 2)[2] if len(msg.split(' - ')) > 2 else ""
-                    
-                    self.text_widget.insert(tk.END, time_str, "INFO")
-                    self.text_widget.insert(tk.END, level_str, record.levelname)
-                    self.text_widget.insert(tk.END, msg_content + '\n', record.levelname)
-                    
-                    self.text_widget.configure(state='disabled')
-                    self.text_widget.yview(tk.END)
-                    
-                    # Limitar tamaño del log
-                    self.limit_log_length()
-                    
-                # Llamar a append desde el hilo principal
-                self.text_widget.after(0, append)
-                
-            def limit_log_length(self):
-                """Limita la longitud del log para evitar consumo excesivo de memoria"""
-                if float(self.text_widget.index('end-1c').split('.')[0]) > 1000:
-                    self.text_widget.configure(state='normal')
-                    self.text_widget.delete('1.0', '500.0')
-                    self.text_widget.configure(state='disabled')
-        
-        # Solo configurar si hay un widget de texto disponible
-        if hasattr(self, 'log_text') and self.log_text:
-            # Crear handler para el widget Text
-            text_handler = TextHandler(self.log_text)
-            text_handler.setLevel(logging.INFO)
-            text_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-            
-            # Añadir el handler al logger
-            logger.addHandler(text_handler)
-            
-            # Deshabilitar el widget
-            self.log_text.configure(state='disabled')
-            
-    def exit_app(self):
-        """
-        Cierra la aplicación de forma controlada
-        
-        Solicita confirmación si hay un proceso en curso, cierra el navegador
-        si el usuario lo desea, y guarda la configuración antes de salir.
-        """
-        try:
-            # Verificar si hay un proceso en curso
-            if self.processing:
-                confirm_exit = messagebox.askyesno(
-                    "Proceso en curso", 
-                    "Hay un proceso de extracción en curso. ¿Realmente desea salir?",
-                    icon='warning'
-                )
-                if not confirm_exit:
-                    return
-                    
-            if self.driver:
-                try:
-                    close_browser = messagebox.askyesno(
-                        "Cerrar navegador", 
-                        "¿Desea cerrar también el navegador?",
-                        icon='question'
-                    )
-                    if close_browser:
-                        self.browser.close()
-                        logger.info("Navegador cerrado correctamente")
-                except:
-                    logger.warning("No se pudo cerrar el navegador correctamente")
-            
-            # Guardar configuración antes de salir
-            self.save_config()
-            
-            if self.root:
-                self.root.destroy()
-        except Exception as e:
-            logger.error(f"Error al cerrar la aplicación: {e}")
-            # En caso de error, forzar cierre
-            if self.root:
-                self.root.destroy()
-
-
-
-
-
-
-
-
-
-
-
-    def add_new_client(self):
-        """
-        Muestra un diálogo para añadir un nuevo cliente a la base de datos.
-        Solicita solo el número ERP y nombre del cliente, eliminando el campo Business Partner.
-        """
-        try:
-            # Crear una ventana de diálogo personalizada
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Añadir Nuevo Cliente")
-            dialog.geometry("400x150")  # Reduzco el tamaño ya que eliminamos un campo
-            dialog.resizable(False, False)
-            dialog.grab_set()  # Modal window
-            dialog.focus_set()
-            
-            # Configurar el diálogo
-            dialog.grid_columnconfigure(1, weight=1)
-            
-            # Variables para los campos
-            erp_var = tk.StringVar()
-            name_var = tk.StringVar()
-            
-            # Etiquetas y campos de entrada
-            ttk.Label(dialog, text="ERP Customer Number:").grid(row=0, column=0, padx=10, pady=10, sticky="w")
-            erp_entry = ttk.Entry(dialog, textvariable=erp_var, width=15)
-            erp_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-            
-            ttk.Label(dialog, text="Nombre del Cliente:").grid(row=1, column=0, padx=10, pady=10, sticky="w")
-            name_entry = ttk.Entry(dialog, textvariable=name_var, width=30)
-            name_entry.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
-            
-            # Marco para botones
-            button_frame = ttk.Frame(dialog)
-            button_frame.grid(row=3, column=0, columnspan=2, pady=15)
-            
-            # Función para guardar el cliente
-            def save_client():
-                erp = erp_var.get().strip()
-                name = name_var.get().strip()
-                
-                # Validaciones
-                if not erp:
-                    messagebox.showerror("Error", "El número ERP es obligatorio", parent=dialog)
-                    return
-                    
-                if not name:
-                    messagebox.showerror("Error", "El nombre del cliente es obligatorio", parent=dialog)
-                    return
-                    
-                # Validar que el ERP sea numérico
-                if not erp.isdigit():
-                    messagebox.showerror("Error", "El número ERP debe contener solo dígitos", parent=dialog)
-                    return
-                    
-                # Guardar en la base de datos - ya no pasamos business_partner
-                if self.db_manager.save_client(erp, name):
-                    messagebox.showinfo("Éxito", f"Cliente {erp} - {name} añadido correctamente", parent=dialog)
-                    
-                    # Actualizar la lista de clientes en el combobox
-                    clients = self.db_manager.get_clients()
-                    self.client_combo['values'] = clients
-                    
-                    # Ajustar el ancho del dropdown para los clientes
-                    from ui.main_window import adjust_combobox_dropdown_width
-                    adjust_combobox_dropdown_width(self.client_combo)
-                    
-                    # Seleccionar el nuevo cliente con formato "ID - NOMBRE"
-                    full_client = f"{erp} - {name}"
-                    for i, client in enumerate(clients):
-                        if client.startswith(erp):
-                            self.client_combo.current(i)
-                            self.select_client(client)
-                            break
-                    
-                    dialog.destroy()
-                else:
-                    messagebox.showerror("Error", "No se pudo guardar el cliente", parent=dialog)
-            
-            # Botones
-            ttk.Button(button_frame, text="Guardar", command=save_client).grid(row=0, column=0, padx=10)
-            ttk.Button(button_frame, text="Cancelar", command=dialog.destroy).grid(row=0, column=1, padx=10)
-            
-            # Poner el foco en el primer campo
-            erp_entry.focus_set()
-            
-            # Centrar diálogo en la ventana principal
-            dialog.update_idletasks()
-            width = dialog.winfo_width()
-            height = dialog.winfo_height()
-            x = (self.root.winfo_width() // 2) - (width // 2) + self.root.winfo_x()
-            y = (self.root.winfo_height() // 2) - (height // 2) + self.root.winfo_y()
-            dialog.geometry(f"{width}x{height}+{x}+{y}")
-            
-            # Esperar a que se complete el diálogo
-            dialog.wait_window()
-            
-        except Exception as e:
-            logger.error(f"Error al añadir nuevo cliente: {e}")
-            if hasattr(self, 'root') and self.root:
-                messagebox.showerror("Error", f"No se pudo añadir el cliente: {e}")
-
-
-
-
-
-
-
-
-
-
-
-    def add_new_project(self):
-        """
-        Muestra un diálogo para añadir un nuevo proyecto a la base de datos.
-        Solicita solo el ID de proyecto, cliente asociado y nombre, eliminando el campo Engagement Case.
-        """
-        try:
-            # Verificar que hay clientes disponibles
-            clients = self.db_manager.get_clients()
-            if not clients:
-                messagebox.showwarning("No hay clientes", "Debe añadir al menos un cliente antes de crear un proyecto.")
-                return
-            
-            # Crear una ventana de diálogo personalizada
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Añadir Nuevo Proyecto")
-            dialog.geometry("450x200")  # Reduzco el tamaño ya que eliminamos un campo
-            dialog.resizable(False, False)
-            dialog.grab_set()  # Modal window
-            dialog.focus_set()
-            
-            # Configurar el diálogo
-            dialog.grid_columnconfigure(1, weight=1)
-            
-            # Variables para los campos
-            project_id_var = tk.StringVar()
-            client_var = tk.StringVar()
-            name_var = tk.StringVar()
-            
-            # Si hay un cliente seleccionado, usarlo como valor predeterminado
-            current_client_string = self.client_var.get() if hasattr(self, 'client_var') else ""
-            current_client_id = current_client_string.split(" - ")[0] if " - " in current_client_string else current_client_string
-            
-            if current_client_id:
-                # Buscar el cliente completo (con nombre) en la lista
-                for client in clients:
-                    if client.startswith(current_client_id):
-                        client_var.set(client)
-                        break
-            
-            # Etiquetas y campos de entrada
-            ttk.Label(dialog, text="Case ID o Número de Proyecto:").grid(row=0, column=0, padx=10, pady=10, sticky="w")
-            project_entry = ttk.Entry(dialog, textvariable=project_id_var, width=15)
-            project_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-            
-            ttk.Label(dialog, text="Cliente:").grid(row=1, column=0, padx=10, pady=10, sticky="w")
-            client_combo = ttk.Combobox(dialog, textvariable=client_var, values=clients, width=30, state="readonly")
-            client_combo.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
-            
-            ttk.Label(dialog, text="Nombre del Proyecto:").grid(row=2, column=0, padx=10, pady=10, sticky="w")
-            name_entry = ttk.Entry(dialog, textvariable=name_var, width=30)
-            name_entry.grid(row=2, column=1, padx=10, pady=10, sticky="ew")
-            
-            # Marco para botones
-            button_frame = ttk.Frame(dialog)
-            button_frame.grid(row=4, column=0, columnspan=2, pady=15)
-            
-            # Función para guardar el proyecto
-            def save_project():
-                project_id = project_id_var.get().strip()
-                selected_client = client_var.get().strip()
-                name = name_var.get().strip()
-                
-                # Validaciones
-                if not project_id:
-                    messagebox.showerror("Error", "El ID de proyecto es obligatorio", parent=dialog)
-                    return
-                    
-                if not selected_client:
-                    messagebox.showerror("Error", "Debes seleccionar un cliente", parent=dialog)
-                    return
-                    
-                if not name:
-                    messagebox.showerror("Error", "El nombre del proyecto es obligatorio", parent=dialog)
-                    return
-                    
-                # Validar que el ID de proyecto sea numérico
-                if not project_id.isdigit():
-                    messagebox.showerror("Error", "El ID de proyecto debe contener solo dígitos", parent=dialog)
-                    return
-                    
-                # Extraer el ERP number del cliente seleccionado (formato: "1025541 - Nombre")
-                client_erp = selected_client.split(" - ")[0].strip()
-                
-                # Guardar en la base de datos - ya no pasamos engagement_case (cadena vacía)
-                if self.db_manager.save_project(project_id, client_erp, name):
-                    messagebox.showinfo("Éxito", f"Proyecto {project_id} - {name} añadido correctamente", parent=dialog)
-                    
-                    # Actualizar la lista de proyectos en el combobox
-                    projects = self.db_manager.get_projects(client_erp)
-                    self.project_combo['values'] = projects
-                    
-                    # Ajustar el ancho del dropdown para los proyectos
-                    from ui.main_window import adjust_combobox_dropdown_width
-                    adjust_combobox_dropdown_width(self.project_combo)
-                    
-                    # Seleccionar el nuevo proyecto con formato "ID - NOMBRE"
-                    full_project = f"{project_id} - {name}"
-                    for i, project in enumerate(projects):
-                        if project.startswith(project_id):
-                            self.project_combo.current(i)
-                            self.select_project(project)
-                            break
-                    
-                    dialog.destroy()
-                else:
-                    messagebox.showerror("Error", "No se pudo guardar el proyecto", parent=dialog)
-            
-            # Botones
-            ttk.Button(button_frame, text="Guardar", command=save_project).grid(row=0, column=0, padx=10)
-            ttk.Button(button_frame, text="Cancelar", command=dialog.destroy).grid(row=0, column=1, padx=10)
-            
-            # Poner el foco en el primer campo
-            project_entry.focus_set()
-            
-            # Centrar diálogo en la ventana principal
-            dialog.update_idletasks()
-            width = dialog.winfo_width()
-            height = dialog.winfo_height()
-            x = (self.root.winfo_width() // 2) - (width // 2) + self.root.winfo_x()
-            y = (self.root.winfo_height() // 2) - (height // 2) + self.root.winfo_y()
-            dialog.geometry(f"{width}x{height}+{x}+{y}")
-            
-            # Esperar a que se complete el diálogo
-            dialog.wait_window()
-            
-        except Exception as e:
-            logger.error(f"Error al añadir nuevo proyecto: {e}")
-            if hasattr(self, 'root') and self.root:
-                messagebox.showerror("Error", f"No se pudo añadir el proyecto: {e}")
-
-
-
-
-
-
-
-
-
-
-
-    def select_client(self, client_string):
-        """
-        Maneja la selección de un cliente desde el combobox
-        
-        Args:
-            client_string (str): String en formato "1025541 - Nombre del cliente"
-        """
-        try:
-            if not client_string or len(client_string) < 3:
-                return
-                    
-            # Extraer el ERP number del string "1025541 - Nombre del cliente"
-            parts = client_string.split(" - ")
-            erp_number = parts[0].strip()
-            
-            # Establecer el valor en el Entry
-            self.client_var.set(client_string)
-            logger.info(f"Cliente seleccionado: {client_string}")
-            
-            # Actualizar inmediatamente la interfaz para confirmar el cambio
-            if self.root:
-                self.root.update_idletasks()
-            
-            # Actualizar la lista de proyectos para este cliente
-            projects = self.db_manager.get_projects(erp_number)
-            self.project_combo['values'] = projects
-            
-            # Ajustar el ancho del dropdown para los proyectos
-            from ui.main_window import adjust_combobox_dropdown_width
-            adjust_combobox_dropdown_width(self.project_combo)
-            
-            # Si hay proyectos disponibles, seleccionar el primero
-            if projects:
-                self.project_combo.current(0)
-                self.select_project(projects[0])
-                        
-            # Actualizar el uso de este cliente
-            self.db_manager.update_client_usage(erp_number)
-            self.save_config()
-        except Exception as e:
-            logger.error(f"Error al seleccionar cliente: {e}")
-
-
-
-
-
-
-
-
-
-    def select_project(self, project_string):
-        """
-        Maneja la selección de un proyecto desde el combobox
-        
-        Args:
-            project_string (str): String en formato "20096444 - Nombre del proyecto"
-        """
-        try:
-            if not project_string or len(project_string) < 3:
-                return
-                    
-            # Extraer el ID del proyecto del string "20096444 - Nombre del proyecto"
-            parts = project_string.split(" - ")
-            project_id = parts[0].strip()
-            
-            # Establecer el valor en el Entry - AQUÍ ESTÁ EL CAMBIO
-            # En lugar de solo establecer el ID, mantener todo el string con nombre
-            self.project_var.set(project_string)
-            logger.info(f"Proyecto seleccionado: {project_string}")
-            
-            # Actualizar inmediatamente la interfaz para confirmar el cambio
-            if self.root:
-                self.root.update_idletasks()
-            
-            # Actualizar el uso de este proyecto
-            self.db_manager.update_project_usage(project_id)
-            self.save_config()
-        except Exception as e:
-            logger.error(f"Error al seleccionar proyecto: {e}")
-
-
-
-
-
-
-
-
-
-
-
-    def _replace_standard_messageboxes(self):
-        """
-        Reemplaza los messagebox estándar por nuestros diálogos personalizados
-        con mejor formato y alineación de texto.
-        
-        Este método modifica el comportamiento de messagebox para usar nuestros
-        diálogos personalizados que manejan mejor la alineación del texto.
-        """
-        try:
-            # Intentar importar los diálogos personalizados
-            from ui.custom_dialogs import (
-                show_info, show_warning, show_error, show_question
-            )
-            
-            # Guardar referencia a funciones originales
-            self._original_showinfo = messagebox.showinfo
-            self._original_showwarning = messagebox.showwarning
-            self._original_showerror = messagebox.showerror
-            self._original_askokcancel = messagebox.askokcancel
-            
-            # Reemplazar con las versiones mejoradas pero preservando la interfaz original
-            def custom_showinfo(title, message, **kwargs):
-                if self.root:
-                    return show_info(self.root, title, message)
-                else:
-                    return self._original_showinfo(title, message, **kwargs)
-                    
-            def custom_showwarning(title, message, **kwargs):
-                if self.root:
-                    return show_warning(self.root, title, message)
-                else:
-                    return self._original_showwarning(title, message, **kwargs)
-                    
-            def custom_showerror(title, message, **kwargs):
-                if self.root:
-                    return show_error(self.root, title, message)
-                else:
-                    return self._original_showerror(title, message, **kwargs)
-                    
-            def custom_askokcancel(title, message, **kwargs):
-                # Para diálogos que requieren respuesta, todavía usamos los originales
-                # ya que nuestros personalizados no tienen esa funcionalidad aún
-                return self._original_askokcancel(title, message, **kwargs)
-            
-            # Aplicar los reemplazos a nivel global
-            messagebox.showinfo = custom_showinfo
-            messagebox.showwarning = custom_showwarning
-            messagebox.showerror = custom_showerror
-            # No reemplazamos askokcancel ya que necesitamos su funcionalidad de respuesta
-            
-            return True
-            
-        except ImportError:
-            logger.debug("Diálogos personalizados no disponibles, usando messagebox estándar")
-            return False
-        except Exception as e:
-            logger.error(f"Error al reemplazar messageboxes: {e}")
-            return False
-
-
-
-
-
-
-
-
-
-
-
-
-    def start_browser(self):
-        """
-        Inicia el navegador desde la interfaz gráfica
-        
-        Este método prepara la interfaz y ejecuta la inicialización del navegador
-        en un hilo separado para no bloquear la interfaz.
-        """
-        try:
-            # Verificar si hay un proceso en curso
-            if self.processing:
-                messagebox.showwarning("Proceso en curso", "Hay un proceso de extracción en curso.")
-                return
-                
-            # Asegurarse de que no haya un navegador ya abierto
-            if self.driver:
-                messagebox.showinfo("Navegador ya iniciado", "El navegador ya está iniciado.")
-                return
-                
-            # Actualizar la interfaz para mostrar que se está iniciando el navegador
-            self.status_var.set("Iniciando navegador...")
-            if self.root:
-                self.root.update()
-            
-            # Iniciar el navegador en un hilo separado
-            threading.Thread(target=self._start_browser_thread, daemon=True).start()
-            
-        except Exception as e:
-            logger.error(f"Error al iniciar el navegador: {e}")
-            self.status_var.set(f"Error: {e}")
-            messagebox.showerror("Error", f"Error al iniciar el navegador: {e}")
-
-
-
-
-
-
-
-
-
-    def _start_browser_thread(self):
-        """
-        Método para ejecutar la inicialización del navegador en un hilo separado
-        
-        Realiza la conexión con el navegador y navega a la URL inicial de SAP.
-        """
-        try:
-            if self.connect_to_browser():
-                logger.info("Navegador iniciado")
-                
-                # Actualizar la interfaz en el hilo principal
-                if self.root:
-                    self.root.after(0, lambda: self.status_var.set("Navegador iniciado. Navegando a SAP..."))
-                
-                # Obtener valores de cliente y proyecto
-                erp_number = self.client_var.get() if hasattr(self, 'client_var') and self.client_var else "1025541"
-                project_id = self.project_var.get() if hasattr(self, 'project_var') and self.project_var else "20096444"
-                
-                # Navegar a la URL de SAP con parámetros específicos
-                self.browser.navigate_to_sap(erp_number, project_id)
-                
-                # Esperar a que se cargue completamente la página y maneje autenticación si es necesario
-                self.browser.handle_authentication()
-                time.sleep(3)  # Dar tiempo para que la interfaz se estabilice
-                
-                # NUEVA SECUENCIA: Configurar columnas después de navegación
-                # Actualizar la interfaz en el hilo principal
-                if self.root:
-                    self.root.after(0, lambda: self.status_var.set("Configurando columnas visibles..."))
-                
-                # 1. Hacer clic en el botón de ajustes usando el método mejorado
-                if self.browser.enhanced_click_settings_button():
-                    logger.info("✅ Botón de ajustes pulsado correctamente")
-                    
-                    # Esperar a que se abra el panel de ajustes
-                    time.sleep(1) #Modificado de 2 a 1 segundo
-                    
-                    # 2. Usar el nuevo método de secuencia exacta de teclas
-                    if self.browser.perform_exact_keyboard_sequence():
-                        logger.info("✅ Columnas configuradas correctamente mediante secuencia exacta de teclas")
-                        
-                        # Esperar a que se recargue la tabla con las nuevas columnas
-                        time.sleep(1) #Modificado de 3 a 1 segundo
-                    else:
-                        logger.warning("⚠️ No se pudieron configurar todas las columnas")
-                        
-                        # Informar al usuario en el hilo principal
-                        if self.root:
-                            self.root.after(0, lambda: messagebox.showinfo(
-                                "Configuración manual",
-                                "No se pudieron configurar todas las columnas automáticamente.\n\n"
-                                "Por favor, realice estos pasos manualmente:\n"
-                                "1. 5 tabs\n"
-                                "2. 2 flechas a la derecha\n"
-                                "3. Enter (para Select Columns)\n"
-                                "4. 3 tabs\n"
-                                "5. Enter (para Select All)\n"
-                                "6. 2 tabs\n"
-                                "7. Enter (para OK)"
-                            ))
-                else:
-                    logger.warning("⚠️ No se pudo hacer clic en el botón de ajustes")
-                    
-                    # Informar al usuario en el hilo principal
-                    if self.root:
-                        self.root.after(0, lambda: messagebox.showwarning(
-                            "Acción Manual Requerida",
-                            "No se pudo hacer clic en el botón de ajustes automáticamente.\n\n"
-                            "Por favor, haga clic manualmente en el botón de ajustes (engranaje) ubicado en la esquina inferior derecha."
-                        ))
-                
-                # Mostrar instrucciones en el hilo principal
-                if self.root:
-                    self.root.after(0, lambda: self.status_var.set("Navegación completada. Inicie la extracción cuando esté listo."))
-                    self.root.after(0, self._show_extraction_instructions)
-            else:
-                if self.root:
-                    self.root.after(0, lambda: self.status_var.set("Error al iniciar el navegador"))
-                    self.root.after(0, lambda: messagebox.showerror("Error", "No se pudo iniciar el navegador. Revise el log para más detalles."))
-        except Exception as e:
-            logger.error(f"Error en hilo de navegador: {e}")
-            if self.root:
-                self.root.after(0, lambda: self.status_var.set(f"Error: {e}"))
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Error al iniciar el navegador: {e}"))
-
-
-
-
-
-    def _show_extraction_instructions(self):
-        """
-        Muestra instrucciones para la extracción después de la navegación automática
-        utilizando el diálogo personalizado con mejor formato.
-        
-        Presenta un mensaje con información sobre el cliente y proyecto actuales,
-        incluyendo sus nombres, y guía al usuario sobre los siguientes pasos.
-        """
-        # Obtener valores actuales
-        erp_number = self.client_var.get()
-        project_id = self.project_var.get()
-        
-        # Obtener nombres de cliente y proyecto desde la base de datos
-        client_name = ""
-        project_name = ""
-        
-        # Buscar el nombre del cliente
-        try:
-            conn = sqlite3.connect(self.db_manager.db_path)
-            cursor = conn.cursor()
-            
-            # Consultar nombre del cliente
-            cursor.execute("SELECT name FROM clients WHERE erp_number = ?", (erp_number,))
-            client_result = cursor.fetchone()
-            if client_result:
-                client_name = client_result[0]
-                
-            # Consultar nombre del proyecto
-            cursor.execute("SELECT name FROM projects WHERE project_id = ?", (project_id,))
-            project_result = cursor.fetchone()
-            if project_result:
-                project_name = project_result[0]
-                
-        except Exception as e:
-            logger.error(f"Error al obtener nombres de cliente/proyecto: {e}")
-        finally:
-            if conn:
-                conn.close()
-        
-        # Formatear la información con los nombres
-        client_info = f"{erp_number}"
-        if client_name:
-            client_info += f" - {client_name}"
-            
-        project_info = f"{project_id}"
-        if project_name:
-            project_info += f" - {project_name}"
-        
-        try:
-            # Intentar usar el diálogo personalizado si está disponible
-            from ui.custom_dialogs import show_extraction_instructions
-            show_extraction_instructions(self.root, client_info, project_info)
-        except ImportError:
-            # Fallback a messagebox estándar si no está disponible el diálogo personalizado
-            instructions = f"""
-    La aplicación ha navegado automáticamente a la página de SAP con:
-
-    Cliente: {client_info}
-    Proyecto: {project_info}
-
-    Por favor:
-    1. Verifica que has iniciado sesión correctamente
-    2. Comprueba que puedes ver las recomendaciones para el cliente
-    3. Cuando quieras comenzar, haz clic en 'Iniciar Extracción'
-            """
-            
-            messagebox.showinfo("Instrucciones de Extracción", instructions)
-
-
-
-    def load_config(self):
-        """
-        Carga la configuración guardada desde un archivo JSON
-        
-        Restaura los valores de cliente, proyecto y ruta del archivo Excel
-        de ejecuciones anteriores.
-        """
-        try:
-            config_path = os.path.join('config', 'config.json')
-            
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                        
-                    if 'client' in config and config['client']:
-                        client_id = config['client'].strip()
-                        
-                        # Buscar el cliente completo (con nombre) en la base de datos
-                        found = False
-                        clients = self.db_manager.get_clients()
-                        for client in clients:
-                            if client.startswith(client_id):
-                                self.client_var.set(client)
-                                found = True
-                                break
-                        
-                        # Si no se encuentra, usar solo el ID
-                        if not found:
-                            self.client_var.set(client_id)
-                            
-                    if 'project' in config and config['project']:
-                        project_id = config['project'].strip()
-                        
-                        # Buscar el proyecto completo (con nombre) en la base de datos
-                        found = False
-                        client_id = self.client_var.get().split(" - ")[0] if " - " in self.client_var.get() else self.client_var.get()
-                        projects = self.db_manager.get_projects(client_id)
-                        for project in projects:
-                            if project.startswith(project_id):
-                                self.project_var.set(project)
-                                found = True
-                                break
-                        
-                        # Si no se encuentra, usar solo el ID
-                        if not found:
-                            self.project_var.set(project_id)
-                            
-                    if 'excel_path' in config and os.path.exists(config['excel_path']):
-                        self.excel_file_path = config['excel_path']
-                        self.excel_manager.file_path = config['excel_path']
-                        if hasattr(self, 'excel_filename_var') and self.excel_filename_var:
-                            self.excel_filename_var.set(f"Archivo: {os.path.basename(config['excel_path'])}")
-                            
-                    logger.info("Configuración cargada correctamente")
-        except Exception as e:
-            logger.error(f"Error al cargar configuración: {e}")
-
-
-
-
-    def save_config(self):
-        """
-        Guarda la configuración actual en un archivo JSON
-        
-        Almacena los valores actuales de cliente, proyecto y ruta del archivo Excel
-        para restaurarlos en futuras ejecuciones.
-        """
-        try:
-            # Extraer los IDs de cliente y proyecto (solo los números)
-            client_string = self.client_var.get()
-            project_string = self.project_var.get()
-            
-            client_id = client_string.split(" - ")[0] if " - " in client_string else client_string
-            project_id = project_string.split(" - ")[0] if " - " in project_string else project_string
-            
-            config = {
-                'client': client_id,
-                'project': project_id,
-                'excel_path': self.excel_file_path
-            }
-            
-            config_dir = "config"
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-                    
-            config_path = os.path.join(config_dir, 'config.json')
-            
-            with open(config_path, 'w') as f:
-                json.dump(config, f)
-                    
-            logger.debug("Configuración guardada correctamente")
-        except Exception as e:
-            logger.error(f"Error al guardar configuración: {e}")
-
-
-
-
-
-    def create_gui(self):
-        """
-        Crea la interfaz gráfica completa de la aplicación
-        
-        Este método configura la ventana principal, los paneles, controles y
-        eventos de la interfaz gráfica de usuario. También inicializa los
-        diálogos personalizados para mejor formato de texto.
-        """
-        from ui.main_window import MainWindow
-        
-        # Crear la ventana principal
-        self.root = tk.Tk()
-        
-        # Inicializar variables
-        self.client_var = tk.StringVar(value="1025541") 
-        self.project_var = tk.StringVar(value="20096444")
-        
-        # Crear la interfaz utilizando la clase MainWindow
-        main_window = MainWindow(self.root, self)
-        main_window.setup_ui()
-        
-        # Configurar logger GUI y carga de configuración
-        self.setup_gui_logger()
-        self.load_config()
-        
-        # Reemplazar los messagebox estándar con nuestros diálogos personalizados
-        self._replace_standard_messageboxes()
-
-
-
-
-
-
-    def main_gui(self):
-        """
-        Punto de entrada principal con interfaz gráfica
-        
-        Crea la interfaz y ejecuta el bucle principal de eventos.
-        """
-        self.create_gui()
-        if self.root:
-            self.root.mainloop()
-
-
-
-
-
-
-# Métodos para ejecución en modo consola
-def run_console_mode():
-    """
-    Ejecuta la aplicación en modo consola sin interfaz gráfica
-    
-    Returns:
-        bool: True si la extracción fue exitosa, False en caso contrario
-    """
-    extractor = IssuesExtractor()
-    
-    # Solicitar información al usuario
-    print("\n===== SAP Issues Extractor - Modo Consola =====\n")
-    
-    # Cliente
-    erp_number = input("Ingresa el ERP Customer Number (Ej: 1025541): ").strip()
-    extractor.client_var = type('obj', (object,), {'get': lambda: erp_number})
-    
-    # Proyecto
-    project_id = input("Ingresa el Case ID o número del proyecto (Ej: 20096444): ").strip()
-    extractor.project_var = type('obj', (object,), {'get': lambda: project_id})
-    
-    # Archivo Excel
-    print("\nSeleccione un archivo Excel para guardar los resultados:")
-    extractor.choose_excel_file()
-    
-    # Confirmar y ejecutar
-    print(f"\nConfiguración actual:")
-    print(f"  - Cliente: {erp_number}")
-    print(f"  - Proyecto: {project_id}")
-    print(f"  - Archivo Excel: {os.path.basename(extractor.excel_file_path)}")
-    
-    confirm = input("\n¿Desea iniciar la extracción? (S/N): ").strip().upper()
-    if confirm != 'S':
-        print("Extracción cancelada por el usuario.")
-        return False
-    
-    print("\nIniciando proceso de extracción...\n")
-    result = extractor.run_extraction()
-    
-    if result:
-        print("\n¡Extracción completada con éxito!")
-    else:
-        print("\nLa extracción falló. Revise el log para más detalles.")
-    
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IssuesExtractor - Módulo principal para coordinación del proceso de extracción
+
+Este módulo define la clase IssuesExtractor que coordina el proceso completo
+de extracción de issues de SAP, utilizando los otros componentes:
+- SAPBrowser: Para la automatización del navegador
+- DatabaseManager: Para gestionar clientes y proyectos
+- ExcelManager: Para manejar los archivos Excel de salida
+
+La clase proporciona métodos para ejecutar el proceso de extracción con o sin
+interfaz gráfica, y permite al usuario seleccionar clientes, proyectos y 
+archivos Excel destino para los datos.
+"""
+
+import os
+import sys
+import time
+import threading
+import queue
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import re
+from collections import deque
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    WebDriverException
+)
+
+# Importaciones de otros módulos del proyecto
+from utils.logger_config import setup_logger
+from utils.lazy_import import lazy_import
+from data.database_manager import DatabaseManager, format_client_row, format_project_row, issue_fingerprint, file_stamp
+from data.excel_manager import ExcelManager
+from browser.sap_browser import SAPBrowser, apply_status
+from config.settings import SAP_COLORS, SELECTORS, TIMEOUTS
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# tkinter se carga en el primer uso: el modo consola (sin interfaz) no lo necesita
+tk = lazy_import("tkinter")
+ttk = lazy_import("tkinter.ttk")
+filedialog = lazy_import("tkinter.filedialog")
+messagebox = lazy_import("tkinter.messagebox")
+
+# orjson es opcional: (de)serializa la configuración más rápido que json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Selectores XPath usados en la navegación y verificación de la página de Issues.
+# Se definen una sola vez al importar el módulo.
+_ISSUES_TAB_SELECTORS = (
+    "//div[contains(text(), 'Issues')] | //span[contains(text(), 'Issues')]",
+    "//li[@role='tab']//div[contains(text(), 'Issues')]",
+    "//a[contains(text(), 'Issues')]",
+)
+# Unión de todos los selectores para resolverlos con una única llamada a find_elements
+_ISSUES_TAB_XPATH = " | ".join(_ISSUES_TAB_SELECTORS)
+_TAB_XPATH = "//li[@role='tab'] | //div[@role='tab']"
+# Errores esperables al consultar o pulsar pestañas; el resto se propaga
+_TAB_PROBE_ERRORS = (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    WebDriverException,
+)
+_ISSUES_TITLE_XPATH = "//div[contains(text(), 'Issues') and contains(text(), '(')]"
+_ISSUES_HEADER_XPATH = "//div[text()='Title'] | //div[text()='Type'] | //div[text()='Priority'] | //div[text()='Status']"
+_TABLE_ROWS_XPATH = " | ".join(SELECTORS["table_rows"])
+
+# Selectores CSS sobre clases/roles estables de UI5; el texto se filtra en Python
+_ISSUES_TAB_CSS = ".sapMITBItem"
+_CUSTOMER_FIELD_XPATH = " | ".join(SELECTORS["customer_field"])
+_SETTINGS_PANEL_XPATH = (
+    "//div[contains(@class, 'sapMDialog') and contains(@class, 'sapMPopup-CTX')] | "
+    "//div[contains(@class, 'sapMPopover') and contains(@class, 'sapMPopup-CTX')]"
+)
+# Señales de que la página de Issues ya se ha cargado tras el clic en la pestaña
+_ISSUES_LOADED_XPATH = _ISSUES_TITLE_XPATH + " | " + _TABLE_ROWS_XPATH
+
+# Sondeo en la página de las tres señales de la página de Issues (título, filas y
+# encabezados) con una sola llamada a execute_script. Argumentos: XPath del título,
+# de las filas y de los encabezados.
+_DETECT_ISSUES_PAGE_JS = """
+function countNodes(xpath) {
+    return document.evaluate('count(' + xpath + ')', document, null, XPathResult.NUMBER_TYPE, null).numberValue;
+}
+var title = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+return {
+    title: title ? title.textContent : null,
+    rows: countNodes(arguments[1]),
+    headers: countNodes(arguments[2])
+};
+"""
+
+# Búsqueda y clic de la pestaña Issues en una sola llamada a execute_script: primero
+# entre las pestañas UI5 (CSS) cuyo texto empieza por "Issues" y, si no hay ninguna,
+# el primer nodo visible de la unión XPath. Argumentos: selector CSS y XPath.
+# Devuelve la estrategia que encontró la pestaña ("css"/"xpath") o null.
+_CLICK_ISSUES_TAB_JS = """
+function activate(el) {
+    el.scrollIntoView({block: 'center'});
+    el.click();
+}
+var tabs = document.querySelectorAll(arguments[0]);
+for (var i = 0; i < tabs.length; i++) {
+    var tab = tabs[i];
+    if (tab.offsetParent !== null && (tab.innerText || '').trim().indexOf('Issues') === 0) {
+        activate(tab);
+        return 'css';
+    }
+}
+var found = document.evaluate(arguments[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (var j = 0; j < found.snapshotLength; j++) {
+    var node = found.snapshotItem(j);
+    if (node.offsetParent !== null) {
+        activate(node);
+        return 'xpath';
+    }
+}
+return null;
+"""
+
+
+class IssuesExtractor:
+    """
+    Clase principal para extraer issues de SAP con interfaz gráfica y base de datos
+    
+    Esta clase coordina todo el proceso de extracción, desde la conexión
+    con el navegador, la selección de clientes y proyectos, hasta la extracción
+    de datos y su almacenamiento en archivos Excel.
+    """
+    
+    # Atributos fijos: sin __dict__ por instancia y acceso más rápido en los bucles de espera.
+    # Cualquier atributo nuevo debe declararse aquí.
+    __slots__ = (
+        "excel_file_path", "_excel_basename", "driver", "root",
+        "status_var", "client_var", "project_var", "project_combo", "log_text",
+        "excel_filename_var", "processing", "left_panel", "header_frame", "client_combo",
+        "_status_queue", "_status_pipe", "_executor", "_save_config_after_id", "_config_queue", "_config_writer", "_config_lock",
+        "db_manager", "excel_manager", "browser",
+        "_mb_warn", "_mb_ask", "_mb_info", "_mb_err", "confirm_fn",
+        "_original_showinfo", "_original_showwarning", "_original_showerror", "_original_askokcancel",
+    )
+    
+    # Identificador al inicio de "1025541 - Nombre" (o el texto completo si no hay nombre)
+    _ID_RE = re.compile(r'^\s*(.*?)\s*(?: - |$)')
+
+    def __init__(self):
+        """Inicializa la clase con sus componentes y variables necesarias"""
+        self.excel_file_path = None
+        self._excel_basename = None  # Nombre del archivo Excel, calculado una vez por selección
+        self.driver = None
+        # Confirmación de los pasos manuales: callable(título, pregunta) -> bool.
+        # Con None se usan los diálogos (con interfaz) o la consola
+        self.confirm_fn = None
+        
+        # Inicializar root primero (si se va a usar GUI)
+        self.root = None
+        
+        # Variables que dependen de Tkinter - inicializar como None. Las etiquetas de
+        # estado y de archivo usan _NullVar hasta que la GUI las sustituye, para que
+        # se puedan actualizar sin comprobar antes si existen
+        self.status_var = _NullVar()
+        self.client_var = None
+        self.project_var = None
+        self.project_combo = None
+        self.log_text = None
+        self.excel_filename_var = _NullVar()
+        self.processing = False
+        self.left_panel = None
+        self.header_frame = None
+        self.client_combo = None
+        
+        # Cola de mensajes de estado: los hilos de trabajo solo encolan y el hilo
+        # de Tk los aplica periódicamente con root.after (ver _drain_status)
+        self._status_queue = queue.Queue()
+        
+        # Tubería (read_fd, write_fd) que despierta a Tk al encolar un mensaje,
+        # solo en plataformas con createfilehandler (ver _setup_status_pipe)
+        self._status_pipe = None
+        
+        # Hilos de trabajo reutilizables para el navegador y la extracción
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sap-extract")
+        
+        # Guardado de configuración pendiente (root.after), para agrupar selecciones seguidas
+        self._save_config_after_id = None
+        
+        # Escritura de config.json en un hilo aparte (ver save_config)
+        self._config_queue = queue.Queue()
+        self._config_writer = None
+        self._config_lock = threading.Lock()
+        
+        # Componentes
+        self.db_manager = DatabaseManager()
+        self.excel_manager = ExcelManager()
+        # Un libro nuevo (aunque reutilice la ruta de otro) no contiene issues previos
+        self.excel_manager.on_file_created = self.db_manager.clear_extraction_state
+        self.browser = SAPBrowser()
+        
+        # Configurar referencias cruzadas para que el navegador pueda acceder a UI
+        self.setup_browser_ui_references()
+    
+    def setup_browser_ui_references(self):
+        """
+        Configura las referencias a la interfaz de usuario en el navegador.
+        Esto permite que el navegador actualice directamente la interfaz.
+        """
+        # Asignar referencias a la UI si existen
+        self.browser.root = self.root
+        self.browser.status_var = self.status_var
+        
+        # Agregar logger a ambos componentes para registrar eventos
+        logger.debug("Referencias cruzadas de UI configuradas en el navegador")
+    
+    def _set_status(self, message):
+        """
+        Actualiza el mensaje de estado de la interfaz (sin efecto en modo consola)
+        
+        Con la GUI en marcha el mensaje solo se encola, por lo que puede llamarse
+        desde cualquier hilo; _drain_status lo aplica desde el hilo de Tk.
+        
+        Args:
+            message (str): Mensaje a mostrar en la barra de estado
+        """
+        if self.root:
+            self._status_queue.put(message)
+            pipe = self._status_pipe
+            if pipe:
+                try:
+                    os.write(pipe[1], b"\0")
+                except (BlockingIOError, OSError):
+                    # Tubería llena o cerrada: ya hay un despertar pendiente o se está saliendo
+                    pass
+        else:
+            apply_status(self.status_var, message)
+            
+    def _apply_pending_status(self):
+        """
+        Aplica el último mensaje de estado encolado
+        
+        Los mensajes intermedios se descartan: solo el más reciente sería visible.
+        Tampoco se vuelve a aplicar un mensaje igual al que ya se muestra.
+        """
+        message = None
+        try:
+            while True:
+                message = self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
+            
+        if message is not None:
+            apply_status(self.status_var, message)
+            
+    def _setup_status_pipe(self):
+        """
+        Registra una tubería en el bucle de eventos de Tk para los mensajes de estado
+        
+        Con createfilehandler Tk se despierta en cuanto un hilo escribe en la
+        tubería, sin esperar al siguiente sondeo de root.after. No existe en
+        Windows, donde se mantiene el sondeo de _drain_status.
+        
+        Returns:
+            bool: True si la tubería quedó registrada
+        """
+        if not self.root or not hasattr(self.root.tk, "createfilehandler"):
+            return False
+            
+        try:
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            os.set_blocking(write_fd, False)
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_status_pipe)
+        except (OSError, tk.TclError) as e:
+            logger.debug(f"No se pudo registrar la tubería de estado, se usará sondeo: {e}")
+            return False
+            
+        self._status_pipe = (read_fd, write_fd)
+        return True
+        
+    def _on_status_pipe(self, fd, mask):
+        """
+        Callback de Tk cuando hay datos en la tubería de estado
+        
+        Vacía la tubería de una vez y aplica el último mensaje encolado.
+        
+        Args:
+            fd (int): Descriptor de lectura de la tubería
+            mask (int): Máscara de eventos de Tk (no se usa)
+        """
+        try:
+            while os.read(fd, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self._apply_pending_status()
+        
+    def _close_status_pipe(self):
+        """Elimina el manejador de Tk y cierra la tubería de estado, si existe"""
+        pipe = self._status_pipe
+        if not pipe:
+            return
+        self._status_pipe = None
+        try:
+            self.root.tk.deletefilehandler(pipe[0])
+        except (AttributeError, tk.TclError):
+            pass
+        for fd in pipe:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            
+    def _drain_status(self):
+        """
+        Aplica el último mensaje de estado encolado y se reprograma cada 100 ms
+        
+        Solo se usa cuando no hay tubería de estado (ver _setup_status_pipe).
+        """
+        self._apply_pending_status()
+            
+        if self.root:
+            try:
+                self.root.after(100, self._drain_status)
+            except tk.TclError:
+                # La ventana ya se cerró
+                pass
+            
+    def configure_columns_after_settings(self):
+        """
+        Método auxiliar para configurar todas las columnas después de abrir el panel de ajustes.
+        Este método debe ser llamado después de hacer clic en el botón de ajustes.
+        
+        Utiliza la implementación robusta de selección de columnas que sigue
+        la secuencia de teclas verificada en las pruebas.
+        
+        Returns:
+            bool: True si el proceso fue exitoso, False en caso contrario
+        """
+        try:
+            logger.info("Configurando columnas después de abrir panel de ajustes...")
+            
+            # Verificar que tenemos acceso al navegador
+            if not self.browser or not self.driver:
+                logger.error("No hay navegador inicializado")
+                return False
+            
+            # Ejecutar la selección de columnas usando el método robusto
+            # Este método utiliza una secuencia específica de teclas (Tab, flechas, Enter)
+            # que ha sido verificada en pruebas
+            result = self.browser.select_all_visible_columns()
+            
+            if result:
+                logger.info("[OK] Columnas configuradas correctamente")
+            else:
+                logger.warning("[ERROR] No se pudo completar la configuración de columnas")
+                
+            return result
+        except Exception as e:
+            logger.error(f"Error al configurar columnas: {e}")
+            return False
+            
+    def choose_excel_file(self):
+        """Permite al usuario elegir un archivo Excel existente o crear uno nuevo"""
+        file_path = self.excel_manager.select_file()
+        self.excel_file_path = file_path
+        self.excel_manager.file_path = file_path
+        base = os.path.basename(file_path)
+        self._excel_basename = base
+        
+        # Actualizar la interfaz si existe
+        self._set_status(f"Archivo Excel seleccionado: {base}")
+        
+        # Actualizar el nombre del archivo en la etiqueta
+        self.excel_filename_var.set(f"Archivo: {base}")
+            
+        return file_path
+        
+    def _headless_mode(self):
+        """
+        Indica si Chrome debe ejecutarse sin ventana
+        
+        Returns:
+            bool: True sin interfaz gráfica o con EXTRACTOR_HEADLESS=1
+        """
+        return self.root is None or os.environ.get("EXTRACTOR_HEADLESS") == "1"
+        
+    def connect_to_browser(self):
+        """
+        Conecta con el navegador y devuelve el éxito de la conexión
+        
+        Sin interfaz gráfica (o con EXTRACTOR_HEADLESS=1) Chrome se inicia en
+        modo headless, más rápido y ligero al no pintar ventana ni imágenes.
+        """
+        result = self.browser.connect(headless=self._headless_mode())
+        self.driver = self.browser.driver
+        # Actualizar referencias UI después de tener el driver
+        self.setup_browser_ui_references()
+        return result
+        
+    def update_excel(self, issues_data, erp_number=None, project_id=None):
+        """
+        Actualiza el archivo Excel con los datos extraídos
+        
+        Si se indican cliente y proyecto, se consulta el estado de extracción en
+        SQLite y solo se combinan con el Excel los issues nuevos o con cambios en
+        los campos seguidos; los demás ya están escritos tal cual en ese archivo.
+        
+        Args:
+            issues_data (list): Lista de diccionarios con datos de issues
+            erp_number (str, optional): Número ERP del cliente extraído
+            project_id (str, optional): ID del proyecto extraído
+            
+        Returns:
+            tuple: (success, new_items, updated_items)
+        """
+        success, new_items, updated_items = self._write_issues(issues_data, erp_number, project_id)
+        
+        # Actualizar la interfaz si existe
+        if not success:
+            self._set_status("Error al actualizar Excel")
+        elif not (new_items or updated_items):
+            self._set_status("Excel sin cambios: todos los issues ya estaban actualizados")
+            return success, new_items, updated_items
+        else:
+            self._set_status(f"Excel actualizado: {new_items} nuevos, {updated_items} actualizados")
+                
+        # Mostrar mensaje de éxito
+        if success and self.root:
+            self.root.after(
+                0, self._mb_info,
+                "Proceso Completado", 
+                f"El archivo Excel ha sido actualizado correctamente.\n\n"
+                f"Se han agregado {new_items} nuevos issues y actualizado {updated_items} issues existentes."
+            )
+            
+        return success, new_items, updated_items
+    
+    
+    
+    
+    def _extraction_state_valid(self, target):
+        """
+        Comprueba si el estado de extracción registrado describe el Excel actual
+        
+        El estado solo es válido si la fecha de modificación y el tamaño del libro
+        coinciden con los guardados tras la última escritura de la aplicación; si
+        el archivo se sobrescribió, se editó a mano o no existe, hay que reescribirlo.
+        
+        Args:
+            target (str): Ruta del archivo Excel destino
+            
+        Returns:
+            bool: True si el estado sigue siendo válido
+        """
+        stamp = file_stamp(target)
+        return stamp is not None and stamp == self.db_manager.get_extraction_stamp(target)
+    
+    def _pending_issues(self, issues_data, erp_number, project_id, state_valid):
+        """
+        Separa los issues nuevos o modificados de los ya escritos sin cambios
+        
+        Args:
+            issues_data (list): Issues extraídos
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            state_valid (bool): Resultado de _extraction_state_valid para el destino
+            
+        Returns:
+            tuple: (issues pendientes de escribir, {título: huella} de esos issues)
+        """
+        known = (self.db_manager.get_extracted_fingerprints(self.excel_file_path, erp_number, project_id)
+                 if state_valid else {})
+        pending = []
+        fingerprints = {}
+        for issue in issues_data:
+            title = issue.get("Title")
+            # Los issues sin título no se escriben en el Excel, así que no tienen estado
+            if not title:
+                continue
+            fingerprint = issue_fingerprint(issue)
+            if known.get(title) != fingerprint:
+                pending.append(issue)
+                fingerprints[title] = fingerprint
+                
+        skipped = len(issues_data) - len(pending)
+        if skipped:
+            logger.info(f"{skipped} issues sin cambios (o sin título) para {erp_number}/{project_id}; se omiten del Excel")
+        return pending, fingerprints
+    
+    def _record_written(self, target, erp_number, project_id, fingerprints, reset):
+        """
+        Registra las huellas de los issues recién escritos y la firma del libro
+        
+        Args:
+            target (str): Ruta del archivo Excel destino
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            fingerprints (dict): {título: huella} de los issues escritos
+            reset (bool): Descartar antes el estado anterior del archivo
+        """
+        stamp = file_stamp(target)
+        if stamp is None:
+            return
+        self.db_manager.save_extracted_issues(target, erp_number, project_id, fingerprints, stamp, reset=reset)
+    
+    def _write_issues(self, issues_data, erp_number=None, project_id=None):
+        """
+        Escribe en el Excel los issues de un par cliente/proyecto sin interfaz
+        
+        Con cliente y proyecto, solo se combinan con el libro los issues nuevos o
+        con cambios en los campos seguidos, y tras escribir se registra su estado.
+        
+        Args:
+            issues_data (list): Issues extraídos
+            erp_number (str, optional): Número ERP del cliente
+            project_id (str, optional): ID del proyecto
+            
+        Returns:
+            tuple: (success, new_items, updated_items)
+        """
+        target = self.excel_file_path
+        if not (target and erp_number and project_id):
+            return self.excel_manager.update_with_issues(issues_data)
+            
+        state_valid = self._extraction_state_valid(target)
+        pending, fingerprints = self._pending_issues(issues_data, erp_number, project_id, state_valid)
+        if not pending:
+            return True, 0, 0
+            
+        result = self.excel_manager.update_with_issues(pending)
+        # Registrar el estado solo cuando el Excel ya contiene los datos
+        if result[0]:
+            self._record_written(target, erp_number, project_id, fingerprints, reset=not state_valid)
+        return result
+    
+    def _collect_issues(self, erp_number, project_id):
+        """
+        Navega a SAP, selecciona cliente y proyecto y extrae los issues en el navegador
+        
+        Solo contiene la parte que necesita el navegador; guardar los resultados
+        queda a cargo del llamador.
+        
+        Args:
+            erp_number (str): Número ERP para selección del cliente
+            project_id (str): ID del proyecto a consultar
+            
+        Returns:
+            list: Lista de issues extraídos (vacía si algún paso falla)
+        """
+        logger.info(f"Iniciando extracción de issues para proyecto {project_id}")
+        
+        # 1. Conectar navegador (reutiliza la sesión activa si está en el mismo modo)
+        # y navegar a la página de SAP
+        self.browser.connect(headless=self._headless_mode())
+        self.browser.set_resource_blocking(False)
+        result = self.browser.navigate_to_sap(erp_number, project_id)
+        if not result:
+            logger.error("No se pudo navegar a la página de SAP")
+            return []
+        
+        # Sesión ya autenticada: imágenes y fuentes no son necesarias para extraer
+        self.browser.set_resource_blocking(True)
+            
+        # 2. Seleccionar cliente y proyecto
+        if not self.browser.select_customer_automatically(erp_number):
+            logger.error(f"No se pudo seleccionar el cliente {erp_number}")
+            return []
+            
+        if not self.browser.select_project_automatically(project_id):
+            logger.error(f"No se pudo seleccionar el proyecto {project_id}")
+            return []
+            
+        # 3. Realizar búsqueda
+        if not self.browser.click_search_button():
+            logger.error("No se pudo hacer clic en el botón de búsqueda")
+            return []
+            
+        # 4. Esperar a que carguen los resultados iniciales
+        if not self.browser.wait_for_search_results(timeout=30):
+            logger.warning("Posible problema al cargar resultados iniciales")
+            # Continuamos de todos modos, ya que algunos resultados podrían estar disponibles
+        
+        # 5. Extraer todos los issues con el método mejorado de extracción robusta
+        logger.info("Iniciando extracción completa de issues con método robusto")
+        all_issues = self.browser.extract_all_issues_robust()  # Usar el método robusto
+        
+        # 6. Validar resultados
+        if not all_issues:
+            logger.error("No se encontraron issues para extraer")
+            return []
+            
+        return all_issues
+        
+    def run_many(self, pairs):
+        """
+        Extrae varios pares (cliente, proyecto) seguidos con una sola sesión de navegador
+        
+        El perfil de Chrome solo admite un navegador a la vez, así que la parte del
+        navegador es secuencial. La escritura en Excel se hace en un hilo de trabajo
+        mientras el navegador procesa los pares siguientes; los issues que llegan
+        durante una escritura se acumulan y se guardan juntos en la siguiente, de
+        modo que el libro se carga y se guarda una vez por lote y no una por par.
+        
+        Args:
+            pairs (iterable): Tuplas (erp_number, project_id)
+            
+        Returns:
+            dict: {(erp_number, project_id): bool} con el resultado de cada par
+        """
+        results = {}
+        buffered_pairs = []  # (par, {título: huella}) pendientes de escribir
+        buffered_issues = []
+        in_flight = None  # (pares, future) de la escritura en curso
+        
+        # Todas las escrituras del lote son propias: la validez del estado se
+        # comprueba una sola vez, antes de la primera
+        target = self.excel_file_path
+        state_valid = bool(target) and self._extraction_state_valid(target)
+        reset_state = not state_valid
+        
+        def finish(batch):
+            nonlocal reset_state
+            pairs_done, future = batch
+            success = future.result()[0]
+            for done, fingerprints in pairs_done:
+                results[done] = success
+                if success and target:
+                    self._record_written(target, *done, fingerprints, reset=reset_state)
+                    reset_state = False
+                
+        def flush():
+            self._set_status(f"Guardando {len(buffered_issues)} issues en Excel...")
+            future = self._executor.submit(self.excel_manager.update_with_issues, list(buffered_issues))
+            batch = (list(buffered_pairs), future)
+            buffered_pairs.clear()
+            buffered_issues.clear()
+            return batch
+        
+        for erp_number, project_id in pairs:
+            pair = (erp_number, project_id)
+            try:
+                issues = self._collect_issues(erp_number, project_id)
+            except WebDriverException as e:
+                logger.error(f"Error del navegador al extraer {pair}: {e}")
+                issues = []
+                
+            if not issues:
+                results[pair] = False
+            elif not target:
+                buffered_pairs.append((pair, {}))
+                buffered_issues.extend(issues)
+            else:
+                pending, fingerprints = self._pending_issues(issues, erp_number, project_id, state_valid)
+                if pending:
+                    buffered_pairs.append((pair, fingerprints))
+                    buffered_issues.extend(pending)
+                else:
+                    # Nada nuevo para este par: el Excel ya está al día
+                    results[pair] = True
+                
+            # Lanzar una escritura solo cuando la anterior haya terminado
+            if in_flight is not None and in_flight[1].done():
+                finish(in_flight)
+                in_flight = None
+            if in_flight is None and buffered_issues:
+                in_flight = flush()
+                
+        if in_flight is not None:
+            finish(in_flight)
+        if buffered_issues:
+            finish(flush())
+            
+        logger.info(f"Extracción múltiple finalizada: {sum(results.values())}/{len(results)} pares correctos")
+        return results
+        
+    def extract_sap_issues(self, erp_number, project_id):
+        """
+        Método principal para la extracción completa de issues de SAP.
+        
+        Args:
+            erp_number (str): Número ERP para selección del cliente
+            project_id (str): ID del proyecto a consultar
+            
+        Returns:
+            list: Lista de issues extraídos
+            bool: True si la operación fue exitosa
+        """
+        try:
+            # 1-6. Navegar, seleccionar cliente y proyecto y extraer en el navegador
+            all_issues = self._collect_issues(erp_number, project_id)
+            if not all_issues:
+                return [], False
+                
+            # 7. Actualizar Excel con los issues nuevos o modificados; el estado de
+            # extracción en la base de datos se registra tras escribirlos
+            logger.info("Actualizando archivos Excel")
+            self.update_excel(all_issues, erp_number, project_id)
+                
+            logger.info(f"Extracción completa finalizada: {len(all_issues)} issues procesados")
+            return all_issues, True
+            
+        except Exception as e:
+            logger.error(f"Error en extract_sap_issues: {e}")
+            return [], False
+        finally:
+            # Cerramos el navegador solo si está configurado para ello
+            if hasattr(self, 'config') and self.config.get("close_browser_after_extraction", True):
+                self.browser.close()
+
+
+    def _confirm_manual_action(self, title, message, question):
+        """
+        Pide al usuario que complete a mano un paso que falló y confirme
+        
+        Si hay una función de confirmación inyectada (confirm_fn), se usa en lugar
+        de los diálogos modales; así un lote sin interfaz puede fallar de inmediato
+        (o registrar el aviso) sin dejar la sesión del navegador bloqueada.
+        
+        Args:
+            title (str): Título del aviso
+            message (str): Instrucciones para el usuario
+            question (str): Pregunta de confirmación
+            
+        Returns:
+            bool: True si el usuario confirmó que completó el paso
+        """
+        if self.confirm_fn is not None:
+            logger.warning(f"{title}: {message}")
+            return bool(self.confirm_fn(title, question))
+        self._mb_warn(title, message)
+        return self._mb_ask("Confirmación", question)
+
+    def _validate_inputs(self, erp_number, project_id):
+        """
+        Comprueba que se indicaron cliente y proyecto antes de extraer
+        
+        Args:
+            erp_number (str): Número ERP del cliente
+            project_id (str): ID del proyecto
+            
+        Returns:
+            bool: True si ambos valores están presentes
+        """
+        if erp_number and project_id:
+            return True
+        
+        missing = "un número ERP de cliente" if not erp_number else "un ID de proyecto"
+        logger.warning(f"Datos incompletos: falta {missing}")
+        if self.root is not None:
+            self._mb_warn("Datos incompletos", f"Debe especificar {missing}")
+        return False
+
+    def run_extraction(self):
+        """
+        Ejecuta el proceso completo de extracción para modo GUI y consola.
+        
+        Este método se ha actualizado para usar las mejoras en la extracción
+        y proporciona un flujo más robusto para el usuario.
+        
+        Returns:
+            bool: True si la extracción fue exitosa, False en caso contrario
+        """
+        try:
+            # Obtener valores de cliente y proyecto - MODIFICADO PARA EXTRAER EL NÚMERO DE ID
+            full_client = self.client_var.get().strip() if self.client_var is not None else ""
+            full_project = self.project_var.get().strip() if self.project_var is not None else ""
+            
+            # Extraer solo el número de ID de las cadenas completas ("id - nombre");
+            # partition no crea una lista y devuelve la cadena entera si no hay separador
+            erp_number = full_client.partition(" - ")[0].strip()
+            project_id = full_project.partition(" - ")[0].strip()
+
+            # Validar antes de iniciar el navegador, que es lo más costoso
+            if not self._validate_inputs(erp_number, project_id):
+                return False
+
+            if not self.connect_to_browser():
+                logger.error("Error al conectar con el navegador")
+                
+                # Actualizar la interfaz si existe
+                self._set_status("Error al conectar con el navegador")
+                    
+                return False
+                                
+            logger.info(f"Iniciando extracción para cliente: {erp_number}, proyecto: {project_id}")
+        
+            # Navegar a la URL inicial especificada
+            logger.info("Navegando a la URL de SAP con parámetros específicos...")
+            
+            # Actualizar la interfaz si existe
+            self._set_status("Navegando a SAP...")
+                
+            # La página de autenticación puede necesitar imágenes: sin bloqueo hasta superarla
+            self.browser.set_resource_blocking(False)
+            if not self.browser.navigate_to_sap(erp_number, project_id):
+                logger.error("Error al navegar a la URL de SAP")
+                return False
+            
+            # Manejar autenticación si es necesario
+            if not self.browser.handle_authentication():
+                logger.error("Error en el proceso de autenticación")
+                return False
+            
+            # Desde aquí imágenes y fuentes no aportan nada a la extracción
+            self.browser.set_resource_blocking(True)
+                
+            # Estrategia mejorada con múltiples intentos para seleccionar cliente
+            client_selected = False
+            
+            # Método 1: Verificar y ajustar los campos con una sola llamada JavaScript UI5
+            fields_state = self.browser.ensure_fields_ui5(erp_number, project_id)
+            if fields_state.get("ok"):
+                logger.info("Cliente verificado/establecido mediante UI5, omitiendo selección")
+                client_selected = True
+            elif self.browser.verify_fields_have_expected_values(erp_number, project_id):
+                # Sin controles UI5: comprobar los valores con la verificación combinada
+                logger.info("Los campos ya contienen los valores correctos, omitiendo selección")
+                client_selected = True
+            
+            # Si no están los valores correctos, intentar seleccionar automáticamente
+            if not client_selected:
+                # Actualizar la interfaz si existe
+                self._set_status("Seleccionando cliente automáticamente...")
+                
+                # Método 2: Usar la función mejorada de selección automática
+                if self.browser.select_customer_automatically(erp_number):
+                    logger.info("Cliente seleccionado con método principal")
+                    client_selected = True
+                else:
+                    # Método 3: Usar JavaScript UI5 si los métodos anteriores fallan
+                    if hasattr(self.browser, 'select_customer_ui5_direct'):
+                        if self.browser.select_customer_ui5_direct(erp_number):
+                            logger.info("Cliente seleccionado con JavaScript UI5")
+                            client_selected = True
+                    
+                    # Método 4: Solicitar intervención manual si todo lo anterior falla
+                    if not client_selected:
+                        logger.warning("No se pudo seleccionar cliente automáticamente")
+                        # Solicitar selección manual si es necesario
+                        if self.root is not None or self.confirm_fn is not None:
+                            result = self._confirm_manual_action("Selección Manual Requerida", 
+                                "No se pudo seleccionar el cliente automáticamente.\n\n"
+                                "Por favor, seleccione manualmente el cliente y haga clic en Continuar.",
+                                "¿Ha seleccionado el cliente?")
+                            if not result:
+                                return False
+                            client_selected = True  # El usuario confirmó que seleccionó manualmente
+                            # Esperar a que el campo de cliente refleje la selección
+                            self._wait_until(self._customer_field_has_value, 1)
+                        else:
+                            # En modo consola
+                            print("\n⚠️ No se pudo seleccionar el cliente automáticamente.")
+                            input("➡️ Por favor, seleccione manualmente el cliente y presione Enter para continuar...")
+                            client_selected = True
+
+            # Actualizar la interfaz
+            self._set_status("Seleccionando proyecto automáticamente...")
+            
+            # Seleccionar proyecto (los reintentos se gestionan en el navegador),
+            # salvo que la verificación UI5 inicial ya lo haya confirmado
+            project_selected = bool(fields_state.get("project_ok"))
+            
+            if not project_selected:
+                project_selected = self.browser.select_project_automatically(
+                    project_id, retries=5, poll_interval=0.5, budget=15
+                )
+                
+            if project_selected:
+                logger.info(f"Proyecto {project_id} seleccionado con éxito")
+            
+            # Si no se pudo seleccionar automáticamente, solicitar selección manual
+            if not project_selected:
+                logger.warning("No se pudo seleccionar proyecto automáticamente")
+                # Solicitar selección manual si es necesario
+                if self.root is not None or self.confirm_fn is not None:
+                    result = self._confirm_manual_action("Selección Manual Requerida", 
+                        "No se pudo seleccionar el proyecto automáticamente.\n\n"
+                        "Por favor, seleccione manualmente el proyecto y haga clic en Continuar.",
+                        "¿Ha seleccionado el proyecto?")
+                    if not result:
+                        return False
+                    project_selected = True
+                else:
+                    # En modo consola
+                    print("\n⚠️ No se pudo seleccionar el proyecto automáticamente.")
+                    input("➡️ Por favor, seleccione manualmente el proyecto y presione Enter para continuar...")
+                    project_selected = True
+            
+            # Hacer clic en el botón de búsqueda
+            self._set_status("Realizando búsqueda...")
+                
+            # Hacer clic en búsqueda utilizando el método mejorado
+            if not self.browser.click_search_button():
+                logger.warning("Error al hacer clic en el botón de búsqueda automáticamente")
+                # Solicitar acción manual
+                if self.root is not None or self.confirm_fn is not None:
+                    result = self._confirm_manual_action("Acción Manual Requerida", 
+                        "No se pudo hacer clic en el botón de búsqueda automáticamente.\n\n"
+                        "Por favor, haga clic manualmente en el botón de búsqueda.",
+                        "¿Ha hecho clic en el botón de búsqueda?")
+                    if not result:
+                        return False
+                else:
+                    # En modo consola
+                    print("\n⚠️ No se pudo hacer clic en el botón de búsqueda automáticamente.")
+                    input("➡️ Por favor, haga clic manualmente en el botón de búsqueda y presione Enter para continuar...")
+            
+            # Esperar a que se carguen los resultados de la búsqueda
+            self._set_status("Esperando resultados de búsqueda...")
+                
+            # Esperar resultados utilizando el método mejorado
+            if not self.browser.wait_for_search_results():
+                logger.warning("No se pudo confirmar la carga de resultados")
+                # Esperar a que aparezcan filas en la tabla y continuar de todos modos
+                if not self._wait_for_table_rows(TIMEOUTS["extraction_retry"]):
+                    logger.warning("No se detectaron filas en la tabla de resultados")
+            
+            # MÉTODO AUTOMATIZADO DE NAVEGACIÓN POR TECLADO
+            self._set_status("Iniciando navegación por teclado...")
+
+            # Usar el método mejorado que maneja toda la navegación después de seleccionar cliente y proyecto
+            # con la secuencia exacta de teclas especificada
+            if self.browser.navigate_post_selection():
+                logger.info("✅ Navegación post-selección completada con éxito")
+                
+                # Esperar a que se recargue la tabla con las nuevas columnas
+                self._wait_for_table_rows(1)
+            else:
+                logger.warning("❌ La navegación automática por teclado falló")
+                
+                # Si falla la navegación automática, intentar el método anterior
+                self._set_status("Intentando método alternativo...")
+                    
+                # Intentar hacer clic en ajustes manualmente
+                if not self.browser.navigate_keyboard_sequence():
+                    logger.warning("No se pudo completar la secuencia de navegación por teclado")
+                    
+                    if self.root is not None or self.confirm_fn is not None:
+                        result = self._confirm_manual_action("Acción Manual Requerida", 
+                            "La navegación automática ha fallado.\n\n"
+                            "Por favor, realice estos pasos manualmente:\n"
+                            "1. Haga clic en el título 'Issues and Actions Overview'\n"
+                            "2. Pulse Tab 18 veces\n"
+                            "3. Pulse Enter (para ajustes)\n"
+                            "4. Pulse Tab 3 veces\n" 
+                            "5. Pulse flecha derecha 2 veces\n"
+                            "6. Pulse Enter (para columnas)\n"
+                            "7. Pulse Tab 3 veces\n"
+                            "8. Pulse Enter (para Select All)\n"
+                            "9. Pulse Tab 2 veces\n"
+                            "10. Pulse Enter (para OK)",
+                            "¿Ha completado los pasos manualmente?")
+                        if not result:
+                            logger.error("Usuario canceló después de fallo en navegación automática")
+                            self._set_status("Proceso cancelado por el usuario")
+                            return False
+                    else:
+                        # En modo consola
+                        print("\n⚠️ La navegación automática ha fallado.")
+                        print("Por favor, realice estos pasos manualmente:")
+                        print("1. Haga clic en el título 'Issues and Actions Overview'")
+                        print("2. Pulse Tab 18 veces")
+                        print("3. Pulse Enter (para ajustes)")
+                        print("4. Pulse Tab 3 veces")
+                        print("5. Pulse flecha derecha 2 veces")
+                        print("6. Pulse Enter (para columnas)")
+                        print("7. Pulse Tab 3 veces")
+                        print("8. Pulse Enter (para Select All)")
+                        print("9. Pulse Tab 2 veces")
+                        print("10. Pulse Enter (para OK)")
+                        input("➡️ Después de completar los pasos, presione Enter para continuar...")
+            
+            # Realizar la extracción con el método mejorado
+            return self.perform_extraction()
+                
+        except Exception as e:
+            logger.error(f"Error en el proceso de extracción: {e}")
+            
+            # Actualizar la interfaz si existe
+            self._set_status(f"Error: {e}")
+                
+            return False        
+        
+        
+        
+        
+        
+        
+        
+        
+    def navigate_to_issues_tab(self):
+        """
+        Navega a la pestaña 'Issues' una vez seleccionado el proyecto.
+        
+        Returns:
+            bool: True si la navegación fue exitosa, False en caso contrario
+        """
+        try:
+            logger.info("Intentando navegar a la pestaña Issues...")
+            
+            # Esperar a que cargue la página del proyecto (termina en cuanto aparece la pestaña)
+            self._wait_until(
+                EC.presence_of_element_located((By.XPATH, _ISSUES_TAB_XPATH)),
+                3
+            )
+            
+            # Buscar, filtrar por visibilidad y pulsar la pestaña en el propio navegador:
+            # un único viaje de ida y vuelta en lugar de uno por pestaña candidata
+            try:
+                strategy = self.driver.execute_script(_CLICK_ISSUES_TAB_JS, _ISSUES_TAB_CSS, _ISSUES_TAB_XPATH)
+            except WebDriverException as e:
+                logger.debug(f"Error al buscar la pestaña Issues: {e}")
+                strategy = None
+                
+            if strategy:
+                logger.info(f"Clic en pestaña Issues realizado ({strategy})")
+                # Esperar a que cargue el contenido de la pestaña
+                self._wait_until(
+                    EC.presence_of_element_located((By.XPATH, _ISSUES_LOADED_XPATH)),
+                    3
+                )
+                return True
+            
+            logger.warning("No se encontró la pestaña Issues por selectores directos")
+            
+            # Intentar buscar por posición relativa (generalmente la tercera pestaña)
+            try:
+                tabs = self.driver.find_elements(By.XPATH, _TAB_XPATH)
+                if len(tabs) >= 3:  # Asumiendo que Issues es la tercera pestaña
+                    third_tab = tabs[2]  # Índice 2 para el tercer elemento
+                    self.driver.execute_script("arguments[0].click();", third_tab)
+                    logger.info("Clic en tercera pestaña realizado")
+                    self._wait_until(
+                        EC.presence_of_element_located((By.XPATH, _ISSUES_LOADED_XPATH)),
+                        1
+                    )
+                    return True
+            except _TAB_PROBE_ERRORS:
+                pass
+                
+            logger.warning("No se pudo navegar a la pestaña Issues")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error al navegar a la pestaña Issues: {e}")
+            return False
+            
+    def _wait_until(self, condition, timeout):
+        """
+        Espera a que se cumpla una condición de Selenium
+        
+        Sustituye a las esperas fijas con time.sleep: sondea cada 250 ms y
+        termina en cuanto la condición se cumple. Delega en SAPBrowser.wait_until.
+        
+        Args:
+            condition (callable): Condición que recibe el driver (p. ej. de expected_conditions)
+            timeout (float): Tiempo máximo de espera en segundos
+            
+        Returns:
+            bool: True si la condición se cumplió, False si se agotó el tiempo
+        """
+        return self.browser.wait_until(condition, timeout, poll=0.25)
+            
+    @staticmethod
+    def _customer_field_has_value(driver):
+        """
+        Condición de espera: algún campo de cliente tiene un valor
+        
+        Args:
+            driver: WebDriver de Selenium
+            
+        Returns:
+            bool: True si algún campo de cliente no está vacío
+        """
+        return any(
+            field.get_attribute("value")
+            for field in driver.find_elements(By.XPATH, _CUSTOMER_FIELD_XPATH)
+        )
+        
+    def _wait_for_table_rows(self, timeout):
+        """
+        Espera a que la tabla de resultados tenga filas
+        
+        Sondea el DOM cada 250 ms y termina en cuanto aparecen filas, en lugar
+        de esperar siempre el tiempo máximo.
+        
+        Args:
+            timeout (float): Tiempo máximo de espera en segundos
+            
+        Returns:
+            bool: True si se detectaron filas, False si se agotó el tiempo
+        """
+        return self._wait_until(
+            lambda driver: driver.find_elements(By.XPATH, _TABLE_ROWS_XPATH),
+            timeout
+        )
+            
+    def _verify_issues_page(self):
+        """
+        Verifica si estamos en la página de Issues correcta.
+        
+        Returns:
+            bool: True si estamos en la página de Issues, False en caso contrario
+        """
+        try:
+            # Sondeo combinado en el navegador: una sola llamada en lugar de tres búsquedas
+            try:
+                probe = self.driver.execute_script(
+                    _DETECT_ISSUES_PAGE_JS, _ISSUES_TITLE_XPATH, _TABLE_ROWS_XPATH, _ISSUES_HEADER_XPATH
+                )
+            except Exception as e:
+                logger.debug(f"No se pudo ejecutar el sondeo de la página de Issues: {e}")
+                probe = None
+                
+            if probe:
+                title = probe.get("title")
+                row_count = int(probe.get("rows", 0))
+                header_count = int(probe.get("headers", 0))
+            else:
+                # Sin sondeo JS (p. ej. execute_script bloqueado): las mismas tres
+                # señales con find_elements
+                titles = self.driver.find_elements(By.XPATH, _ISSUES_TITLE_XPATH)
+                title = titles[0].text if titles else None
+                row_count = len(self.driver.find_elements(By.XPATH, _TABLE_ROWS_XPATH))
+                header_count = len(self.driver.find_elements(By.XPATH, _ISSUES_HEADER_XPATH))
+                
+            # Estrategia 1: el texto "Issues (número)"
+            if title:
+                logger.info(f"Página de Issues detectada por título: {title}")
+                return True
+            
+            # Estrategia 2: filas de datos visibles
+            if row_count > 0:
+                logger.info(f"Se detectaron {row_count} filas de datos que parecen issues")
+                return True
+            
+            # Estrategia 3: encabezados de columna típicos
+            if header_count >= 3:
+                logger.info(f"Se detectaron encabezados de columna típicos de issues: {header_count}")
+                return True
+            
+            # Si no se detecta ninguna de las condiciones anteriores
+            logger.warning("No se detectó la página de Issues")
+            return False
+        
+        except Exception as e:
+            logger.error(f"Error al verificar página de Issues: {e}")
+            return False
+        
+        
+        
+        
+        
+        
+        
+        
+    def perform_extraction(self):
+        """
+        Método principal para ejecutar el proceso de extracción.
+        
+        Utiliza el método mejorado extract_all_issues_robust para obtener
+        datos de forma más confiable y completa. Con la GUI se ejecuta en un
+        hilo de trabajo, por lo que los diálogos se delegan en el hilo de Tk
+        con root.after.
+        
+        Returns:
+            bool: True si la extracción fue exitosa, False en caso contrario
+        """
+        try:
+            # Marcar como procesando
+            self.processing = True
+            
+            logger.info("MÉTODO: perform_extraction - Comenzando proceso de extracción mejorado")
+            
+            # Actualizar la interfaz si existe
+            self._set_status("Comenzando extracción de datos...")
+            
+            # Verificar que tenemos un archivo Excel configurado
+            if not self.excel_file_path:
+                logger.warning("No se ha seleccionado archivo Excel para guardar los datos")
+                if self.root is not None:
+                    excel_path = self.choose_excel_file()
+                    if not excel_path:
+                        logger.error("No se seleccionó archivo Excel")
+                        self.processing = False
+                        return False
+            
+            # Usar el método robusto mejorado para extraer datos
+            logger.info("Iniciando extracción robusta de issues...")
+            
+            # Actualizar la interfaz
+            self._set_status("Extrayendo datos con método mejorado...")
+            
+            # Llamar al método de extracción robusto
+            issues_data = self.browser.extract_all_issues_robust()
+            
+            # Verificar si se obtuvieron datos
+            if not issues_data or len(issues_data) == 0:
+                logger.error("No se encontraron issues para extraer")
+                
+                self._set_status("Error: No se encontraron issues para extraer")
+                
+                if self.root:
+                    self.root.after(
+                        0, self._mb_err,
+                        "Error de Extracción", 
+                        "No se pudieron encontrar issues para extraer. Verifique que está en la página correcta."
+                    )
+                
+                self.processing = False
+                return False
+            
+            # Actualizar la interfaz
+            self._set_status(f"Guardando {len(issues_data)} issues en Excel...")
+            
+            # Actualizar Excel con los datos extraídos
+            erp_number = self.client_var.get().partition(" - ")[0].strip() if self.client_var is not None else ""
+            project_id = self.project_var.get().partition(" - ")[0].strip() if self.project_var is not None else ""
+            success, new_items, updated_items = self.update_excel(issues_data, erp_number, project_id)
+            
+            # Verificar resultado de la actualización
+            if success:
+                logger.info(f"Excel actualizado: {new_items} nuevos items, {updated_items} actualizados")
+                
+                self._set_status(f"Excel actualizado: {new_items} nuevos, {updated_items} actualizados")
+                
+                if self.root:
+                    self.root.after(
+                        0, self._mb_info,
+                        "Proceso Completado", 
+                        f"El archivo Excel ha sido actualizado correctamente.\n\n"
+                        f"Se han agregado {new_items} nuevos issues y actualizado {updated_items} issues existentes."
+                    )
+            else:
+                logger.error("Error al actualizar Excel")
+                
+                self._set_status("Error al actualizar Excel")
+                
+                if self.root:
+                    self.root.after(
+                        0, self._mb_err,
+                        "Error al Actualizar Excel", 
+                        "No se pudo actualizar el archivo Excel.\n\n"
+                        "Verifique que el archivo no esté abierto en otra aplicación."
+                    )
+            
+            self.processing = False
+            return success
+            
+        except Exception as e:
+            logger.error(f"Error general en el proceso de extracción: {e}")
+            
+            # Actualizar la interfaz
+            self._set_status(f"Error: {e}")
+            
+            self.processing = False
+            return False
+
+
+
+    def start_extraction(self):
+        """
+        Inicia el proceso de extracción de issues con método mejorado.
+        Prepara la interfaz y ejecuta la extracción en un hilo separado.
+        """
+        try:
+            # Verificar si hay un proceso en curso
+            if self.processing:
+                self._mb_warn("Proceso en curso", "Hay un proceso de extracción en curso.")
+                return
+                
+            # Verificar que existe un archivo Excel seleccionado
+            if not self.excel_file_path:
+                self._mb_warn("Archivo Excel no seleccionado", "Debe seleccionar o crear un archivo Excel primero.")
+                return
+                    
+            # Verificar que el navegador está abierto
+            if not self.driver:
+                self._mb_warn("Navegador no iniciado", "Debe iniciar el navegador primero.")
+                return
+            
+            # Marcar como procesando
+            self.processing = True
+            
+            # Actualizar la interfaz
+            self._set_status("Iniciando extracción de issues...")
+            
+            # Ejecutar la extracción en un hilo separado para no bloquear la GUI
+            def extraction_thread():
+                try:
+                    # Usar el método de extracción mejorado
+                    success = self.perform_extraction()
+                    
+                    if not success:
+                        logger.warning("La extracción no fue exitosa")
+                        self._set_status("Extracción no completada")
+                    
+                except Exception as e:
+                    logger.error(f"Error en el hilo de extracción: {e}")
+                    self._set_status(f"Error: {e}")
+                        
+                    # Mostrar mensaje de error en el hilo principal
+                    if self.root:
+                        self.root.after(0, self._mb_err, "Error", f"Error durante la extracción: {e}")
+                finally:
+                    # Restablecer estado de procesamiento
+                    self.processing = False
+                    self._set_status("Extracción finalizada")
+            
+            # Lanzar la extracción en el pool de hilos de trabajo
+            future = self._executor.submit(extraction_thread)
+            future.add_done_callback(self._on_bg_done)
+            
+        except Exception as e:
+            logger.error(f"Error al iniciar extracción: {e}")
+            if self.root:
+                self._mb_err("Error", f"Error al iniciar extracción: {e}")
+            self.processing = False
+
+
+
+
+
+    
+    
+    def setup_gui_logger(self):
+        """
+        Configura el logger para que también escriba en la GUI
+        
+        Crea un handler personalizado que redirige los mensajes de log
+        al widget Text de la interfaz gráfica.
+        """
+        class TextHandler(logging.Handler):
+            # Intervalo de volcado (ms) y máximo de registros por volcado
+            FLUSH_INTERVAL = 100
+            MAX_BATCH = 500
+            
+            def __init__(self, text_widget):
+                logging.Handler.__init__(self)
+                self.text_widget = text_widget
+                self.pending = deque()
+                # Líneas escritas en el widget, llevadas en Python para no consultar a Tk en cada volcado
+                self.line_count = 0
+                self.text_widget.after(self.FLUSH_INTERVAL, self.flush_pending)
+            
+            def emit(self, record):
+                # Solo se encola (seguro desde cualquier hilo); el widget se actualiza
+                # por lotes desde el hilo principal en flush_pending.
+                # Las partes se toman del propio registro, sin volver a partir el texto formateado.
+                msg_content = record.getMessage()
+                if record.exc_info:
+                    msg_content += '\n' + self.formatter.formatException(record.exc_info)
+                self.pending.append((self.formatter.formatTime(record), record.levelname, msg_content))
+                
+            def flush_pending(self):
+                """Vuelca los registros pendientes al widget con una sola inserción"""
+                try:
+                    segments = []
+                    for _ in range(min(len(self.pending), self.MAX_BATCH)):
+                        time_str, levelname, msg_content = self.pending.popleft()
+                        
+                        # Marca de tiempo y nivel con color
+                        segments.extend((
+                            time_str + ' - ', "INFO",
+                            levelname + ' - ', levelname,
+                            msg_content + '\n', levelname,
+                        ))
+                        self.line_count += msg_content.count('\n') + 1
+                        
+                    if segments:
+                        self.text_widget.configure(state='normal')
+                        self.text_widget.insert(tk.END, *segments)
+                        self.text_widget.configure(state='disabled')
+                        self.text_widget.yview(tk.END)
+                        
+                        # Limitar tamaño del log
+                        self.limit_log_length()
+                        
+                    self.text_widget.after(self.FLUSH_INTERVAL, self.flush_pending)
+                except tk.TclError:
+                    # El widget se ha destruido: dejar de volcar
+                    pass
+                
+            def limit_log_length(self):
+                """Limita la longitud del log para evitar consumo excesivo de memoria"""
+                if self.line_count < 1000:
+                    return
+                    
+                # Solo al superar el umbral se consulta el widget, por si se ha vaciado desde fuera
+                self.line_count = int(self.text_widget.index('end-1c').split('.')[0]) - 1
+                if self.line_count >= 1000:
+                    self.text_widget.configure(state='normal')
+                    self.text_widget.delete('1.0', '500.0')
+                    self.text_widget.configure(state='disabled')
+                    self.line_count -= 499
+        
+        # Solo configurar si hay un widget de texto disponible
+        if self.log_text is not None:
+            # Crear handler para el widget Text
+            text_handler = TextHandler(self.log_text)
+            text_handler.setLevel(logging.INFO)
+            text_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            
+            # Añadir el handler al logger
+            logger.addHandler(text_handler)
+            
+            # Deshabilitar el widget
+            self.log_text.configure(state='disabled')
+            
+    def exit_app(self):
+        """
+        Cierra la aplicación de forma controlada
+        
+        Solicita confirmación si hay un proceso en curso, cierra el navegador
+        si el usuario lo desea, y guarda la configuración antes de salir.
+        """
+        try:
+            # Verificar si hay un proceso en curso
+            if self.processing:
+                confirm_exit = messagebox.askyesno(
+                    "Proceso en curso", 
+                    "Hay un proceso de extracción en curso. ¿Realmente desea salir?",
+                    icon='warning'
+                )
+                if not confirm_exit:
+                    return
+                    
+            if self.driver:
+                try:
+                    close_browser = messagebox.askyesno(
+                        "Cerrar navegador", 
+                        "¿Desea cerrar también el navegador?",
+                        icon='question'
+                    )
+                    if close_browser:
+                        self.browser.close()
+                        logger.info("Navegador cerrado correctamente")
+                except (tk.TclError, WebDriverException):
+                    logger.warning("No se pudo cerrar el navegador correctamente")
+            
+            # Guardar configuración antes de salir (de forma síncrona: el hilo escritor es daemon)
+            self.save_config(wait=True)
+            
+            # Descartar tareas en espera y no bloquear el cierre por la que esté en curso
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            
+            if self.root:
+                self._close_status_pipe()
+                self.root.destroy()
+        except Exception as e:
+            logger.error(f"Error al cerrar la aplicación: {e}")
+            # En caso de error, forzar cierre
+            if self.root:
+                self.root.destroy()
+
+
+
+
+
+
+
+
+
+
+
+    def add_new_client(self):
+        """
+        Muestra un diálogo para añadir un nuevo cliente a la base de datos.
+        Solicita solo el número ERP y nombre del cliente, eliminando el campo Business Partner.
+        """
+        try:
+            # Crear una ventana de diálogo personalizada
+            dialog = tk.Toplevel(self.root)
+            dialog.title("Añadir Nuevo Cliente")
+            dialog.geometry("400x150")  # Reduzco el tamaño ya que eliminamos un campo
+            dialog.resizable(False, False)
+            dialog.grab_set()  # Modal window
+            dialog.focus_set()
+            
+            # Configurar el diálogo
+            dialog.grid_columnconfigure(1, weight=1)
+            
+            # Variables para los campos
+            erp_var = tk.StringVar()
+            name_var = tk.StringVar()
+            
+            # Etiquetas y campos de entrada
+            ttk.Label(dialog, text="ERP Customer Number:").grid(row=0, column=0, padx=10, pady=10, sticky="w")
+            erp_entry = ttk.Entry(dialog, textvariable=erp_var, width=15)
+            erp_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
+            
+            ttk.Label(dialog, text="Nombre del Cliente:").grid(row=1, column=0, padx=10, pady=10, sticky="w")
+            name_entry = ttk.Entry(dialog, textvariable=name_var, width=30)
+            name_entry.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
+            
+            # Marco para botones
+            button_frame = ttk.Frame(dialog)
+            button_frame.grid(row=3, column=0, columnspan=2, pady=15)
+            
+            # Función para guardar el cliente
+            def save_client():
+                erp = erp_var.get().strip()
+                name = name_var.get().strip()
+                
+                # Validaciones
+                if not erp:
+                    self._mb_err("Error", "El número ERP es obligatorio", parent=dialog)
+                    return
+                    
+                if not name:
+                    self._mb_err("Error", "El nombre del cliente es obligatorio", parent=dialog)
+                    return
+                    
+                # Validar que el ERP sea numérico
+                if not erp.isdigit():
+                    self._mb_err("Error", "El número ERP debe contener solo dígitos", parent=dialog)
+                    return
+                    
+                # Guardar en la base de datos - ya no pasamos business_partner
+                if self.db_manager.save_client(erp, name):
+                    self._mb_info("Éxito", f"Cliente {erp} - {name} añadido correctamente", parent=dialog)
+                    
+                    # Actualizar la lista de clientes en el combobox
+                    clients = self.db_manager.get_client_labels()
+                    self.client_combo['values'] = clients
+                    
+                    # Ajustar el ancho del dropdown para los clientes
+                    from ui.main_window import adjust_combobox_dropdown_width
+                    adjust_combobox_dropdown_width(self.client_combo)
+                    
+                    # Seleccionar el nuevo cliente con formato "ID - NOMBRE"
+                    full_client = f"{erp} - {name}"
+                    for i, client in enumerate(clients):
+                        if client.startswith(erp):
+                            self.client_combo.current(i)
+                            self.select_client(client)
+                            break
+                    
+                    dialog.destroy()
+                else:
+                    self._mb_err("Error", "No se pudo guardar el cliente", parent=dialog)
+            
+            # Botones
+            ttk.Button(button_frame, text="Guardar", command=save_client).grid(row=0, column=0, padx=10)
+            ttk.Button(button_frame, text="Cancelar", command=dialog.destroy).grid(row=0, column=1, padx=10)
+            
+            # Poner el foco en el primer campo
+            erp_entry.focus_set()
+            
+            # Centrar diálogo en la ventana principal
+            dialog.update_idletasks()
+            width = dialog.winfo_width()
+            height = dialog.winfo_height()
+            x = (self.root.winfo_width() // 2) - (width // 2) + self.root.winfo_x()
+            y = (self.root.winfo_height() // 2) - (height // 2) + self.root.winfo_y()
+            dialog.geometry(f"{width}x{height}+{x}+{y}")
+            
+            # Esperar a que se complete el diálogo
+            dialog.wait_window()
+            
+        except Exception as e:
+            logger.error(f"Error al añadir nuevo cliente: {e}")
+            if self.root is not None:
+                self._mb_err("Error", f"No se pudo añadir el cliente: {e}")
+
+
+
+
+
+
+
+
+
+
+
+    def add_new_project(self):
+        """
+        Muestra un diálogo para añadir un nuevo proyecto a la base de datos.
+        Solicita solo el ID de proyecto, cliente asociado y nombre, eliminando el campo Engagement Case.
+        """
+        try:
+            # Verificar que hay clientes disponibles
+            clients = self.db_manager.get_client_labels()
+            if not clients:
+                self._mb_warn("No hay clientes", "Debe añadir al menos un cliente antes de crear un proyecto.")
+                return
+            
+            # Crear una ventana de diálogo personalizada
+            dialog = tk.Toplevel(self.root)
+            dialog.title("Añadir Nuevo Proyecto")
+            dialog.geometry("450x200")  # Reduzco el tamaño ya que eliminamos un campo
+            dialog.resizable(False, False)
+            dialog.grab_set()  # Modal window
+            dialog.focus_set()
+            
+            # Configurar el diálogo
+            dialog.grid_columnconfigure(1, weight=1)
+            
+            # Variables para los campos
+            project_id_var = tk.StringVar()
+            client_var = tk.StringVar()
+            name_var = tk.StringVar()
+            
+            # Si hay un cliente seleccionado, usarlo como valor predeterminado
+            current_client_string = self.client_var.get() if self.client_var is not None else ""
+            current_client_id = current_client_string.partition(" - ")[0]
+            
+            if current_client_id:
+                # Buscar el cliente completo (con nombre) en la lista
+                for client in clients:
+                    if client.startswith(current_client_id):
+                        client_var.set(client)
+                        break
+            
+            # Etiquetas y campos de entrada
+            ttk.Label(dialog, text="Case ID o Número de Proyecto:").grid(row=0, column=0, padx=10, pady=10, sticky="w")
+            project_entry = ttk.Entry(dialog, textvariable=project_id_var, width=15)
+            project_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
+            
+            ttk.Label(dialog, text="Cliente:").grid(row=1, column=0, padx=10, pady=10, sticky="w")
+            client_combo = ttk.Combobox(dialog, textvariable=client_var, values=clients, width=30, state="readonly")
+            client_combo.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
+            
+            ttk.Label(dialog, text="Nombre del Proyecto:").grid(row=2, column=0, padx=10, pady=10, sticky="w")
+            name_entry = ttk.Entry(dialog, textvariable=name_var, width=30)
+            name_entry.grid(row=2, column=1, padx=10, pady=10, sticky="ew")
+            
+            # Marco para botones
+            button_frame = ttk.Frame(dialog)
+            button_frame.grid(row=4, column=0, columnspan=2, pady=15)
+            
+            # Función para guardar el proyecto
+            def save_project():
+                project_id = project_id_var.get().strip()
+                selected_client = client_var.get().strip()
+                name = name_var.get().strip()
+                
+                # Validaciones
+                if not project_id:
+                    self._mb_err("Error", "El ID de proyecto es obligatorio", parent=dialog)
+                    return
+                    
+                if not selected_client:
+                    self._mb_err("Error", "Debes seleccionar un cliente", parent=dialog)
+                    return
+                    
+                if not name:
+                    self._mb_err("Error", "El nombre del proyecto es obligatorio", parent=dialog)
+                    return
+                    
+                # Validar que el ID de proyecto sea numérico
+                if not project_id.isdigit():
+                    self._mb_err("Error", "El ID de proyecto debe contener solo dígitos", parent=dialog)
+                    return
+                    
+                # Extraer el ERP number del cliente seleccionado (formato: "1025541 - Nombre")
+                client_erp = selected_client.partition(" - ")[0].strip()
+                
+                # Guardar en la base de datos - ya no pasamos engagement_case (cadena vacía)
+                if self.db_manager.save_project(project_id, client_erp, name):
+                    self._mb_info("Éxito", f"Proyecto {project_id} - {name} añadido correctamente", parent=dialog)
+                    
+                    # Actualizar la lista de proyectos en el combobox
+                    projects = self.db_manager.get_project_labels(client_erp)
+                    self.project_combo['values'] = projects
+                    
+                    # Ajustar el ancho del dropdown para los proyectos
+                    from ui.main_window import adjust_combobox_dropdown_width
+                    adjust_combobox_dropdown_width(self.project_combo)
+                    
+                    # Seleccionar el nuevo proyecto con formato "ID - NOMBRE"
+                    full_project = f"{project_id} - {name}"
+                    for i, project in enumerate(projects):
+                        if project.startswith(project_id):
+                            self.project_combo.current(i)
+                            self.select_project(project)
+                            break
+                    
+                    dialog.destroy()
+                else:
+                    self._mb_err("Error", "No se pudo guardar el proyecto", parent=dialog)
+            
+            # Botones
+            ttk.Button(button_frame, text="Guardar", command=save_project).grid(row=0, column=0, padx=10)
+            ttk.Button(button_frame, text="Cancelar", command=dialog.destroy).grid(row=0, column=1, padx=10)
+            
+            # Poner el foco en el primer campo
+            project_entry.focus_set()
+            
+            # Centrar diálogo en la ventana principal
+            dialog.update_idletasks()
+            width = dialog.winfo_width()
+            height = dialog.winfo_height()
+            x = (self.root.winfo_width() // 2) - (width // 2) + self.root.winfo_x()
+            y = (self.root.winfo_height() // 2) - (height // 2) + self.root.winfo_y()
+            dialog.geometry(f"{width}x{height}+{x}+{y}")
+            
+            # Esperar a que se complete el diálogo
+            dialog.wait_window()
+            
+        except Exception as e:
+            logger.error(f"Error al añadir nuevo proyecto: {e}")
+            if self.root is not None:
+                self._mb_err("Error", f"No se pudo añadir el proyecto: {e}")
+
+
+
+
+
+
+
+
+
+
+
+    def select_client(self, client_string):
+        """
+        Maneja la selección de un cliente desde el combobox
+        
+        Args:
+            client_string (str): String en formato "1025541 - Nombre del cliente"
+        """
+        try:
+            if not client_string or len(client_string) < 3:
+                return
+                    
+            # Extraer el ERP number del string "1025541 - Nombre del cliente"
+            erp_number = self._ID_RE.match(client_string).group(1)
+            
+            # Establecer el valor en el Entry
+            self.client_var.set(client_string)
+            logger.info(f"Cliente seleccionado: {client_string}")
+            
+            # Actualizar inmediatamente la interfaz para confirmar el cambio
+            if self.root:
+                self.root.update_idletasks()
+            
+            # Actualizar la lista de proyectos para este cliente
+            projects = self.db_manager.get_project_labels(erp_number)
+            self.project_combo.configure(values=projects)
+            
+            # Ajustar el ancho del dropdown para los proyectos
+            from ui.main_window import adjust_combobox_dropdown_width
+            adjust_combobox_dropdown_width(self.project_combo)
+            
+            # Si hay proyectos disponibles, seleccionar el primero. select_project fija
+            # project_var, que es la textvariable del combobox: no hace falta current(0)
+            if projects:
+                self.select_project(projects[0])
+                        
+            # Actualizar el uso de este cliente
+            self.db_manager.update_client_usage(erp_number)
+            self._schedule_save_config()
+        except tk.TclError as e:
+            logger.error(f"Error al seleccionar cliente: {e}")
+
+
+
+
+
+
+
+
+
+    def select_project(self, project_string):
+        """
+        Maneja la selección de un proyecto desde el combobox
+        
+        Args:
+            project_string (str): String en formato "20096444 - Nombre del proyecto"
+        """
+        try:
+            if not project_string or len(project_string) < 3:
+                return
+                    
+            # Extraer el ID del proyecto del string "20096444 - Nombre del proyecto"
+            project_id = self._ID_RE.match(project_string).group(1)
+            
+            # Establecer el valor en el Entry - AQUÍ ESTÁ EL CAMBIO
+            # En lugar de solo establecer el ID, mantener todo el string con nombre
+            self.project_var.set(project_string)
+            logger.info(f"Proyecto seleccionado: {project_string}")
+            
+            # Actualizar inmediatamente la interfaz para confirmar el cambio
+            if self.root:
+                self.root.update_idletasks()
+            
+            # Actualizar el uso de este proyecto
+            self.db_manager.update_project_usage(project_id)
+            self._schedule_save_config()
+        except tk.TclError as e:
+            logger.error(f"Error al seleccionar proyecto: {e}")
+
+
+
+
+
+
+
+
+
+
+
+    def _bind_messageboxes(self):
+        """
+        Guarda referencias a las funciones de messagebox en atributos de instancia
+        
+        Evita resolver el atributo del módulo en cada llamada. Se invoca al crear
+        la interfaz (el modo consola no muestra diálogos y así no carga tkinter)
+        y debe volver a invocarse si se reemplazan las funciones de messagebox.
+        """
+        self._mb_warn = messagebox.showwarning
+        self._mb_ask = messagebox.askokcancel
+        self._mb_info = messagebox.showinfo
+        self._mb_err = messagebox.showerror
+        
+    def _replace_standard_messageboxes(self):
+        """
+        Reemplaza los messagebox estándar por nuestros diálogos personalizados
+        con mejor formato y alineación de texto.
+        
+        Este método modifica el comportamiento de messagebox para usar nuestros
+        diálogos personalizados que manejan mejor la alineación del texto.
+        """
+        try:
+            # Intentar importar los diálogos personalizados
+            from ui.custom_dialogs import (
+                show_info, show_warning, show_error, show_question
+            )
+            
+            # Guardar referencia a funciones originales
+            self._original_showinfo = messagebox.showinfo
+            self._original_showwarning = messagebox.showwarning
+            self._original_showerror = messagebox.showerror
+            self._original_askokcancel = messagebox.askokcancel
+            
+            # Reemplazar con las versiones mejoradas pero preservando la interfaz original
+            def custom_showinfo(title, message, **kwargs):
+                if self.root:
+                    return show_info(self.root, title, message)
+                else:
+                    return self._original_showinfo(title, message, **kwargs)
+                    
+            def custom_showwarning(title, message, **kwargs):
+                if self.root:
+                    return show_warning(self.root, title, message)
+                else:
+                    return self._original_showwarning(title, message, **kwargs)
+                    
+            def custom_showerror(title, message, **kwargs):
+                if self.root:
+                    return show_error(self.root, title, message)
+                else:
+                    return self._original_showerror(title, message, **kwargs)
+                    
+            def custom_askokcancel(title, message, **kwargs):
+                # Para diálogos que requieren respuesta, todavía usamos los originales
+                # ya que nuestros personalizados no tienen esa funcionalidad aún
+                return self._original_askokcancel(title, message, **kwargs)
+            
+            # Aplicar los reemplazos a nivel global
+            messagebox.showinfo = custom_showinfo
+            messagebox.showwarning = custom_showwarning
+            messagebox.showerror = custom_showerror
+            # No reemplazamos askokcancel ya que necesitamos su funcionalidad de respuesta
+            
+            # Actualizar las referencias en caché para que apunten a las nuevas versiones
+            self._bind_messageboxes()
+            
+            return True
+            
+        except ImportError:
+            logger.debug("Diálogos personalizados no disponibles, usando messagebox estándar")
+            return False
+        except Exception as e:
+            logger.error(f"Error al reemplazar messageboxes: {e}")
+            return False
+
+
+
+
+
+
+
+
+
+
+
+
+    def _on_bg_done(self, future):
+        """
+        Callback de las tareas del pool: notifica en la GUI las excepciones no capturadas
+        
+        Args:
+            future (Future): Tarea finalizada
+        """
+        if future.cancelled():
+            return
+            
+        error = future.exception()
+        if error is None:
+            return
+            
+        logger.error(f"Error no controlado en tarea en segundo plano: {error}")
+        if self.root:
+            self.root.after(0, self._mb_err, "Error", f"Error en segundo plano: {error}")
+            
+    def start_browser(self):
+        """
+        Inicia el navegador desde la interfaz gráfica
+        
+        Este método prepara la interfaz y ejecuta la inicialización del navegador
+        en un hilo separado para no bloquear la interfaz.
+        """
+        try:
+            # Verificar si hay un proceso en curso
+            if self.processing:
+                self._mb_warn("Proceso en curso", "Hay un proceso de extracción en curso.")
+                return
+                
+            # Asegurarse de que no haya un navegador ya abierto
+            if self.driver:
+                self._mb_info("Navegador ya iniciado", "El navegador ya está iniciado.")
+                return
+                
+            # Actualizar la interfaz para mostrar que se está iniciando el navegador
+            self._set_status("Iniciando navegador...")
+            
+            # Iniciar el navegador en un hilo de trabajo
+            future = self._executor.submit(self._start_browser_thread)
+            future.add_done_callback(self._on_bg_done)
+            
+        except Exception as e:
+            logger.error(f"Error al iniciar el navegador: {e}")
+            self._set_status(f"Error: {e}")
+            self._mb_err("Error", f"Error al iniciar el navegador: {e}")
+
+
+
+
+
+
+
+
+
+    def _start_browser_thread(self):
+        """
+        Método para ejecutar la inicialización del navegador en un hilo separado
+        
+        Realiza la conexión con el navegador y navega a la URL inicial de SAP.
+        """
+        try:
+            if self.connect_to_browser():
+                logger.info("Navegador iniciado")
+                
+                # Actualizar la interfaz en el hilo principal
+                self._set_status("Navegador iniciado. Navegando a SAP...")
+                
+                # Obtener valores de cliente y proyecto
+                erp_number = self.client_var.get() if self.client_var is not None else "1025541"
+                project_id = self.project_var.get() if self.project_var is not None else "20096444"
+                
+                # Navegar a la URL de SAP con parámetros específicos
+                self.browser.navigate_to_sap(erp_number, project_id)
+                
+                # Esperar a que se cargue completamente la página y maneje autenticación si es necesario
+                self.browser.handle_authentication()
+                # Esperar a que la interfaz se estabilice (campo de cliente presente)
+                self._wait_until(
+                    EC.presence_of_element_located((By.XPATH, _CUSTOMER_FIELD_XPATH)),
+                    3
+                )
+                
+                # NUEVA SECUENCIA: Configurar columnas después de navegación
+                # Actualizar la interfaz en el hilo principal
+                self._set_status("Configurando columnas visibles...")
+                
+                # 1. Hacer clic en el botón de ajustes usando el método mejorado
+                if self.browser.enhanced_click_settings_button():
+                    logger.info("✅ Botón de ajustes pulsado correctamente")
+                    
+                    # Esperar a que se abra el panel de ajustes
+                    self._wait_until(
+                        EC.visibility_of_element_located((By.XPATH, _SETTINGS_PANEL_XPATH)),
+                        2
+                    )
+                    
+                    # 2. Usar el nuevo método de secuencia exacta de teclas
+                    if self.browser.perform_exact_keyboard_sequence():
+                        logger.info("✅ Columnas configuradas correctamente mediante secuencia exacta de teclas")
+                        
+                        # Esperar a que se recargue la tabla con las nuevas columnas
+                        self._wait_for_table_rows(3)
+                    else:
+                        logger.warning("⚠️ No se pudieron configurar todas las columnas")
+                        
+                        # Informar al usuario en el hilo principal
+                        if self.root:
+                            self.root.after(
+                                0, self._mb_info,
+                                "Configuración manual",
+                                "No se pudieron configurar todas las columnas automáticamente.\n\n"
+                                "Por favor, realice estos pasos manualmente:\n"
+                                "1. 5 tabs\n"
+                                "2. 2 flechas a la derecha\n"
+                                "3. Enter (para Select Columns)\n"
+                                "4. 3 tabs\n"
+                                "5. Enter (para Select All)\n"
+                                "6. 2 tabs\n"
+                                "7. Enter (para OK)"
+                            )
+                else:
+                    logger.warning("⚠️ No se pudo hacer clic en el botón de ajustes")
+                    
+                    # Informar al usuario en el hilo principal
+                    if self.root:
+                        self.root.after(
+                            0, self._mb_warn,
+                            "Acción Manual Requerida",
+                            "No se pudo hacer clic en el botón de ajustes automáticamente.\n\n"
+                            "Por favor, haga clic manualmente en el botón de ajustes (engranaje) ubicado en la esquina inferior derecha."
+                        )
+                
+                # Mostrar instrucciones en el hilo principal
+                if self.root:
+                    self._set_status("Navegación completada. Inicie la extracción cuando esté listo.")
+                    self.root.after(0, self._show_extraction_instructions)
+            else:
+                if self.root:
+                    self._set_status("Error al iniciar el navegador")
+                    self.root.after(0, self._mb_err, "Error", "No se pudo iniciar el navegador. Revise el log para más detalles.")
+        except Exception as e:
+            logger.error(f"Error en hilo de navegador: {e}")
+            if self.root:
+                self._set_status(f"Error: {e}")
+                self.root.after(0, self._mb_err, "Error", f"Error al iniciar el navegador: {e}")
+
+
+
+
+
+    def _show_extraction_instructions(self):
+        """
+        Muestra instrucciones para la extracción después de la navegación automática
+        utilizando el diálogo personalizado con mejor formato.
+        
+        Presenta un mensaje con información sobre el cliente y proyecto actuales,
+        incluyendo sus nombres, y guía al usuario sobre los siguientes pasos.
+        """
+        # Obtener valores actuales
+        erp_number = self.client_var.get()
+        project_id = self.project_var.get()
+        
+        # Obtener nombres de cliente y proyecto desde la base de datos
+        client_name, project_name = self.db_manager.get_names(erp_number, project_id)
+        
+        # Formatear la información con los nombres
+        client_info = f"{erp_number}"
+        if client_name:
+            client_info += f" - {client_name}"
+            
+        project_info = f"{project_id}"
+        if project_name:
+            project_info += f" - {project_name}"
+        
+        try:
+            # Intentar usar el diálogo personalizado si está disponible
+            from ui.custom_dialogs import show_extraction_instructions
+            show_extraction_instructions(self.root, client_info, project_info)
+        except ImportError:
+            # Fallback a messagebox estándar si no está disponible el diálogo personalizado
+            self._mb_info("Instrucciones de Extracción", _format_instructions(client_info, project_info))
+
+
+
+    def load_config(self):
+        """
+        Carga la configuración guardada desde un archivo JSON
+        
+        Restaura los valores de cliente, proyecto y ruta del archivo Excel
+        de ejecuciones anteriores.
+        """
+        try:
+            config_path = os.path.join('config', 'config.json')
+            
+            try:
+                with open(config_path, 'rb') as f:
+                    config = _json_loads(f.read())
+            except FileNotFoundError:
+                return
+                
+            if 'client' in config and config['client']:
+                client_id = config['client'].strip()
+                
+                # Buscar el cliente completo (con nombre) en la base de datos
+                found = False
+                for row in self.db_manager.get_clients():
+                    if row[0] == client_id:
+                        self.client_var.set(format_client_row(row))
+                        found = True
+                        break
+                
+                # Si no se encuentra, usar solo el ID
+                if not found:
+                    self.client_var.set(client_id)
+                    
+            if 'project' in config and config['project']:
+                project_id = config['project'].strip()
+                
+                # Buscar el proyecto completo (con nombre) en la base de datos
+                found = False
+                client_id = self.client_var.get().partition(" - ")[0]
+                for row in self.db_manager.get_projects(client_id):
+                    if row[0] == project_id:
+                        self.project_var.set(format_project_row(row))
+                        found = True
+                        break
+                
+                # Si no se encuentra, usar solo el ID
+                if not found:
+                    self.project_var.set(project_id)
+                    
+            # Solo reconfigurar si la ruta cambia (evita el os.path.exists y las
+            # actualizaciones de la interfaz en recargas repetidas)
+            excel_path = config.get('excel_path')
+            if excel_path and excel_path != self.excel_file_path and os.path.exists(excel_path):
+                self.excel_file_path = excel_path
+                self.excel_manager.file_path = excel_path
+                self._excel_basename = os.path.basename(excel_path)
+                self.excel_filename_var.set(f"Archivo: {self._excel_basename}")
+                    
+            logger.info("Configuración cargada correctamente")
+        except (OSError, ValueError, AttributeError, tk.TclError) as e:
+            # ValueError cubre JSON inválido (json y orjson); AttributeError, un
+            # archivo con una estructura distinta a la esperada
+            logger.error(f"Error al cargar configuración: {e}")
+
+
+
+
+    def _schedule_save_config(self):
+        """
+        Programa save_config para dentro de 500 ms, cancelando el guardado pendiente
+        
+        Varias selecciones seguidas (cliente y su primer proyecto, por ejemplo)
+        producen una sola escritura del archivo de configuración.
+        """
+        if not self.root:
+            self.save_config()
+            return
+            
+        if self._save_config_after_id is not None:
+            self.root.after_cancel(self._save_config_after_id)
+        self._save_config_after_id = self.root.after(500, self._save_config_pending)
+        
+    def _save_config_pending(self):
+        """Ejecuta el guardado de configuración programado por _schedule_save_config"""
+        self._save_config_after_id = None
+        self.save_config()
+        
+    def save_config(self, wait=False):
+        """
+        Guarda la configuración actual en un archivo JSON
+        
+        Almacena los valores actuales de cliente, proyecto y ruta del archivo Excel
+        para restaurarlos en futuras ejecuciones. La instantánea se toma en el hilo
+        llamador y la escritura se delega en un hilo aparte, salvo con wait=True.
+        
+        Args:
+            wait (bool): Si es True, escribe el archivo antes de volver
+        """
+        try:
+            # Extraer los IDs de cliente y proyecto (solo los números)
+            client_string = self.client_var.get()
+            project_string = self.project_var.get()
+            
+            client_id = client_string.partition(" - ")[0]
+            project_id = project_string.partition(" - ")[0]
+            
+            config = {
+                'client': client_id,
+                'project': project_id,
+                'excel_path': self.excel_file_path
+            }
+            
+            if wait:
+                self._write_config(config)
+                return
+                
+            self._config_queue.put(config)
+            if self._config_writer is None:
+                self._config_writer = threading.Thread(target=self._config_writer_loop, daemon=True)
+                self._config_writer.start()
+        except (OSError, TypeError, tk.TclError) as e:
+            logger.error(f"Error al guardar configuración: {e}")
+            
+    def _config_writer_loop(self):
+        """
+        Hilo escritor de configuración: escribe solo la última instantánea encolada
+        """
+        while True:
+            config = self._config_queue.get()
+            
+            # Descartar instantáneas intermedias: solo interesa la más reciente
+            try:
+                while True:
+                    config = self._config_queue.get_nowait()
+            except queue.Empty:
+                pass
+                
+            try:
+                self._write_config(config)
+            except Exception as e:
+                logger.error(f"Error al guardar configuración: {e}")
+                
+    def _write_config(self, config):
+        """
+        Escribe config.json de forma atómica (archivo temporal + os.replace)
+        
+        Args:
+            config (dict): Configuración a guardar
+        """
+        config_dir = "config"
+        os.makedirs(config_dir, exist_ok=True)
+                
+        config_path = os.path.join(config_dir, 'config.json')
+        temp_path = config_path + '.tmp'
+        
+        with self._config_lock:
+            with open(temp_path, 'wb') as f:
+                f.write(_json_dumps(config))
+            os.replace(temp_path, config_path)
+                
+        logger.debug("Configuración guardada correctamente")
+
+
+
+
+
+    def create_gui(self):
+        """
+        Crea la interfaz gráfica completa de la aplicación
+        
+        Este método configura la ventana principal, los paneles, controles y
+        eventos de la interfaz gráfica de usuario. También inicializa los
+        diálogos personalizados para mejor formato de texto.
+        """
+        from ui.main_window import MainWindow
+        
+        # Crear la ventana principal
+        self.root = tk.Tk()
+        self._bind_messageboxes()
+        
+        # Inicializar variables
+        self.client_var = tk.StringVar(value="1025541") 
+        self.project_var = tk.StringVar(value="20096444")
+        
+        # Crear la interfaz utilizando la clase MainWindow
+        main_window = MainWindow(self.root, self)
+        main_window.setup_ui()
+        
+        # Aplicar los mensajes de estado encolados por los hilos de trabajo: al
+        # despertar Tk mediante una tubería o, si no es posible, por sondeo
+        if not self._setup_status_pipe():
+            self._drain_status()
+        
+        # Configurar logger GUI y carga de configuración
+        self.setup_gui_logger()
+        self.load_config()
+        
+        # Reemplazar los messagebox estándar con nuestros diálogos personalizados
+        self._replace_standard_messageboxes()
+
+
+
+
+
+
+    def main_gui(self):
+        """
+        Punto de entrada principal con interfaz gráfica
+        
+        Crea la interfaz y ejecuta el bucle principal de eventos.
+        """
+        self.create_gui()
+        if self.root:
+            self.root.mainloop()
+
+
+
+
+
+
+@functools.lru_cache(maxsize=8)
+def _format_instructions(client_info, project_info):
+    """
+    Compone el texto de instrucciones de extracción (cacheado por cliente y proyecto)
+    
+    Args:
+        client_info (str): Cliente en formato "1025541 - Nombre"
+        project_info (str): Proyecto en formato "20096444 - Nombre"
+        
+    Returns:
+        str: Texto para el messagebox de instrucciones
+    """
+    return f"""
+    La aplicación ha navegado automáticamente a la página de SAP con:
+
+    Cliente: {client_info}
+    Proyecto: {project_info}
+
+    Por favor:
+    1. Verifica que has iniciado sesión correctamente
+    2. Comprueba que puedes ver las recomendaciones para el cliente
+    3. Cuando quieras comenzar, haz clic en 'Iniciar Extracción'
+            """
+
+
+class _NullVar:
+    """Sustituto sin efecto de tk.StringVar mientras no hay interfaz gráfica"""
+    
+    __slots__ = ()
+    
+    def get(self):
+        return None
+    
+    def set(self, value):
+        pass
+
+
+# Métodos para ejecución en modo consola
+class _ConstVar:
+    """Valor fijo con la interfaz get() de tk.StringVar, usado en modo consola"""
+    
+    __slots__ = ("_v",)
+    
+    def __init__(self, value):
+        self._v = value
+    
+    def get(self):
+        return self._v
+
+
+def run_console_mode():
+    """
+    Ejecuta la aplicación en modo consola sin interfaz gráfica
+    
+    Returns:
+        bool: True si la extracción fue exitosa, False en caso contrario
+    """
+    extractor = IssuesExtractor()
+    
+    # Solicitar información al usuario
+    print("\n===== SAP Issues Extractor - Modo Consola =====\n")
+    
+    # Cliente
+    erp_number = input("Ingresa el ERP Customer Number (Ej: 1025541): ").strip()
+    extractor.client_var = _ConstVar(erp_number)
+    
+    # Proyecto
+    project_id = input("Ingresa el Case ID o número del proyecto (Ej: 20096444): ").strip()
+    extractor.project_var = _ConstVar(project_id)
+    
+    # Archivo Excel
+    print("\nSeleccione un archivo Excel para guardar los resultados:")
+    extractor.choose_excel_file()
+    
+    # Confirmar y ejecutar
+    print(f"\nConfiguración actual:")
+    print(f"  - Cliente: {erp_number}")
+    print(f"  - Proyecto: {project_id}")
+    print(f"  - Archivo Excel: {extractor._excel_basename}")
+    
+    confirm = input("\n¿Desea iniciar la extracción? (S/N): ").strip().upper()
+    if confirm != 'S':
+        print("Extracción cancelada por el usuario.")
+        return False
+    
+    print("\nIniciando proceso de extracción...\n")
+    result = extractor.run_extraction()
+    
+    if result:
+        print("\n¡Extracción completada con éxito!")
+    else:
+        print("\nLa extracción falló. Revise el log para más detalles.")
+    
     return result
\ No newline at end of file
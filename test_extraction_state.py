@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pruebas del estado de extracción (huellas de issues y firma del Excel destino).
+Se ejecutan con pytest y una base de datos SQLite en memoria.
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from data.database_manager import (
+    DatabaseManager, MEMORY_DB_PATH, SCHEMA_VERSION, file_stamp, issue_fingerprint
+)
+
+ERP = "1025541"
+PROJECT = "20096444"
+
+
+@pytest.fixture
+def db():
+    manager = DatabaseManager(MEMORY_DB_PATH)
+    yield manager
+    manager.close()
+
+
+def _issue(title, status="OPEN", **fields):
+    return {"Title": title, "Status": status, "Type": "Issue", "Priority": "High", **fields}
+
+
+def _touch(path, content, mtime_ns):
+    """Escribe el archivo con una fecha fija, independiente de la resolución del sistema"""
+    with open(path, "wb") as f:
+        f.write(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_file_stamp_follows_file_changes(tmp_path):
+    """
+    La firma se recalcula en cada llamada: refleja la creación y cada cambio del archivo
+    """
+    path = str(tmp_path / "issues.xlsx")
+    assert file_stamp(path) is None
+
+    _touch(path, b"a", 10**18)
+    assert file_stamp(path) == (10**18, 1)
+
+    _touch(path, b"abc", 10**18 + 10**9)
+    assert file_stamp(path) == (10**18 + 10**9, 3)
+
+
+def test_issue_fingerprint_tracks_only_followed_fields():
+    base = _issue("Login falla")
+    assert issue_fingerprint(base) == issue_fingerprint(dict(base))
+    # El título es la clave del issue, no forma parte de la huella
+    assert issue_fingerprint(base) == issue_fingerprint({**base, "Title": "Otro"})
+    assert issue_fingerprint(base) != issue_fingerprint({**base, "Status": "DONE"})
+    assert issue_fingerprint(base) != issue_fingerprint({**base, "Due Date": "2026-01-01"})
+
+
+def test_schema_creates_state_tables(db):
+    tables = {row[0] for row in db._execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {"extracted_issues", "extraction_targets"} <= tables
+    assert db._execute("PRAGMA user_version")[0][0] == SCHEMA_VERSION
+
+
+def test_schema_migrates_version_3_database(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE clients (erp_number TEXT PRIMARY KEY, name TEXT NOT NULL,
+                              business_partner TEXT, last_used INTEGER);
+        INSERT INTO clients VALUES ('1025541', 'Cliente', '', 0);
+        PRAGMA user_version = 3;
+    """)
+    conn.close()
+
+    manager = DatabaseManager(path)
+    try:
+        assert manager._execute("PRAGMA user_version")[0][0] == SCHEMA_VERSION
+        assert manager.get_extraction_stamp("/tmp/x.xlsx") is None
+        assert manager.get_client_labels() == ("1025541 - Cliente",)
+    finally:
+        manager.close()
+
+
+def test_save_extracted_issues_records_fingerprints_and_stamp(db):
+    target = "/tmp/issues.xlsx"
+    assert db.save_extracted_issues(target, ERP, PROJECT, {"A": "h1", "B": "h2"}, (5, 100))
+    assert db.get_extracted_fingerprints(target, ERP, PROJECT) == {"A": "h1", "B": "h2"}
+    assert db.get_extraction_stamp(target) == (5, 100)
+
+    # Otra escritura actualiza las huellas y la firma sin borrar el resto
+    assert db.save_extracted_issues(target, ERP, "1", {"A": "h3"}, (6, 120))
+    assert db.get_extracted_fingerprints(target, ERP, PROJECT) == {"A": "h1", "B": "h2"}
+    assert db.get_extracted_fingerprints(target, ERP, "1") == {"A": "h3"}
+    assert db.get_extraction_stamp(target) == (6, 120)
+
+
+def test_save_extracted_issues_reset_discards_previous_state(db):
+    target = "/tmp/issues.xlsx"
+    db.save_extracted_issues(target, ERP, PROJECT, {"A": "h1"}, (5, 100))
+    db.save_extracted_issues("/tmp/otro.xlsx", ERP, PROJECT, {"A": "h1"}, (5, 100))
+
+    db.save_extracted_issues(target, ERP, "1", {"B": "h2"}, (7, 80), reset=True)
+    assert db.get_extracted_fingerprints(target, ERP, PROJECT) == {}
+    assert db.get_extracted_fingerprints(target, ERP, "1") == {"B": "h2"}
+    # El estado de otros archivos no se toca
+    assert db.get_extracted_fingerprints("/tmp/otro.xlsx", ERP, PROJECT) == {"A": "h1"}
+
+
+def test_clear_extraction_state(db):
+    target = "/tmp/issues.xlsx"
+    db.save_extracted_issues(target, ERP, PROJECT, {"A": "h1"}, (5, 100))
+    assert db.clear_extraction_state(target)
+    assert db.get_extraction_stamp(target) is None
+    assert db.get_extracted_fingerprints(target, ERP, PROJECT) == {}
+
+
+class _FakeExcel:
+    """Sustituto de ExcelManager que añade una línea al archivo por cada issue escrito"""
+
+    def __init__(self, path):
+        self.path = path
+        self.written = []
+
+    def update_with_issues(self, issues):
+        self.written.append([issue["Title"] for issue in issues])
+        with open(self.path, "a", encoding="utf-8") as f:
+            for issue in issues:
+                f.write(issue["Title"] + "\n")
+        return True, len(issues), 0
+
+
+@pytest.fixture
+def extractor(db, tmp_path):
+    # El extractor importa selenium al cargarse el módulo
+    pytest.importorskip("selenium")
+    from extractor.issues_extractor import IssuesExtractor
+
+    instance = IssuesExtractor.__new__(IssuesExtractor)
+    instance.db_manager = db
+    instance.excel_file_path = str(tmp_path / "issues.xlsx")
+    instance.excel_manager = _FakeExcel(instance.excel_file_path)
+    return instance
+
+
+def test_write_issues_skips_unchanged_issues(extractor):
+    issues = [_issue("A"), _issue("B")]
+    assert extractor._write_issues(issues, ERP, PROJECT) == (True, 2, 0)
+    assert extractor._write_issues(issues, ERP, PROJECT) == (True, 0, 0)
+
+    changed = [_issue("A", status="DONE"), _issue("B")]
+    extractor._write_issues(changed, ERP, PROJECT)
+    assert extractor.excel_manager.written == [["A", "B"], ["A"]]
+
+
+def test_write_issues_rewrites_after_external_change(extractor):
+    issues = [_issue("A"), _issue("B")]
+    extractor._write_issues(issues, ERP, PROJECT)
+    assert extractor._extraction_state_valid(extractor.excel_file_path)
+
+    # Libro reemplazado fuera de la aplicación: otra firma, el estado deja de valer
+    stamp = file_stamp(extractor.excel_file_path)
+    _touch(extractor.excel_file_path, b"x", stamp[0] + 10**9)
+    assert not extractor._extraction_state_valid(extractor.excel_file_path)
+
+    extractor._write_issues(issues, ERP, PROJECT)
+    assert extractor.excel_manager.written == [["A", "B"], ["A", "B"]]
+    assert extractor._extraction_state_valid(extractor.excel_file_path)
+
+
+def test_record_written_reset_only_when_state_invalid(extractor, db):
+    target = extractor.excel_file_path
+    _touch(target, b"x", 10**18)
+
+    extractor._record_written(target, ERP, PROJECT, {"A": "h1"}, reset=True)
+    extractor._record_written(target, ERP, "1", {"B": "h2"}, reset=False)
+    assert db.get_extracted_fingerprints(target, ERP, PROJECT) == {"A": "h1"}
+    assert db.get_extraction_stamp(target) == file_stamp(target)
+
+    extractor._record_written(target, ERP, "1", {"C": "h3"}, reset=True)
+    assert db.get_extracted_fingerprints(target, ERP, PROJECT) == {}
+    assert db.get_extracted_fingerprints(target, ERP, "1") == {"C": "h3"}
+
+
+def test_record_written_without_file_keeps_no_state(extractor, db):
+    extractor._record_written(extractor.excel_file_path, ERP, PROJECT, {"A": "h1"}, reset=True)
+    assert db.get_extraction_stamp(extractor.excel_file_path) is None
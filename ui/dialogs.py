@@ -13,11 +13,7 @@ from tkinter import ttk, messagebox
 from datetime import datetime
 import webbrowser
 
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from ui.images import ensure_pil, load_image
 
 # Importaciones de otros módulos del proyecto
 from config.settings import SAP_COLORS, load_json_config, save_json_config, CONFIG_FILE
@@ -84,13 +80,11 @@ class AboutDialog(BaseDialog):
         
         # Logo SAP (si está disponible)
         self.logo = None
-        if PIL_AVAILABLE:
+        if ensure_pil():
             try:
                 logo_path = os.path.join(os.path.dirname(__file__), "..", "assets", "sap_logo.png")
                 if os.path.exists(logo_path):
-                    logo_image = Image.open(logo_path)
-                    logo_image = logo_image.resize((100, 100), Image.LANCZOS)
-                    self.logo = ImageTk.PhotoImage(logo_image)
+                    self.logo = load_image(logo_path, (100, 100))
                     
                     logo_label = tk.Label(main_frame, image=self.logo)
                     logo_label.pack(pady=10)
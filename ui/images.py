@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+images.py - Carga de imágenes para la interfaz gráfica
+---
+Funciones compartidas por la ventana principal y los diálogos para cargar
+imágenes con PIL, que se importa de forma diferida.
+"""
+
+import functools
+
+# PIL se importa de forma diferida (solo al construir widgets con imágenes)
+# para no cargarlo al importar el módulo
+Image = None
+ImageTk = None
+PIL_AVAILABLE = None
+
+
+def ensure_pil():
+    """
+    Importa PIL la primera vez que se necesita
+    
+    Returns:
+        bool: True si PIL está disponible
+    """
+    global Image, ImageTk, PIL_AVAILABLE
+    if PIL_AVAILABLE is None:
+        try:
+            from PIL import Image, ImageTk
+            PIL_AVAILABLE = True
+        except ImportError:
+            PIL_AVAILABLE = False
+    return PIL_AVAILABLE
+
+
+@functools.lru_cache(maxsize=64)
+def load_image(path, size):
+    """
+    Carga y redimensiona una imagen como PhotoImage de Tk
+    
+    Se cachea para no volver a decodificar el archivo cada vez que se construye
+    un widget; la caché mantiene además la referencia a la imagen para que no la
+    recolecte el GC mientras el widget la muestra. Requiere ensure_pil().
+    
+    Args:
+        path (str): Ruta del archivo de imagen
+        size (tuple): Tamaño (ancho, alto) de destino
+        
+    Returns:
+        ImageTk.PhotoImage: Imagen lista para usar en widgets
+    """
+    # Usar Image.LANCZOS si está disponible, sino usar Image.ANTIALIAS
+    resample_method = getattr(Image, 'LANCZOS', None) or Image.ANTIALIAS
+    
+    img = Image.open(path)
+    img = img.resize(size, resample_method)
+    return ImageTk.PhotoImage(img)
@@ -6,16 +6,30 @@ import threading
 import logging
 from datetime import datetime
 
-# Importar PIL solo si está disponible
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from ui.images import ensure_pil, load_image
 
 logger = logging.getLogger(__name__)
 
 
+class DedupVar(tk.StringVar):
+    """
+    StringVar que ignora las asignaciones que no cambian el valor
+    
+    Así se evita disparar las trazas de Tk y volver a maquetar la etiqueta
+    asociada cuando se repite el mismo texto de estado.
+    """
+    
+    def set(self, value):
+        """
+        Establece el valor solo si es distinto del actual
+        
+        Args:
+            value (str): Nuevo valor
+        """
+        if value != self.get():
+            super().set(value)
+
+
 
 def adjust_combobox_dropdown_width(combobox):
     """
@@ -88,8 +102,8 @@ class MainWindow:
         self.collapsed_sections = {"log": False}
         
         # Bindear variables del controlador
-        self.controller.status_var = tk.StringVar(value="Listo para iniciar")
-        self.controller.excel_filename_var = tk.StringVar(value="Archivo: No seleccionado")
+        self.controller.status_var = DedupVar(value="Listo para iniciar")
+        self.controller.excel_filename_var = DedupVar(value="Archivo: No seleccionado")
         self.controller.client_var = tk.StringVar(value="")
         self.controller.project_var = tk.StringVar(value="")
     
@@ -284,21 +298,11 @@ class MainWindow:
         self.header_frame.grid_columnconfigure(2, weight=0)  # Botones (fijo)
         
         # Logo si PIL está disponible
-        if PIL_AVAILABLE:
+        if ensure_pil():
             logo_path = os.path.join("assets", "logo.png")
             if os.path.exists(logo_path):
                 try:
-                    # Usar Image.LANCZOS si está disponible, sino usar Image.ANTIALIAS
-                    resample_method = getattr(Image, 'LANCZOS', Image.ANTIALIAS)
-                    
-                    logo_img = Image.open(logo_path)
-                    logo_img = logo_img.resize((32, 32), resample_method)
-                    logo_tk = ImageTk.PhotoImage(logo_img)
-                    
-                    # Guardar referencia a la imagen para evitar que la recolecte el GC
-                    if not hasattr(self.controller, 'image_cache'):
-                        self.controller.image_cache = {}
-                    self.controller.image_cache["logo"] = logo_tk
+                    logo_tk = load_image(logo_path, (32, 32))
                     
                     logo_label = ttk.Label(self.header_frame, image=logo_tk)
                     logo_label.grid(row=0, column=0, padx=(0, 10))
@@ -397,7 +401,7 @@ class MainWindow:
             add_client_btn.grid(row=0, column=1, padx=(5, 0), pady=2)
 
             # Obtener y configurar lista de clientes
-            clients = self.controller.db_manager.get_clients()
+            clients = self.controller.db_manager.get_client_labels()
             self.client_combo['values'] = clients
 
             # Ajuste automático ancho
@@ -0,0 +1,68 @@
+"""
+Importación diferida de módulos pesados u opcionales (tkinter, pandas...).
+"""
+
+import sys
+import importlib.util
+from importlib.machinery import PathFinder
+
+
+def _find_spec(name):
+    """
+    Localiza la especificación de un módulo sin ejecutar sus paquetes padre
+
+    importlib.util.find_spec importa el paquete padre de un submódulo, lo que
+    anularía la carga diferida de "tkinter" al pedir "tkinter.messagebox".
+
+    Args:
+        name (str): Nombre completo del módulo
+
+    Returns:
+        ModuleSpec: Especificación encontrada o None si no existe
+    """
+    path = None
+    prefix = ""
+    spec = None
+    for part in name.split("."):
+        prefix = f"{prefix}.{part}" if prefix else part
+        spec = PathFinder.find_spec(prefix, path)
+        if spec is None:
+            # Módulos integrados o congelados: búsqueda estándar
+            return importlib.util.find_spec(name)
+        path = spec.submodule_search_locations
+    return spec
+
+
+def lazy_import(name):
+    """
+    Importa un módulo de forma diferida con importlib.util.LazyLoader
+
+    El módulo queda registrado en sys.modules, pero su código solo se ejecuta
+    en el primer acceso a uno de sus atributos. Así el arranque (en especial el
+    modo consola) no paga el coste de importar pandas o tkinter hasta que se usan.
+
+    Args:
+        name (str): Nombre del módulo a importar (admite submódulos: "tkinter.ttk")
+
+    Returns:
+        module: Módulo (posiblemente aún sin cargar) o None si no está instalado
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    parent, _, child = name.rpartition(".")
+    parent_module = lazy_import(parent) if parent else None
+    if parent and parent_module is None:
+        return None
+    spec = _find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    if parent_module is not None:
+        # Igual que el import normal (import tkinter.ttk); asignar el atributo
+        # no fuerza la carga del paquete padre
+        setattr(parent_module, child, module)
+    return module